@@ -0,0 +1,64 @@
+import hashlib
+import json
+import os
+from mmap import mmap
+from typing import Dict, List, Union
+
+
+class BuildCache:
+    # bump whenever the parser output or the table format changes
+    parser_version: str = "3"
+    filename: str = "BuildCache.json"
+
+    @staticmethod
+    def get_key(code: Union[str, bytes, mmap], options: str = '') -> str:
+        digest = hashlib.sha256((BuildCache.parser_version + ' ' + options + '\n').encode())
+        digest.update(code.encode() if isinstance(code, str) else code)
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_file_digest(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_file_entry(path: str) -> Dict:
+        stat: os.stat_result = os.stat(path)
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'digest': BuildCache.get_file_digest(path)}
+
+    @staticmethod
+    def is_file_unchanged(path: str, file_entry: Dict) -> bool:
+        # only a file whose size matches but whose mtime moved has to be hashed again
+        stat: os.stat_result = os.stat(path)
+        if stat.st_size != file_entry['size']:
+            return False
+        return stat.st_mtime_ns == file_entry['mtime_ns'] or BuildCache.get_file_digest(path) == file_entry['digest']
+
+    @staticmethod
+    def is_up_to_date(path: str, key: str, required_files: List[str]) -> bool:
+        try:
+            with open(path + BuildCache.filename) as f:
+                entry: Dict = json.load(f)
+            files: Dict[str, Dict] = entry['files']
+            return entry['key'] == key and all(name in files for name in required_files) and all(
+                BuildCache.is_file_unchanged(path + name, file_entry) for name, file_entry in files.items())
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+
+    @staticmethod
+    def invalidate(path: str) -> None:
+        try:
+            os.remove(path + BuildCache.filename)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def save(path: str, key: str, files: List[str]) -> None:
+        entry: Dict = {'key': key, 'parser_version': BuildCache.parser_version,
+                       'files': {name: BuildCache.get_file_entry(path + name) for name in files}}
+        with open(path + BuildCache.filename + '.tmp', 'w') as f:
+            json.dump(entry, f)
+        os.replace(path + BuildCache.filename + '.tmp', path + BuildCache.filename)
@@ -0,0 +1,95 @@
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class CallGraph:
+
+    def __init__(self, calls_table: Dict, procedures: Iterable[str]) -> None:
+        self.calls_table: Dict = calls_table
+        # callees come before their callers, members of one recursive cycle share a component
+        self.components: List[List[str]] = self.find_strongly_connected_components(procedures)
+
+    def find_strongly_connected_components(self, procedures: Iterable[str]) -> List[List[str]]:
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        components: List[List[str]] = []
+        for root in procedures:
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work: List[Tuple[str, Iterator[str]]] = [(root, iter(self.calls_table.get(root, {})))]
+            while work:
+                procedure, callees = work[-1]
+                for called in callees:
+                    if called not in index:
+                        index[called] = low[called] = len(index)
+                        stack.append(called)
+                        on_stack.add(called)
+                        work.append((called, iter(self.calls_table.get(called, {}))))
+                        break
+                    elif called in on_stack:
+                        low[procedure] = min(low[procedure], index[called])
+                else:
+                    work.pop()
+                    if work:
+                        low[work[-1][0]] = min(low[work[-1][0]], low[procedure])
+                    if low[procedure] == index[procedure]:
+                        component: List[str] = []
+                        member: str = ''
+                        while member != procedure:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                        components.append(component)
+        return components
+
+    def find_reachable(self) -> Dict[str, FrozenSet[str]]:
+        # callee components are complete before their callers, members of a recursive cycle reach the whole cycle
+        reachable: Dict[str, FrozenSet[str]] = {}
+        for component in self.components:
+            found: Set[str] = set(component) if len(component) > 1 else set()
+            for procedure in component:
+                for called in self.calls_table.get(procedure, {}):
+                    found.add(called)
+                    found.update(reachable.get(called, ()))
+            for procedure in component:
+                reachable[procedure] = frozenset(found)
+        return reachable
+
+    def find_callers(self, procedures: Iterable[str]) -> Set[str]:
+        callers: Dict[str, Set[str]] = {}
+        for procedure, callees in self.calls_table.items():
+            for called in callees:
+                callers.setdefault(called, set()).add(procedure)
+        found: Set[str] = set(procedures)
+        stack: List[str] = list(found)
+        while stack:
+            for caller in callers.get(stack.pop(), ()):
+                if caller not in found:
+                    found.add(caller)
+                    stack.append(caller)
+        return found
+
+    def summarize(self, local_effects: Dict[str, Dict[str, int]], affected: Optional[Set[str]] = None,
+                  previous: Optional[Dict[str, Dict[str, int]]] = None) -> Dict[str, Dict[str, int]]:
+        # components outside the affected procedures keep their previous summaries
+        summaries: Dict[str, Dict[str, int]] = {}
+        for component in self.components:
+            if affected is not None and affected.isdisjoint(component) \
+                    and all(procedure in previous for procedure in component):
+                for procedure in component:
+                    summaries[procedure] = previous[procedure]
+                continue
+            summary: Dict[str, int] = {}
+            for procedure in component:
+                summary.update(local_effects.get(procedure, {}))
+            for procedure in component:
+                for called in self.calls_table.get(procedure, {}):
+                    if called in summaries:
+                        summary.update(summaries[called])
+            for procedure in component:
+                summaries[procedure] = summary
+        return summaries
@@ -1,38 +1,70 @@
-from typing import List, Union, Dict
+from typing import FrozenSet, List, Optional, Set, Tuple, Union, Dict
+
+from aitsi_parser.CallGraph import CallGraph
+from aitsi_parser.CsrRelation import CsrRelation
+from aitsi_parser.SymbolTable import SymbolTable
 
 
 class CallsTable:
 
-    def __init__(self, table: Union[Dict, List]) -> None:
-        self.table: Union[Dict, List] = table
+    def __init__(self, table: Union[Dict, CsrRelation], symbols: Optional[SymbolTable] = None) -> None:
+        if isinstance(table, CsrRelation):
+            self.relation: CsrRelation = table
+        else:
+            symbols = symbols if symbols is not None else SymbolTable()
+            self.relation: CsrRelation = CsrRelation.from_table(table, symbols.add, symbols.add, symbols)
+        # Calls* closure, built the first time a Calls* query needs it
+        self.called_from_t: Optional[Dict[str, FrozenSet[str]]] = None
+        self.calls_t: Optional[Dict[str, FrozenSet[str]]] = None
 
     def get_all_columns(self) -> List[str]:
-        return sum([list(self.table[key].keys()) for key in self.table], [])
+        return self.relation.get_names(self.relation.get_target_list())
 
     def get_all_index(self) -> List[str]:
-        return list(self.table.keys())
+        return self.relation.get_names(self.relation.get_all_sources())
 
     def get_calls(self, procedure: str) -> List[str]:
         try:
-            return [element for element in self.table if procedure in self.table[element].keys()]
+            return self.relation.get_name_sources(self.relation.get_id(procedure))
         except Exception:
             return []
 
     def get_called_from(self, procedure: str) -> List[str]:
         try:
-            return list(self.table[procedure].keys())
+            return self.relation.get_name_targets(self.relation.get_id(procedure))
         except Exception:
             return []
 
     def is_calls(self, call_procedure: str, receiving_procedure: str) -> bool:
         try:
-            return bool(self.table[call_procedure][receiving_procedure])
+            return self.relation.contains(self.relation.get_id(call_procedure),
+                                          self.relation.get_id(receiving_procedure))
         except Exception:
             return False
 
+    def get_called_from_t(self, procedure: str) -> FrozenSet[str]:
+        return self.get_closure()[0].get(procedure, frozenset())
+
+    def get_calls_t(self, procedure: str) -> FrozenSet[str]:
+        return self.get_closure()[1].get(procedure, frozenset())
+
+    def is_calls_t(self, call_procedure: str, receiving_procedure: str) -> bool:
+        return receiving_procedure in self.get_called_from_t(call_procedure)
+
+    def get_closure(self) -> Tuple[Dict[str, FrozenSet[str]], Dict[str, FrozenSet[str]]]:
+        if self.called_from_t is None:
+            calls: Dict[str, Dict[str, int]] = self.relation.to_table(self.relation.get_name, self.relation.get_name)
+            self.called_from_t = CallGraph(calls, self.get_all_index()).find_reachable()
+            callers: Dict[str, Set[str]] = {}
+            for procedure, called_procedures in self.called_from_t.items():
+                for called in called_procedures:
+                    callers.setdefault(called, set()).add(procedure)
+            self.calls_t = {procedure: frozenset(procedures) for procedure, procedures in callers.items()}
+        return self.called_from_t, self.calls_t
+
     def to_string(self) -> None:
         print("CallsTable:")
-        print(self.table)
+        print(self.relation.get_pairs())
 
     def to_log(self) -> str:
-        return "CallsTable: \n" + str(self.table)
+        return "CallsTable: \n" + str(self.relation.get_pairs())
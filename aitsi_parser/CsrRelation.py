@@ -0,0 +1,123 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from aitsi_parser.SymbolTable import SymbolTable
+
+
+class CsrRelation:
+    # forward and reverse adjacency in compressed sparse row form: the targets of id i are
+    # targets[offsets[i]:offsets[i + 1]], ids are line numbers or symbol ids
+    parts: List[str] = ['forward_offsets', 'forward_targets', 'reverse_offsets', 'reverse_targets']
+
+    def __init__(self, forward_offsets: np.ndarray, forward_targets: np.ndarray, reverse_offsets: np.ndarray,
+                 reverse_targets: np.ndarray, symbols: Optional[SymbolTable] = None) -> None:
+        self.forward_offsets: np.ndarray = forward_offsets
+        self.forward_targets: np.ndarray = forward_targets
+        self.reverse_offsets: np.ndarray = reverse_offsets
+        self.reverse_targets: np.ndarray = reverse_targets
+        # symbol ids are translated with the catalog of the PKB they were saved with
+        self.symbols: Optional[SymbolTable] = symbols
+
+    @staticmethod
+    def from_pairs(pairs: Iterable[Tuple[int, int]], symbols: Optional[SymbolTable] = None) -> 'CsrRelation':
+        edges: np.ndarray = np.array(list(pairs), dtype='<i4').reshape(-1, 2)
+        forward_offsets, forward_targets = CsrRelation.compress(edges[:, 0], edges[:, 1])
+        reverse_offsets, reverse_targets = CsrRelation.compress(edges[:, 1], edges[:, 0])
+        return CsrRelation(forward_offsets, forward_targets, reverse_offsets, reverse_targets, symbols)
+
+    @staticmethod
+    def from_table(table: Dict[str, Dict[str, int]], encode_key: Callable[[str], int] = int,
+                   encode_target: Callable[[str], int] = int,
+                   symbols: Optional[SymbolTable] = None) -> 'CsrRelation':
+        return CsrRelation.from_pairs(((encode_key(key), encode_target(target))
+                                       for key in table for target in table[key]), symbols)
+
+    @staticmethod
+    def compress(sources: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        size: int = int(sources.max()) + 1 if len(sources) else 0
+        offsets: np.ndarray = np.zeros(size + 1, dtype='<i4')
+        np.cumsum(np.bincount(sources, minlength=size), out=offsets[1:])
+        return offsets, targets[np.lexsort((targets, sources))]
+
+    @staticmethod
+    def from_sections(sections: Dict[str, np.ndarray], name: str,
+                      symbols: Optional[SymbolTable] = None) -> 'CsrRelation':
+        return CsrRelation(*(sections[name + '.' + part] for part in CsrRelation.parts), symbols)
+
+    def get_sections(self, name: str) -> Dict[str, np.ndarray]:
+        return {name + '.' + part: getattr(self, part) for part in self.parts}
+
+    def get_id(self, name: str) -> int:
+        return self.symbols.get_id(name)
+
+    def get_name(self, symbol: int) -> str:
+        return self.symbols.names[symbol]
+
+    def get_names(self, symbols: Iterable[int]) -> List[str]:
+        return self.symbols.get_names(symbols)
+
+    def get_targets(self, source: int) -> List[int]:
+        if 0 <= source < len(self.forward_offsets) - 1:
+            return self.forward_targets[self.forward_offsets[source]:self.forward_offsets[source + 1]].tolist()
+        return []
+
+    def get_sources(self, target: int) -> List[int]:
+        if 0 <= target < len(self.reverse_offsets) - 1:
+            return self.reverse_targets[self.reverse_offsets[target]:self.reverse_offsets[target + 1]].tolist()
+        return []
+
+    def contains(self, source: int, target: int) -> bool:
+        return target in self.get_targets(source)
+
+    def get_all_sources(self) -> List[int]:
+        return np.flatnonzero(np.diff(self.forward_offsets)).tolist()
+
+    def get_all_targets(self) -> List[int]:
+        return np.flatnonzero(np.diff(self.reverse_offsets)).tolist()
+
+    def get_target_list(self) -> List[int]:
+        # targets of every row in row order, a target reached from several rows is repeated
+        return self.forward_targets.tolist()
+
+    def get_targets_of(self, sources: Iterable[int]) -> List[int]:
+        return list({target for source in sources for target in self.get_targets(source)})
+
+    def get_sources_of(self, targets: Iterable[int]) -> List[int]:
+        return list({source for target in targets for source in self.get_sources(target)})
+
+    def get_reachable(self, starts: Iterable[int], reverse: bool = False) -> np.ndarray:
+        # ids reached in one or more steps from any of the starts, found by one frontier expansion for all of them
+        offsets, targets = (self.reverse_offsets, self.reverse_targets) if reverse \
+            else (self.forward_offsets, self.forward_targets)
+        reached: np.ndarray = np.zeros(max(len(self.forward_offsets), len(self.reverse_offsets)), dtype=bool)
+        frontier: np.ndarray = np.fromiter(starts, dtype=np.int64)
+        while len(frontier):
+            frontier = frontier[(frontier >= 0) & (frontier < len(offsets) - 1)]
+            begins: np.ndarray = offsets[frontier].astype(np.int64)
+            counts: np.ndarray = offsets[frontier + 1] - begins
+            total: int = int(counts.sum())
+            if not total:
+                break
+            # positions of the targets of every frontier row, gathered without a loop over the rows
+            positions: np.ndarray = np.repeat(begins - np.cumsum(counts) + counts, counts) + np.arange(total)
+            found: np.ndarray = targets[positions]
+            found = found[~reached[found]]
+            reached[found] = True
+            frontier = np.unique(found).astype(np.int64)
+        return np.flatnonzero(reached)
+
+    def get_pairs(self) -> List[Tuple[int, int]]:
+        sources: np.ndarray = np.repeat(np.arange(len(self.forward_offsets) - 1), np.diff(self.forward_offsets))
+        return list(zip(sources.tolist(), self.forward_targets.tolist()))
+
+    def to_table(self, decode_key: Callable[[int], str],
+                 decode_target: Callable[[int], str]) -> Dict[str, Dict[str, int]]:
+        return {decode_key(source): dict.fromkeys(map(decode_target, self.get_targets(source)), 1)
+                for source in self.get_all_sources()}
+
+    def get_name_targets(self, source: int) -> List[str]:
+        return self.symbols.get_names(self.get_targets(source))
+
+    def get_name_sources(self, target: int) -> List[str]:
+        return self.symbols.get_names(self.get_sources(target))
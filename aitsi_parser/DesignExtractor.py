@@ -0,0 +1,127 @@
+from typing import Dict, List, Set, Tuple
+
+from aitsi_parser.CallGraph import CallGraph
+from pql.Node import Node
+
+
+class DesignExtractor:
+
+    def __init__(self, root: Node, calls_table: Dict) -> None:
+        self.root: Node = root
+        self.calls_table: Dict = calls_table
+        self.follows_table: Dict = {}
+        self.parent_table: Dict = {}
+        self.next_table: Dict = {}
+        self.mod_table: Dict = {}
+        self.uses_table: Dict = {}
+        self.callees: Dict[int, Set[str]] = {}  # line -> procedures called inside the statement
+        self.endings: Dict[int, List[int]] = {}  # IF line -> last executed lines of both branches
+        self.local_mod: Dict[str, Dict[str, int]] = {}  # procedure -> variables modified without calls
+        self.local_uses: Dict[str, Dict[str, int]] = {}
+
+    def extract(self) -> None:
+        for proc_node in self.root.children:
+            self.extract_procedure(proc_node)
+        self.propagate_calls()
+
+    def merge(self, other: 'DesignExtractor') -> None:
+        self.follows_table.update(other.follows_table)
+        self.parent_table.update(other.parent_table)
+        self.next_table.update(other.next_table)
+        self.mod_table.update(other.mod_table)
+        self.uses_table.update(other.uses_table)
+        self.callees.update(other.callees)
+        self.endings.update(other.endings)
+        self.local_mod.update(other.local_mod)
+        self.local_uses.update(other.local_uses)
+
+    def extract_procedure(self, proc_node: Node) -> None:
+        stack: List[Tuple[Node, bool]] = [(proc_node.children[0], False)]
+        while stack:
+            node, visited = stack.pop()
+            if node.node_type == 'ASSIGN':
+                self.extract_assignment(node)
+            elif node.node_type == 'CALL':
+                self.callees[node.line] = {node.value}
+            elif visited:
+                if node.node_type == 'STMT_LIST':
+                    self.extract_statement_list(node)
+                elif node.node_type == 'WHILE':
+                    self.extract_container(node, node.children[1:2])
+                    for line in self.get_exits(node.children[1].children[-1]):
+                        self.add_next(node.line, line)
+                else:
+                    self.extract_container(node, node.children[1:3])
+                    self.endings[node.line] = self.get_exits(node.children[1].children[-1]) + self.get_exits(
+                        node.children[2].children[-1])
+            else:
+                stack.append((node, True))
+                children: List[Node] = node.children if node.node_type == 'STMT_LIST' else node.children[1:]
+                stack.extend((child, False) for child in reversed(children))
+        proc_mod: Dict[str, int] = {}
+        proc_uses: Dict[str, int] = {}
+        for child in proc_node.children[0].children:
+            proc_mod.update(self.mod_table.get(str(child.line), {}))
+            proc_uses.update(self.uses_table.get(str(child.line), {}))
+        self.local_mod[proc_node.value] = proc_mod
+        self.local_uses[proc_node.value] = proc_uses
+
+    def extract_assignment(self, assign_node: Node) -> None:
+        self.mod_table[str(assign_node.line)] = {assign_node.children[0].value: 1}
+        used_vars: Dict[str, int] = {}
+        expression: List[Node] = [assign_node.children[1]]
+        while expression:
+            node: Node = expression.pop()
+            if node.node_type == 'NAME':
+                used_vars[node.value] = 1
+            expression.extend(reversed(node.children))
+        if used_vars:
+            self.uses_table[str(assign_node.line)] = used_vars
+
+    def extract_statement_list(self, stmt_list_node: Node) -> None:
+        prev_node: Node = None
+        for stmt_node in stmt_list_node.children:
+            if prev_node is not None:
+                for line in self.get_exits(prev_node):
+                    self.add_next(stmt_node.line, line)
+                self.follows_table[prev_node.line] = {stmt_node.line: 1}
+            prev_node = stmt_node
+
+    def extract_container(self, container_node: Node, stmt_lists: List[Node]) -> None:
+        line: int = container_node.line
+        self.parent_table[line] = {}
+        modified_vars: Dict[str, int] = {}
+        used_vars: Dict[str, int] = {container_node.children[0].value: 1}
+        callees: Set[str] = set()
+        for stmt_list_node in stmt_lists:
+            self.add_next(stmt_list_node.children[0].line, line)
+            for child in stmt_list_node.children:
+                self.parent_table[line][child.line] = 1
+                modified_vars.update(self.mod_table.get(str(child.line), {}))
+                used_vars.update(self.uses_table.get(str(child.line), {}))
+                callees.update(self.callees.get(child.line, ()))
+        self.mod_table[str(line)] = modified_vars
+        self.uses_table[str(line)] = used_vars
+        if callees:
+            self.callees[line] = callees
+
+    def get_exits(self, stmt_node: Node) -> List[int]:
+        return self.endings.get(stmt_node.line, [stmt_node.line])
+
+    def add_next(self, next_line: int, previous_line: int) -> None:
+        if not self.next_table.get(next_line, None):
+            self.next_table[next_line] = {previous_line: 1}
+        else:
+            self.next_table[next_line][previous_line] = 1
+
+    def propagate_calls(self) -> None:
+        call_graph: CallGraph = CallGraph(self.calls_table, self.local_mod.keys())
+        for summaries, table in ((call_graph.summarize(self.local_mod), self.mod_table),
+                                 (call_graph.summarize(self.local_uses), self.uses_table)):
+            for procedure in self.local_mod:
+                if summaries[procedure]:
+                    table[procedure] = dict(summaries[procedure])
+            for line, procedures in self.callees.items():
+                for procedure in procedures:
+                    if summaries.get(procedure, None):
+                        table.setdefault(str(line), {}).update(summaries[procedure])
@@ -1,37 +1,115 @@
-from typing import List, Union, Dict
+from typing import AbstractSet, FrozenSet, Iterable, List, Optional, Tuple, Union, Dict
+
+from aitsi_parser.CsrRelation import CsrRelation
 
 
 class FollowsTable:
-    def __init__(self, table: Union[Dict, List]) -> None:
-        self.table: Union[Dict, List] = table
+    def __init__(self, table: Union[Dict, CsrRelation]) -> None:
+        self.relation: CsrRelation = table if isinstance(table, CsrRelation) else CsrRelation.from_table(table)
+        # nothing is copied out of the relation up front, a memory-mapped or SQLite PKB stays where it is and
+        # only the statements a query touches are cached here, a statement has at most one follower and one
+        # predecessor
+        self.children: Dict[int, Optional[int]] = {}
+        self.follows: Dict[int, Optional[int]] = {}
+        self.all_index: Optional[FrozenSet[int]] = None
+        self.all_columns: Optional[FrozenSet[int]] = None
+        # statement lists in line order with the list and the position of each statement in it, so Follows* is a
+        # comparison of positions and the lines after or before a statement are a slice, a list is read the
+        # first time one of its statements is asked about
+        self.stmt_lists: List[List[int]] = []
+        self.positions: Dict[int, Tuple[int, int]] = {}
 
-    def get_all_columns(self) -> List[int]:
-        return list(map(int, set(sum([list(self.table[key].keys()) for key in self.table], []))))
+    def get_all_columns(self) -> FrozenSet[int]:
+        if self.all_columns is None:
+            self.all_columns = frozenset(self.relation.get_all_targets())
+        return self.all_columns
 
-    def get_all_index(self) -> List[int]:
-        return list(map(int, self.table.keys()))
+    def get_all_index(self) -> FrozenSet[int]:
+        if self.all_index is None:
+            self.all_index = frozenset(self.relation.get_all_sources())
+        return self.all_index
 
     def get_follows(self, stmt: int) -> Union[int, None]:
-        try:
-            return int([element for element in self.table if str(stmt) in self.table[element].keys()][0])
-        except Exception:
-            return None
+        if stmt not in self.follows:
+            sources: List[int] = self.relation.get_sources(stmt)
+            self.follows[stmt] = sources[0] if sources else None
+        return self.follows[stmt]
 
     def get_child(self, stmt: int) -> Union[int, None]:
-        try:
-            return int(list(self.table[str(stmt)].keys())[0])
-        except Exception:
-            return None
+        if stmt not in self.children:
+            targets: List[int] = self.relation.get_targets(stmt)
+            self.children[stmt] = targets[0] if targets else None
+        return self.children[stmt]
+
+    def get_follows_of(self, stmts: Iterable[int]) -> List[int]:
+        return self.relation.get_sources_of(stmts)
+
+    def get_children_of(self, stmts: Iterable[int]) -> List[int]:
+        return self.relation.get_targets_of(stmts)
 
     def is_follows(self, follows_stmt: int, child_stmt: int) -> bool:
-        try:
-            return bool(self.table[str(follows_stmt)][str(child_stmt)])
-        except Exception:
-            return False
+        return self.get_child(follows_stmt) == child_stmt
+
+    def get_position(self, stmt: int) -> Optional[Tuple[int, int]]:
+        if stmt not in self.positions:
+            first: Optional[int] = self.get_follows(stmt)
+            if first is None and self.get_child(stmt) is None:
+                return None
+            first = stmt
+            while self.get_follows(first) is not None:
+                first = self.get_follows(first)
+            stmt_list: List[int] = [first]
+            while self.get_child(stmt_list[-1]) is not None:
+                stmt_list.append(self.get_child(stmt_list[-1]))
+            for position, line in enumerate(stmt_list):
+                self.positions[line] = (len(self.stmt_lists), position)
+            self.stmt_lists.append(stmt_list)
+        return self.positions[stmt]
+
+    def is_follows_t(self, follows_stmt: int, child_stmt: int) -> bool:
+        follows_position: Optional[Tuple[int, int]] = self.get_position(follows_stmt)
+        child_position: Optional[Tuple[int, int]] = self.get_position(child_stmt)
+        return follows_position is not None and child_position is not None \
+            and follows_position[0] == child_position[0] and follows_position[1] < child_position[1]
+
+    def get_all_after(self, stmt: int) -> List[int]:
+        position: Optional[Tuple[int, int]] = self.get_position(stmt)
+        if position is None:
+            return []
+        return self.stmt_lists[position[0]][position[1] + 1:]
+
+    def get_all_before(self, stmt: int) -> List[int]:
+        position: Optional[Tuple[int, int]] = self.get_position(stmt)
+        if position is None:
+            return []
+        return self.stmt_lists[position[0]][:position[1]]
+
+    def get_follows_t_pairs(self, firsts: Optional[AbstractSet[int]],
+                            seconds: Optional[AbstractSet[int]]) -> Tuple[List[int], List[int]]:
+        # the firsts with a second after them and the seconds with a first before them, in one pass over
+        # each statement list holding a candidate, None stands for any statement
+        given: List[AbstractSet[int]] = [stmts for stmts in (firsts, seconds) if stmts is not None]
+        candidates: AbstractSet[int] = min(given, key=len) if given else self.get_all_index() - self.get_all_columns()
+        positions: List[Optional[Tuple[int, int]]] = [self.get_position(stmt) for stmt in candidates]
+        result_first: List[int] = []
+        result_second: List[int] = []
+        for stmt_list in (self.stmt_lists[index] for index in sorted({position[0] for position in positions
+                                                                      if position is not None})):
+            first_seen: bool = False
+            for stmt in stmt_list:
+                if first_seen and (seconds is None or stmt in seconds):
+                    result_second.append(stmt)
+                first_seen = first_seen or firsts is None or stmt in firsts
+            second_seen: bool = False
+            for stmt in reversed(stmt_list):
+                if second_seen and (firsts is None or stmt in firsts):
+                    result_first.append(stmt)
+                second_seen = second_seen or seconds is None or stmt in seconds
+        return result_first, result_second
 
     def to_string(self) -> None:
         print("followsTable:")
-        print(self.table)
+        print(self.relation.get_pairs())
 
     def to_log(self) -> str:
-        return "FollowsTable: \n" + str(self.table)
+        return "FollowsTable: \n" + str(self.relation.get_pairs())
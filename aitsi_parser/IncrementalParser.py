@@ -0,0 +1,170 @@
+import hashlib
+from io import IOBase
+from typing import Dict, Iterator, List, Optional, Set
+
+from aitsi_parser.CallGraph import CallGraph
+from aitsi_parser.DesignExtractor import DesignExtractor
+from aitsi_parser.ParallelParser import Chunk, ParallelParser
+from aitsi_parser.ProcedureUnit import ProcedureUnit
+from aitsi_parser.Tokenizer import Source
+
+
+class IncrementalParser(ParallelParser):
+
+    def __init__(self, code: Source, filename: str, workers: Optional[int] = 1) -> None:
+        super().__init__(code, filename, workers)
+        self.units: List[ProcedureUnit] = []
+        self.digests: List[str] = []
+        self.mod_summaries: Dict[str, Dict[str, int]] = {}
+        self.uses_summaries: Dict[str, Dict[str, int]] = {}
+
+    def program(self) -> None:
+        self.update(self.code)
+
+    def update(self, code: Source) -> None:
+        chunks: List[Chunk] = self.split_procedures(code)
+        # a stream has been read into self.code, the procedures run from the end of any blank lead-in to the end
+        source: Chunk = self.code if isinstance(code, IOBase) else code
+        source_line: int = 1 + self.count_lines(source, 0, len(source) - sum(map(len, chunks)))
+        digests: List[str] = [hashlib.sha1(chunk.encode() if isinstance(chunk, str) else chunk).hexdigest()
+                              for chunk in chunks]
+        cached: Dict[str, List[ProcedureUnit]] = {}
+        for digest, unit in zip(self.digests, self.units):
+            cached.setdefault(digest, []).append(unit)
+        plan: List[Optional[ProcedureUnit]] = []
+        offsets: List[int] = []
+        fresh_chunks: List[Chunk] = []
+        fresh_offsets: List[int] = []
+        fresh_source_lines: List[int] = []
+        line: int = 0
+        for chunk, digest in zip(chunks, digests):
+            unit: Optional[ProcedureUnit] = cached[digest].pop(0) if cached.get(digest) else None
+            plan.append(unit)
+            offsets.append(line)
+            if unit is None:
+                fresh_chunks.append(chunk)
+                fresh_offsets.append(line)
+                fresh_source_lines.append(source_line)
+                line += self.count_statements(chunk)
+            elif unit.trailing:
+                break
+            else:
+                line += len(unit.statement_table)
+            source_line += self.count_lines(chunk)
+        units: List[ProcedureUnit] = []
+        fresh_units: Iterator[ProcedureUnit] = self.parse_chunks(fresh_chunks, fresh_offsets, fresh_source_lines)
+        for unit in plan:
+            units.append(unit or next(fresh_units))
+            if units[-1].trailing:
+                break
+        fresh_units.close()
+        self.apply(units, offsets, digests[:len(units)])
+        if not isinstance(code, IOBase):
+            self.code = code
+
+    def split_procedures(self, code: Source) -> List[Chunk]:
+        # every procedure is hashed to find the changed ones, so a stream is read whole
+        if isinstance(code, IOBase):
+            code = self.code = code.read()
+        return [code[start:end] for start, end in self.find_procedures(code)]
+
+    def apply(self, units: List[ProcedureUnit], offsets: List[int], digests: List[str]) -> None:
+        reused: Set[int] = {id(unit) for unit in self.units}
+        kept: Set[int] = {id(unit) for unit, offset in zip(units, offsets) if id(unit) in reused
+                          and unit.first_line == offset}
+        current: Set[int] = {id(unit) for unit in units}
+        changed: Set[str] = {unit.proc_node.value for unit in self.units if id(unit) not in current}
+        for unit in self.units:
+            if id(unit) not in kept:
+                self.remove_unit(unit)
+        inserted: List[ProcedureUnit] = []
+        for unit, offset in zip(units, offsets):
+            if id(unit) not in kept:
+                if id(unit) in reused:
+                    unit.shift(offset - unit.first_line)
+                else:
+                    changed.add(unit.proc_node.value)
+                self.insert_unit(unit)
+                inserted.append(unit)
+        self.units = units
+        self.digests = digests
+        self.collect_program()
+        self.propagate_calls(changed, inserted)
+
+    def collect_program(self) -> None:
+        self.root.children = [unit.proc_node for unit in self.units]
+        self.statement_table = [row for unit in self.units for row in unit.statement_table]
+        self.proc_table = [row for unit in self.units for row in unit.proc_table]
+        self.var_table = set().union(*(unit.var_table for unit in self.units))
+        self.const_table = {}
+        self.calls_table = {}
+        for unit in self.units:
+            for value, info in unit.const_table.items():
+                self.const_table.setdefault(value, {'lines': []})['lines'].extend(info['lines'])
+            for procedure, called in unit.calls_table.items():
+                self.calls_table.setdefault(procedure, {}).update(called)
+
+    def remove_unit(self, unit: ProcedureUnit) -> None:
+        extractor: DesignExtractor = unit.extractor
+        for table, unit_table in ((self.follows_table, extractor.follows_table),
+                                  (self.parent_table, extractor.parent_table),
+                                  (self.next_table, extractor.next_table)):
+            for line in unit_table:
+                table.pop(line, None)
+        for table, unit_table in ((self.mod_table, extractor.mod_table), (self.uses_table, extractor.uses_table)):
+            for line in unit_table:
+                table.pop(line, None)
+            for line in extractor.callees:
+                table.pop(str(line), None)
+
+    def insert_unit(self, unit: ProcedureUnit) -> None:
+        extractor: DesignExtractor = unit.extractor
+        self.follows_table.update(extractor.follows_table)
+        self.parent_table.update(extractor.parent_table)
+        self.next_table.update(extractor.next_table)
+        for table, unit_table in ((self.mod_table, extractor.mod_table), (self.uses_table, extractor.uses_table)):
+            for line, variables in unit_table.items():
+                table[line] = dict(variables)
+
+    def propagate_calls(self, changed: Set[str], inserted: List[ProcedureUnit]) -> None:
+        local_mod: Dict[str, Dict[str, int]] = {}
+        local_uses: Dict[str, Dict[str, int]] = {}
+        for unit in self.units:
+            local_mod.update(unit.extractor.local_mod)
+            local_uses.update(unit.extractor.local_uses)
+        call_graph: CallGraph = CallGraph(self.calls_table, local_mod.keys())
+        # procedures defined twice shadow each other, so their callers cannot be tracked by name
+        affected: Optional[Set[str]] = call_graph.find_callers(changed) if len(local_mod) == len(self.units) else None
+        inserted_units: Set[int] = {id(unit) for unit in inserted}
+        for name, local_effects in (('mod', local_mod), ('uses', local_uses)):
+            previous: Dict[str, Dict[str, int]] = getattr(self, name + '_summaries')
+            summaries: Dict[str, Dict[str, int]] = call_graph.summarize(local_effects, affected, previous)
+            table: Dict = getattr(self, name + '_table')
+            updated: Set[str] = {procedure for procedure in (summaries if affected is None else affected)
+                                 if summaries.get(procedure) != previous.get(procedure)}
+            for procedure in updated | changed:
+                if summaries.get(procedure, None) and procedure in local_effects:
+                    table[procedure] = dict(summaries[procedure])
+                else:
+                    table.pop(procedure, None)
+            for unit in self.units:
+                if id(unit) in inserted_units:
+                    self.propagate_unit(unit, summaries, table, getattr(unit.extractor, name + '_table'), None)
+                elif affected is None or unit.proc_node.value in affected:
+                    self.propagate_unit(unit, summaries, table, getattr(unit.extractor, name + '_table'), updated)
+            setattr(self, name + '_summaries', summaries)
+
+    @staticmethod
+    def propagate_unit(unit: ProcedureUnit, summaries: Dict[str, Dict[str, int]], table: Dict, local_table: Dict,
+                       updated: Optional[Set[str]]) -> None:
+        for line, procedures in unit.extractor.callees.items():
+            if updated is not None and updated.isdisjoint(procedures):
+                continue
+            key: str = str(line)
+            variables: Dict[str, int] = dict(local_table.get(key, {}))
+            for procedure in procedures:
+                variables.update(summaries.get(procedure, {}))
+            if variables or key in local_table:
+                table[key] = variables
+            else:
+                table.pop(key, None)
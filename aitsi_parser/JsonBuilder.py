@@ -3,6 +3,10 @@ from typing import Union, Dict, List
 
 
 class JsonBuilder:
+    table_files: Dict[str, str] = {'var': "VarTable.json", 'proc': "ProcTable.json", 'statement': "StatementTable.json",
+                                   'const': "ConstTable.json", 'follows': "FollowsTable.json",
+                                   'parent': "ParentTable.json", 'calls': "CallsTable.json", 'next': "NextTable.json",
+                                   'modifies': "ModifiesTable.json", 'uses': "UsesTable.json"}
 
     @staticmethod
     def save_table_to_json_file(data_table: Union[Dict, List], path: str):
@@ -0,0 +1,61 @@
+from typing import Callable, Dict, List
+
+from aitsi_parser.CallGraph import CallGraph
+
+
+class NextClosure:
+    # transitive closure of one direction of the control flow graph, computed a procedure at a time: loops are
+    # condensed into strongly connected components and every component keeps the lines it reaches as an int
+    # bitset, bit i standing for line offset + i of its procedure, edges are read through the lookups so only
+    # the procedures that are asked about are ever loaded
+
+    def __init__(self, get_edges: Callable[[int], List[int]], get_reverse_edges: Callable[[int], List[int]]) -> None:
+        self.get_edges: Callable[[int], List[int]] = get_edges
+        self.get_reverse_edges: Callable[[int], List[int]] = get_reverse_edges
+        self.offsets: Dict[int, int] = {}
+        self.reachable: Dict[int, int] = {}
+
+    def get_bits(self, line: int) -> int:
+        if line not in self.reachable:
+            if not self.get_edges(line) and not self.get_reverse_edges(line):
+                return 0
+            self.close_procedure(line)
+        return self.reachable[line]
+
+    def close_procedure(self, line: int) -> None:
+        # lines of a procedure are connected through next and previous edges, next never leaves a procedure
+        edges: Dict[int, List[int]] = {}
+        stack: List[int] = [line]
+        while stack:
+            current: int = stack.pop()
+            if current not in edges:
+                edges[current] = self.get_edges(current)
+                stack.extend(edges[current])
+                stack.extend(self.get_reverse_edges(current))
+        offset: int = min(edges)
+        # components come out successors first, so every component after the first only reads finished ones
+        for component in CallGraph(edges, sorted(edges)).components:
+            bits: int = 0
+            if len(component) > 1:
+                for member in component:
+                    bits |= 1 << (member - offset)
+            for member in component:
+                for target in edges[member]:
+                    bits |= (1 << (target - offset)) | self.reachable.get(target, 0)
+            for member in component:
+                self.offsets[member] = offset
+                self.reachable[member] = bits
+
+    def is_reachable(self, source: int, target: int) -> bool:
+        bits: int = self.get_bits(source)
+        return bits != 0 and target >= self.offsets[source] and bool(bits >> (target - self.offsets[source]) & 1)
+
+    def get_reachable(self, line: int) -> List[int]:
+        bits: int = self.get_bits(line)
+        if not bits:
+            return []
+        return self.decode(bits, self.offsets[line])
+
+    @staticmethod
+    def decode(bits: int, offset: int) -> List[int]:
+        return [offset + index for index, bit in enumerate(reversed(bin(bits))) if bit == '1']
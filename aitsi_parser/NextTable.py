@@ -1,38 +1,79 @@
-from typing import List, Union, Dict
+from typing import AbstractSet, FrozenSet, List, Optional, Tuple, Union, Dict
+
+import numpy as np
+
+from aitsi_parser.CsrRelation import CsrRelation
+from aitsi_parser.NextClosure import NextClosure
 
 
 class NextTable:
 
-    def __init__(self, table: Union[Dict, List]) -> None:
-        self.table: Union[Dict, List] = table
+    def __init__(self, table: Union[Dict, CsrRelation]) -> None:
+        # rows are keyed by the next statement and hold the statements before it
+        self.relation: CsrRelation = table if isinstance(table, CsrRelation) else CsrRelation.from_table(table)
+        # successors and predecessors of the statements a query touched, nothing is copied out of a memory-mapped
+        # or SQLite PKB up front
+        self.next_lines: Dict[int, List[int]] = {}
+        self.previous_lines: Dict[int, List[int]] = {}
+        self.all_previous: Optional[FrozenSet[int]] = None
+        self.all_next: Optional[FrozenSet[int]] = None
+        # Next* in both directions, each procedure is closed the first time one of its lines is asked about
+        self.next_closure: NextClosure = NextClosure(self.get_next_lines, self.get_previous_lines)
+        self.previous_closure: NextClosure = NextClosure(self.get_previous_lines, self.get_next_lines)
+
+    def get_all_previous(self) -> FrozenSet[int]:
+        if self.all_previous is None:
+            self.all_previous = frozenset(self.relation.get_all_sources())
+        return self.all_previous
+
+    def get_all_next(self) -> FrozenSet[int]:
+        if self.all_next is None:
+            self.all_next = frozenset(self.relation.get_all_targets())
+        return self.all_next
 
-    def get_all_previous(self) -> List[int]:
-        return list(map(int, list(self.table.keys())))
+    def get_previous_lines(self, stmt: int) -> List[int]:
+        if stmt not in self.previous_lines:
+            self.previous_lines[stmt] = self.relation.get_targets(stmt)
+        return self.previous_lines[stmt]
 
-    def get_all_next(self) -> List[int]:
-        return list(map(int, set(sum([list(self.table[key].keys()) for key in self.table], []))))
+    def get_next_lines(self, stmt: int) -> List[int]:
+        if stmt not in self.next_lines:
+            self.next_lines[stmt] = self.relation.get_sources(stmt)
+        return self.next_lines[stmt]
 
     def get_previous(self, stmt: int) -> List[int]:
-        try:
-            return list(map(int, list(self.table[str(stmt)].keys())))
-        except Exception:
-            return []
+        return list(self.get_previous_lines(stmt))
 
     def get_next(self, stmt: int) -> List[int]:
-        try:
-            return [int(element) for element in self.table if str(stmt) in self.table[element].keys()]
-        except Exception:
-            return []
+        return list(self.get_next_lines(stmt))
 
     def is_next(self, previous_stmt: int, next_stmt: int) -> bool:
-        try:
-            return bool(self.table[str(next_stmt)][str(previous_stmt)])
-        except Exception:
-            return False
+        return previous_stmt in self.get_previous_lines(next_stmt)
+
+    def is_next_t(self, previous_stmt: int, next_stmt: int) -> bool:
+        return self.next_closure.is_reachable(previous_stmt, next_stmt)
+
+    def get_next_t(self, stmt: int) -> List[int]:
+        return self.next_closure.get_reachable(stmt)
+
+    def get_previous_t(self, stmt: int) -> List[int]:
+        return self.previous_closure.get_reachable(stmt)
+
+    def get_next_t_pairs(self, firsts: Optional[AbstractSet[int]],
+                         seconds: Optional[AbstractSet[int]]) -> Tuple[List[int], List[int]]:
+        # the firsts with a second somewhere after them and the seconds with a first somewhere before them, one
+        # frontier expansion per direction over the relation instead of a walk per candidate, None stands for
+        # any statement
+        firsts = self.get_all_next() if firsts is None else firsts
+        seconds = self.get_all_previous() if seconds is None else seconds
+        after: np.ndarray = self.relation.get_reachable(firsts, reverse=True)
+        before: np.ndarray = self.relation.get_reachable(seconds)
+        return (np.intersect1d(before, np.fromiter(firsts, dtype=np.int64)).tolist(),
+                np.intersect1d(after, np.fromiter(seconds, dtype=np.int64)).tolist())
 
     def to_string(self) -> None:
         print("NextTable:")
-        print(self.table)
+        print(self.relation.get_pairs())
 
     def to_log(self) -> str:
-        return "NextTable: \n" + str(self.table)
+        return "NextTable: \n" + str(self.relation.get_pairs())
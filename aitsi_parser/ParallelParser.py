@@ -0,0 +1,144 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from mmap import mmap
+from typing import Callable, Iterable, Iterator, List, Optional, Pattern, Tuple, Union
+
+from aitsi_parser.DesignExtractor import DesignExtractor
+from aitsi_parser.Parser import Parser
+from aitsi_parser.ProcedureUnit import ProcedureUnit
+from aitsi_parser.StackParser import StackParser
+from aitsi_parser.Tokenizer import Source
+from pql.Node import Node
+
+Chunk = Union[str, bytes]
+
+
+class ParallelParser(Parser):
+    procedure_boundary: Pattern = re.compile(r"\bprocedure\b")
+    byte_procedure_boundary: Pattern = re.compile(rb"\bprocedure\b")
+    # every statement either ends with ';' or starts with while/if
+    statement_boundary: Pattern = re.compile(r";|\bwhile\b|\bif\b")
+    byte_statement_boundary: Pattern = re.compile(rb";|\bwhile\b|\bif\b")
+    line_boundary: Pattern = re.compile(r"\n")
+    byte_line_boundary: Pattern = re.compile(rb"\n")
+    # smaller programs are parsed in this process, starting the pool would cost more than it saves
+    min_parallel_size: int = 1 << 20
+
+    def __init__(self, code: Source, filename: str, workers: Optional[int] = None) -> None:
+        super().__init__(code, filename)
+        self.workers: Optional[int] = workers
+
+    def program(self) -> None:
+        spans: List[Tuple[int, int]] = self.find_procedures(self.code) if isinstance(self.code, (str, bytes, mmap)) \
+            else []
+        if (self.workers or os.cpu_count() or 1) == 1 or len(spans) < 2 \
+                or spans[-1][1] - spans[0][0] < self.min_parallel_size:
+            # streams and small programs are tokenized here chunk by chunk, which never holds the whole source
+            parser: StackParser = StackParser(self.code, self.root.value)
+            parser.program()
+            self.take_results(parser)
+            return
+        # the statement and source line every procedure starts after, so workers number lines as one parser would
+        offsets: List[int] = []
+        source_lines: List[int] = []
+        line: int = 0
+        source_line: int = 1 + self.count_lines(self.code, 0, spans[0][0])
+        for start, end in spans:
+            offsets.append(line)
+            source_lines.append(source_line)
+            line += self.count_statements(self.code, start, end)
+            source_line += self.count_lines(self.code, start, end)
+        if isinstance(self.code, mmap) and os.path.isfile(self.root.value) \
+                and os.path.getsize(self.root.value) == len(self.code):
+            # workers read their own procedures from the file, only offsets are sent to them
+            self.merge(self.run(self.parse_file_procedure, len(spans), repeat(self.root.value), spans, offsets,
+                                source_lines))
+        else:
+            self.merge(self.parse_chunks((self.code[start:end] for start, end in spans), offsets, source_lines))
+
+    def take_results(self, parser: Parser) -> None:
+        self.root = parser.root
+        self.current_line = parser.current_line
+        self.statement_table = parser.statement_table
+        self.proc_table = parser.proc_table
+        self.var_table = parser.var_table
+        self.const_table = parser.const_table
+        self.calls_table = parser.calls_table
+        self.follows_table = parser.follows_table
+        self.parent_table = parser.parent_table
+        self.next_table = parser.next_table
+        self.mod_table = parser.mod_table
+        self.uses_table = parser.uses_table
+
+    def find_procedures(self, code: Union[Chunk, mmap]) -> List[Tuple[int, int]]:
+        # (start, end) of every procedure, found without copying the source
+        boundary: Pattern = self.procedure_boundary if isinstance(code, str) else self.byte_procedure_boundary
+        starts: List[int] = [match.start() for match in boundary.finditer(code)]
+        # the sequential parser stops at the first token that does not start a procedure
+        if not starts or code[:starts[0]].strip():
+            return []
+        return list(zip(starts, starts[1:] + [len(code)]))
+
+    def count_statements(self, code: Union[Chunk, mmap], start: int = 0, end: Optional[int] = None) -> int:
+        boundary: Pattern = self.statement_boundary if isinstance(code, str) else self.byte_statement_boundary
+        return len(boundary.findall(code, start, len(code) if end is None else end))
+
+    def count_lines(self, code: Union[Chunk, mmap], start: int = 0, end: Optional[int] = None) -> int:
+        boundary: Pattern = self.line_boundary if isinstance(code, str) else self.byte_line_boundary
+        return len(boundary.findall(code, start, len(code) if end is None else end))
+
+    def parse_chunks(self, chunks: Iterable[Chunk], offsets: List[int],
+                     source_lines: List[int]) -> Iterator[ProcedureUnit]:
+        return self.run(self.parse_procedure, len(offsets), chunks, repeat(self.root.value), offsets, source_lines)
+
+    def run(self, parse: Callable[..., ProcedureUnit], count: int, *arguments: Iterable) -> Iterator[ProcedureUnit]:
+        workers: int = self.workers or os.cpu_count() or 1
+        if workers == 1 or count < 2:
+            yield from map(parse, *arguments)
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                yield from executor.map(parse, *arguments, chunksize=max(1, count // (workers * 4)))
+
+    @staticmethod
+    def parse_file_procedure(path: str, span: Tuple[int, int], first_line: int,
+                             first_source_line: int) -> ProcedureUnit:
+        with open(path, 'rb') as f:
+            f.seek(span[0])
+            code: bytes = f.read(span[1] - span[0])
+        return ParallelParser.parse_procedure(code, path, first_line, first_source_line)
+
+    @staticmethod
+    def parse_procedure(code: Chunk, filename: str, first_line: int, first_source_line: int) -> ProcedureUnit:
+        parser: StackParser = StackParser(code, filename)
+        parser.current_line = first_line
+        parser.tokenizer.chunk_line = first_source_line
+        parser.next_token = parser.get_token()
+        proc_node: Node = next(parser.procedure())
+        parser.statement_table.sort(key=lambda element: element['statement_line'])
+        extractor: DesignExtractor = DesignExtractor(parser.root, parser.calls_table)
+        extractor.extract_procedure(proc_node)
+        return ProcedureUnit(proc_node, first_line, parser.statement_table, parser.proc_table, parser.var_table,
+                             parser.const_table, parser.calls_table, extractor, parser.next_token[0] != '')
+
+    def merge(self, units: Iterable[ProcedureUnit]) -> None:
+        extractor: DesignExtractor = DesignExtractor(self.root, self.calls_table)
+        for unit in units:
+            self.root.add_child(unit.proc_node)
+            self.statement_table.extend(unit.statement_table)
+            self.proc_table.extend(unit.proc_table)
+            self.var_table.update(unit.var_table)
+            for value, info in unit.const_table.items():
+                self.const_table.setdefault(value, {'lines': []})['lines'].extend(info['lines'])
+            for procedure, called in unit.calls_table.items():
+                self.calls_table.setdefault(procedure, {}).update(called)
+            extractor.merge(unit.extractor)
+            if unit.trailing:
+                break
+        extractor.propagate_calls()
+        self.follows_table = extractor.follows_table
+        self.parent_table = extractor.parent_table
+        self.next_table = extractor.next_table
+        self.mod_table = extractor.mod_table
+        self.uses_table = extractor.uses_table
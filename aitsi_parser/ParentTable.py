@@ -1,38 +1,105 @@
-from typing import List, Union, Dict
+from bisect import bisect_right
+from typing import AbstractSet, FrozenSet, Iterable, List, Optional, Tuple, Union, Dict
+
+from aitsi_parser.CsrRelation import CsrRelation
 
 
 class ParentTable:
 
-    def __init__(self, table: Union[Dict, List]) -> None:
-        self.table: Union[Dict, List] = table
+    def __init__(self, table: Union[Dict, CsrRelation]) -> None:
+        self.relation: CsrRelation = table if isinstance(table, CsrRelation) else CsrRelation.from_table(table)
+        # nothing is copied out of the relation up front, only the statements a query touches are cached here,
+        # every statement has at most one parent, a parent keeps its children in line order
+        self.children: Dict[int, List[int]] = {}
+        self.parents: Dict[int, Optional[int]] = {}
+        self.all_parents: Optional[FrozenSet[int]] = None
+        self.all_children: Optional[FrozenSet[int]] = None
+        # lines are numbered in program order, so the descendants of a container are the lines after it up to
+        # the last line of its nesting interval, children always come after their parent
+        self.ends: Dict[int, int] = {}
 
-    def get_all_parents(self) -> List[int]:
-        return list(map(int, list(self.table.keys())))
+    def get_all_parents(self) -> FrozenSet[int]:
+        if self.all_parents is None:
+            self.all_parents = frozenset(self.relation.get_all_sources())
+        return self.all_parents
 
-    def get_all_children(self) -> List[int]:
-        return list(map(int, set(sum([list(self.table[key].keys()) for key in self.table], []))))
+    def get_all_children(self) -> FrozenSet[int]:
+        if self.all_children is None:
+            self.all_children = frozenset(self.relation.get_all_targets())
+        return self.all_children
 
     def get_parent(self, stmt: int) -> Union[int, None]:
-        try:
-            return [int(element) for element in self.table if str(stmt) in self.table[element].keys()][0]
-        except Exception:
-            return None
+        if stmt not in self.parents:
+            sources: List[int] = self.relation.get_sources(stmt)
+            self.parents[stmt] = sources[0] if sources else None
+        return self.parents[stmt]
+
+    def get_children(self, stmt: int) -> List[int]:
+        if stmt not in self.children:
+            self.children[stmt] = self.relation.get_targets(stmt)
+        return self.children[stmt]
 
     def get_child(self, stmt: int) -> List[int]:
-        try:
-            return list(map(int, list(self.table[str(stmt)].keys())))
-        except Exception:
-            return []
+        return list(self.get_children(stmt))
+
+    def get_parents_of(self, stmts: Iterable[int]) -> List[int]:
+        return self.relation.get_sources_of(stmts)
+
+    def get_children_of(self, stmts: Iterable[int]) -> List[int]:
+        return self.relation.get_targets_of(stmts)
 
     def is_parent(self, parent_stmt: int, child_stmt: int) -> bool:
-        try:
-            return bool(self.table[str(parent_stmt)][str(child_stmt)])
-        except Exception:
-            return False
+        return self.get_parent(child_stmt) == parent_stmt
+
+    def get_end(self, stmt: int) -> int:
+        # the last line nested in stmt, found by following last children down, every container passed on the
+        # way shares it
+        path: List[int] = []
+        current: int = stmt
+        while current not in self.ends:
+            children: List[int] = self.get_children(current)
+            if not children:
+                self.ends[current] = current
+                break
+            path.append(current)
+            current = children[-1]
+        for parent in path:
+            self.ends[parent] = self.ends[current]
+        return self.ends[stmt]
+
+    def is_parent_t(self, parent_stmt: int, child_stmt: int) -> bool:
+        return parent_stmt < child_stmt <= self.get_end(parent_stmt)
+
+    def get_descendants(self, stmt: int) -> range:
+        return range(stmt + 1, self.get_end(stmt) + 1)
+
+    def get_ancestors(self, stmt: int) -> List[int]:
+        ancestors: List[int] = []
+        parent: Union[int, None] = self.get_parent(stmt)
+        while parent is not None:
+            ancestors.append(parent)
+            parent = self.get_parent(parent)
+        return ancestors
+
+    def get_parent_t_pairs(self, firsts: Optional[AbstractSet[int]],
+                           seconds: Optional[AbstractSet[int]]) -> Tuple[List[int], List[int]]:
+        # the firsts with a second inside their interval and the seconds with a first among their ancestors,
+        # None stands for any statement
+        parents: FrozenSet[int] = self.get_all_parents() if firsts is None \
+            else self.get_all_parents().intersection(firsts)
+        children: List[int] = sorted(self.get_all_children() if seconds is None else
+                                     self.get_all_children().intersection(seconds))
+        result_first: List[int] = []
+        for parent in parents:
+            index: int = bisect_right(children, parent)
+            if index < len(children) and children[index] <= self.get_end(parent):
+                result_first.append(parent)
+        result_second: List[int] = [child for child in children if not parents.isdisjoint(self.get_ancestors(child))]
+        return result_first, result_second
 
     def to_string(self) -> None:
         print("ParentTable:")
-        print(self.table)
+        print(self.relation.get_pairs())
 
     def to_log(self) -> str:
-        return "ParentTable: \n" + str(self.table)
+        return "ParentTable: \n" + str(self.relation.get_pairs())
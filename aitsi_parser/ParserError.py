@@ -0,0 +1,3 @@
+class ParserError(Exception):
+    # a syntax error in the SIMPLE source, the message starts with the statement and source line it was found at
+    pass
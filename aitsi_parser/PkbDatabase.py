@@ -0,0 +1,79 @@
+import os
+import sqlite3
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from aitsi_parser.CsrRelation import CsrRelation
+from aitsi_parser.PkbFile import PkbFile, Section
+from aitsi_parser.SqliteRelation import SqliteRelation
+from aitsi_parser.SymbolTable import SymbolTable
+from pql.CompactNode import AstNode
+from pql.utils.LazyDict import LazyDict
+
+
+class PkbDatabase:
+    # relations become indexed SQLite tables, every other PKB section is kept as a blob
+    filename: str = "PKB.sqlite"
+    version: int = 1
+
+    @staticmethod
+    def save_pkb(path: str, root: AstNode, tables: Dict[str, Union[Dict, List]]) -> None:
+        sections: Dict[str, Section] = PkbFile.get_sections(root, tables)
+        if os.path.exists(path + '.tmp'):
+            os.remove(path + '.tmp')
+        connection: sqlite3.Connection = sqlite3.connect(path + '.tmp')
+        try:
+            # a single transaction, so the rows are written in one go
+            with connection:
+                connection.execute(f"PRAGMA user_version = {PkbDatabase.version}")
+                connection.execute("CREATE TABLE sections (name TEXT PRIMARY KEY, kind INTEGER NOT NULL, "
+                                   "data BLOB NOT NULL)")
+                for name in PkbFile.relations:
+                    relation: CsrRelation = CsrRelation.from_sections(sections, name)
+                    SqliteRelation.create(connection, PkbDatabase.get_table_name(name), relation.get_pairs())
+                    for part in CsrRelation.parts:
+                        del sections[name + '.' + part]
+                connection.executemany("INSERT INTO sections VALUES (?, ?, ?)",
+                                       ((name, *PkbFile.encode_section(section)) for name, section in sections.items()))
+        finally:
+            connection.close()
+        os.replace(path + '.tmp', path)
+
+    @staticmethod
+    def connect(path: str) -> sqlite3.Connection:
+        # read only, so any number of processes can share one PKB file
+        connection: sqlite3.Connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        if connection.execute("PRAGMA user_version").fetchone()[0] != PkbDatabase.version:
+            connection.close()
+            raise ValueError(f"{path} is not a version {PkbDatabase.version} PKB database")
+        return connection
+
+    @staticmethod
+    def read(connection: sqlite3.Connection) -> LazyDict:
+        return LazyDict({name: partial(PkbDatabase.read_section, connection, name)
+                         for name, in connection.execute("SELECT name FROM sections")})
+
+    @staticmethod
+    def read_section(connection: sqlite3.Connection, name: str) -> Section:
+        kind, data = connection.execute("SELECT kind, data FROM sections WHERE name = ?", (name,)).fetchone()
+        return PkbFile.decode_section(kind, np.frombuffer(data, np.uint8))
+
+    @staticmethod
+    def get_table_name(name: str) -> str:
+        return name.replace('.', '_')
+
+    @staticmethod
+    def load_table(connection: sqlite3.Connection, sections: LazyDict, name: str,
+                   symbols: Optional[SymbolTable] = None) -> Union[
+            Dict, List, SqliteRelation, Tuple[SqliteRelation, SqliteRelation]]:
+        if name in PkbFile.statement_relations:
+            return SqliteRelation(connection, name)
+        if name not in PkbFile.symbol_relations:
+            return PkbFile.load_json_table(sections, name)
+        symbols = symbols if symbols is not None else PkbFile.load_symbols(sections)
+        if name == 'calls':
+            return SqliteRelation(connection, name, symbols)
+        return (SqliteRelation(connection, PkbDatabase.get_table_name(name + '.stmt'), symbols),
+                SqliteRelation(connection, PkbDatabase.get_table_name(name + '.proc'), symbols))
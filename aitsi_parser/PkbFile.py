@@ -0,0 +1,180 @@
+import os
+import struct
+from typing import Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+
+from aitsi_parser.CsrRelation import CsrRelation
+from aitsi_parser.SymbolTable import SymbolTable
+from pql.CompactNode import AstNode
+from pql.Node import Node
+from pql.utils.AstCodec import AstCodec
+
+Section = Union[List[str], np.ndarray]
+
+
+class PkbFile:
+    # header, then one (name, kind, offset, size) entry per section, then the section blocks
+    magic: bytes = b'AITSIPKB'
+    version: int = 2
+    header: struct.Struct = struct.Struct('<8sHH')
+    entry: struct.Struct = struct.Struct('<32sBQQ')
+    strings_kind: int = 1  # utf-8 strings separated by NUL bytes
+    int32_kind: int = 2  # little endian int32 array
+    filename: str = "PKB.bin"
+    statement_relations: List[str] = ['follows', 'parent', 'next']
+    relations: List[str] = ['follows', 'parent', 'next', 'calls', 'modifies.stmt', 'modifies.proc', 'uses.stmt',
+                            'uses.proc']
+    symbol_relations: List[str] = ['calls', 'modifies', 'uses']
+    table_names: List[str] = ['var', 'proc', 'statement', 'const', 'follows', 'parent', 'calls', 'next', 'modifies',
+                              'uses']
+
+    @staticmethod
+    def write(path: str, sections: Dict[str, Section]) -> None:
+        blocks: List[Tuple[str, int, bytes]] = []
+        for name, section in sections.items():
+            if len(name.encode()) > 32:
+                raise ValueError(f"PKB section name {name} is longer than 32 bytes")
+            blocks.append((name, *PkbFile.encode_section(section)))
+        # blocks start on 8 byte boundaries so int sections can be mapped in place
+        offset: int = PkbFile.get_aligned(PkbFile.header.size + PkbFile.entry.size * len(blocks))
+        with open(path + '.tmp', 'wb') as f:
+            f.write(PkbFile.header.pack(PkbFile.magic, PkbFile.version, len(blocks)))
+            for name, kind, block in blocks:
+                f.write(PkbFile.entry.pack(name.encode(), kind, offset, len(block)))
+                offset = PkbFile.get_aligned(offset + len(block))
+            for _, _, block in blocks:
+                f.write(b'\0' * (PkbFile.get_aligned(f.tell()) - f.tell()))
+                f.write(block)
+        os.replace(path + '.tmp', path)
+
+    @staticmethod
+    def get_aligned(offset: int) -> int:
+        return (offset + 7) & ~7
+
+    @staticmethod
+    def read(path: str, memory_map: bool = True) -> Dict[str, Section]:
+        # int sections stay views of the mapped file, pages are only read when a table touches them
+        data: np.ndarray = np.memmap(path, np.uint8, 'r').view(np.ndarray) if memory_map \
+            else np.fromfile(path, np.uint8)
+        magic, version, count = PkbFile.header.unpack(bytes(data[:PkbFile.header.size]))
+        if magic != PkbFile.magic or version != PkbFile.version:
+            raise ValueError(f"{path} is not a version {PkbFile.version} PKB file")
+        index: bytes = bytes(data[PkbFile.header.size:PkbFile.header.size + PkbFile.entry.size * count])
+        sections: Dict[str, Section] = {}
+        for name, kind, offset, size in PkbFile.entry.iter_unpack(index):
+            sections[name.rstrip(b'\0').decode()] = PkbFile.decode_section(kind, data[offset:offset + size])
+        return sections
+
+    @staticmethod
+    def encode_section(section: Section) -> Tuple[int, bytes]:
+        if isinstance(section, np.ndarray):
+            return PkbFile.int32_kind, section.astype('<i4').tobytes()
+        return PkbFile.strings_kind, '\0'.join(section).encode()
+
+    @staticmethod
+    def decode_section(kind: int, block: np.ndarray) -> Section:
+        if kind == PkbFile.int32_kind:
+            return block.view('<i4')
+        text: str = bytes(block).decode()
+        return text.split('\0') if text else []
+
+    @staticmethod
+    def save_pkb(path: str, root: AstNode, tables: Dict[str, Union[Dict, List]]) -> None:
+        PkbFile.write(path, PkbFile.get_sections(root, tables))
+
+    @staticmethod
+    def get_sections(root: AstNode, tables: Dict[str, Union[Dict, List]]) -> Dict[str, Section]:
+        # procedures, variables and constants take the first ids, other strings of the PKB follow
+        symbols: SymbolTable = SymbolTable.from_tables([row['proc_name'] for row in tables['proc']],
+                                                       [row['variable_name'] for row in tables['var']], tables['const'])
+        symbol = symbols.add
+        sections: Dict[str, Section] = {}
+        ast: Dict = AstCodec.encode(root)
+        sections['ast.types'] = ast['types']
+        sections['ast.values'] = ast['values']
+        sections['ast.nodes'] = np.array(ast['nodes'], dtype='<i4')
+        for name in PkbFile.statement_relations:
+            sections.update(CsrRelation.from_table(tables[name]).get_sections(name))
+        sections.update(CsrRelation.from_table(tables['calls'], symbol, symbol).get_sections('calls'))
+        # statements and procedures are kept apart, so lines and symbol ids never share a row
+        for name in ('modifies', 'uses'):
+            sections.update(CsrRelation.from_table(
+                {key: row for key, row in tables[name].items() if str(key).isdigit()}, int, symbol).get_sections(
+                name + '.stmt'))
+            sections.update(CsrRelation.from_table(
+                {key: row for key, row in tables[name].items() if not str(key).isdigit()}, symbol, symbol).get_sections(
+                name + '.proc'))
+        sections.update(CsrRelation.from_pairs((symbol(key), line) for key, info in tables['const'].items()
+                                               for line in info['lines']).get_sections('const'))
+        sections['var'] = np.array([symbol(row['variable_name']) for row in tables['var']], dtype='<i4')
+        sections['proc'] = np.array([(symbol(row['proc_name']), row['other_info']['start'], row['other_info']['finish'])
+                                     for row in tables['proc']], dtype='<i4').reshape(-1)
+        sections['statement'] = np.array(
+            [(row['statement_line'], symbol(row['other_info']['name']), symbol(row['other_info']['value']),
+              row['other_info']['start'], row['other_info']['end'], row['other_info'].get('last_if_line', -1),
+              row['other_info'].get('last_else_line', -1)) for row in tables['statement']], dtype='<i4').reshape(-1)
+        sections['symbols'] = symbols.names
+        return sections
+
+    @staticmethod
+    def load_pkb(path: str, node_class: Type[AstNode] = Node) -> Tuple[AstNode, Dict[str, Union[Dict, List]]]:
+        # tables come back in the same shape as their JSON files
+        sections: Dict[str, Section] = PkbFile.read(path)
+        return PkbFile.load_ast(sections, node_class), {name: PkbFile.load_json_table(sections, name)
+                                                        for name in PkbFile.table_names}
+
+    @staticmethod
+    def load_ast(sections: Dict[str, Section], node_class: Type[AstNode] = Node) -> AstNode:
+        return AstCodec.decode({'format': AstCodec.format_name, 'version': AstCodec.format_version,
+                                'types': sections['ast.types'], 'values': sections['ast.values'],
+                                'nodes': sections['ast.nodes'].tolist()}, node_class)
+
+    @staticmethod
+    def load_symbols(sections: Dict[str, Section]) -> SymbolTable:
+        return SymbolTable(sections['symbols'])
+
+    @staticmethod
+    def load_table(sections: Dict[str, Section], name: str, symbols: Optional[SymbolTable] = None) -> Union[
+            Dict, List, CsrRelation, Tuple[CsrRelation, CsrRelation]]:
+        # relations are served straight from their CSR sections, the other tables are rebuilt as JSON
+        if name in PkbFile.statement_relations:
+            return CsrRelation.from_sections(sections, name)
+        if name not in PkbFile.symbol_relations:
+            return PkbFile.load_json_table(sections, name)
+        symbols = symbols if symbols is not None else PkbFile.load_symbols(sections)
+        if name == 'calls':
+            return CsrRelation.from_sections(sections, name, symbols)
+        return (CsrRelation.from_sections(sections, name + '.stmt', symbols),
+                CsrRelation.from_sections(sections, name + '.proc', symbols))
+
+    @staticmethod
+    def load_json_table(sections: Dict[str, Section], name: str) -> Union[Dict, List]:
+        symbols: List[str] = sections['symbols']
+        if name in PkbFile.statement_relations:
+            return CsrRelation.from_sections(sections, name).to_table(str, str)
+        if name == 'calls':
+            return CsrRelation.from_sections(sections, name).to_table(symbols.__getitem__, symbols.__getitem__)
+        if name in ('modifies', 'uses'):
+            table: Dict[str, Dict[str, int]] = CsrRelation.from_sections(sections, name + '.stmt').to_table(
+                str, symbols.__getitem__)
+            table.update(CsrRelation.from_sections(sections, name + '.proc').to_table(symbols.__getitem__,
+                                                                                            symbols.__getitem__))
+            return table
+        if name == 'const':
+            const: CsrRelation = CsrRelation.from_sections(sections, name)
+            return {symbols[key]: {'lines': const.get_targets(key)} for key in const.get_all_sources()}
+        if name == 'var':
+            return [{'variable_name': symbols[key], 'other_info': {}} for key in sections['var'].tolist()]
+        if name == 'proc':
+            return [{'proc_name': symbols[proc], 'other_info': {'start': start, 'finish': finish}}
+                    for proc, start, finish in sections['proc'].reshape(-1, 3).tolist()]
+        statement_table: List[Dict] = []
+        rows: List[List[int]] = sections['statement'].reshape(-1, 7).tolist()
+        for line, statement_type, value, start, end, last_if_line, last_else_line in rows:
+            other_info: Dict = {'name': symbols[statement_type], 'value': symbols[value], 'start': start, 'end': end}
+            if last_if_line >= 0:
+                other_info['last_else_line'] = last_else_line
+                other_info['last_if_line'] = last_if_line
+            statement_table.append({'statement_line': line, 'other_info': other_info})
+        return statement_table
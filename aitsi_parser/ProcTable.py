@@ -1,27 +1,27 @@
-from typing import List, Union, Dict
+from typing import AbstractSet, List, Union, Dict
 
 
 class ProcTable:
 
     def __init__(self, table: Union[Dict, List]) -> None:
         self.table: Union[Dict, List] = table
+        # hashed by name, so lookups do not scan the table
+        self.names: Dict[str, dict] = {element['proc_name']: element['other_info'] for element in table}
 
     def get_all_proc_name(self) -> List[str]:
-        return [element['proc_name'] for element in self.table]
+        return list(self.names)
+
+    def get_proc_names(self) -> AbstractSet[str]:
+        return self.names.keys()
 
     def get_other_info(self, proc_name: str) -> dict:
-        for element in self.table:
-            if element['proc_name'] == proc_name:
-                return element['other_info']
+        return self.names.get(proc_name)
 
     def get_size(self) -> int:
         return len(self.table)
 
     def is_in(self, proc_name: str) -> bool:
-        for name in self.table:
-            if name['proc_name'] == proc_name:
-                return True
-        return False
+        return proc_name in self.names
 
     def to_string(self) -> None:
         print("ProcTable:")
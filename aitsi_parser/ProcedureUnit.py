@@ -0,0 +1,53 @@
+from typing import Dict, List, Set
+
+from aitsi_parser.DesignExtractor import DesignExtractor
+from pql.Node import Node
+
+
+class ProcedureUnit:
+
+    def __init__(self, proc_node: Node, first_line: int, statement_table: List, proc_table: List, var_table: Set[str],
+                 const_table: Dict, calls_table: Dict, extractor: DesignExtractor, trailing: bool) -> None:
+        self.proc_node: Node = proc_node
+        self.first_line: int = first_line  # number of statements before the procedure
+        self.statement_table: List = statement_table
+        self.proc_table: List = proc_table
+        self.var_table: Set[str] = var_table
+        self.const_table: Dict = const_table
+        self.calls_table: Dict = calls_table
+        self.extractor: DesignExtractor = extractor  # local tables, before call propagation
+        self.trailing: bool = trailing  # tokens follow the procedure, so the program ends here
+
+    def shift(self, delta: int) -> None:
+        if not delta:
+            return
+        self.first_line += delta
+        nodes: List[Node] = [self.proc_node]
+        while nodes:
+            node: Node = nodes.pop()
+            if node.line:
+                node.line += delta
+            nodes.extend(node.children)
+        for row in self.statement_table:
+            row['statement_line'] += delta
+            for key in ('start', 'end', 'last_if_line', 'last_else_line'):
+                if key in row['other_info']:
+                    row['other_info'][key] += delta
+        for row in self.proc_table:
+            row['other_info']['start'] += delta
+            row['other_info']['finish'] += delta
+        for info in self.const_table.values():
+            info['lines'] = [line + delta for line in info['lines']]
+        extractor: DesignExtractor = self.extractor
+        extractor.follows_table = self.shift_relation(extractor.follows_table, delta)
+        extractor.parent_table = self.shift_relation(extractor.parent_table, delta)
+        extractor.next_table = self.shift_relation(extractor.next_table, delta)
+        extractor.mod_table = {str(int(line) + delta): variables for line, variables in extractor.mod_table.items()}
+        extractor.uses_table = {str(int(line) + delta): variables for line, variables in extractor.uses_table.items()}
+        extractor.callees = {line + delta: procedures for line, procedures in extractor.callees.items()}
+        extractor.endings = {line + delta: [ending + delta for ending in endings]
+                             for line, endings in extractor.endings.items()}
+
+    @staticmethod
+    def shift_relation(table: Dict[int, Dict[int, int]], delta: int) -> Dict[int, Dict[int, int]]:
+        return {line + delta: {other + delta: 1 for other in row} for line, row in table.items()}
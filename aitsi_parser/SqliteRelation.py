@@ -0,0 +1,73 @@
+import sqlite3
+from typing import Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from aitsi_parser.CsrRelation import CsrRelation
+from aitsi_parser.SymbolTable import SymbolTable
+
+
+class SqliteRelation(CsrRelation):
+    # the same lookups as CsrRelation, answered by a (source, target) table indexed in both directions
+    chunk_size: int = 500  # stays below the SQLite limit of bound parameters
+
+    def __init__(self, connection: sqlite3.Connection, table: str, symbols: Optional[SymbolTable] = None) -> None:
+        super().__init__(None, None, None, None, symbols)
+        self.connection: sqlite3.Connection = connection
+        self.table: str = table
+
+    @staticmethod
+    def create(connection: sqlite3.Connection, table: str, pairs: Iterable[Tuple[int, int]]) -> None:
+        connection.execute(f"CREATE TABLE {table} (source INTEGER NOT NULL, target INTEGER NOT NULL, "
+                           f"PRIMARY KEY (source, target)) WITHOUT ROWID")
+        connection.executemany(f"INSERT OR IGNORE INTO {table} VALUES (?, ?)", pairs)
+        # the primary key covers lookups by source, this index covers lookups by target
+        connection.execute(f"CREATE INDEX {table}_target ON {table} (target, source)")
+
+    def select(self, query: str, parameters: Tuple = ()) -> List[int]:
+        return [row[0] for row in self.connection.execute(query.format(table=self.table), parameters)]
+
+    def select_in(self, query: str, values: Iterable[int]) -> List[int]:
+        values = list(values)
+        result: Set[int] = set()
+        for start in range(0, len(values), self.chunk_size):
+            chunk: List[int] = values[start:start + self.chunk_size]
+            result.update(self.select(query.replace('?', ', '.join('?' * len(chunk))), tuple(chunk)))
+        return list(result)
+
+    def get_targets(self, source: int) -> List[int]:
+        return self.select("SELECT target FROM {table} WHERE source = ? ORDER BY target", (source,))
+
+    def get_sources(self, target: int) -> List[int]:
+        return self.select("SELECT source FROM {table} WHERE target = ? ORDER BY source", (target,))
+
+    def contains(self, source: int, target: int) -> bool:
+        return bool(self.select("SELECT 1 FROM {table} WHERE source = ? AND target = ?", (source, target)))
+
+    def get_all_sources(self) -> List[int]:
+        return self.select("SELECT DISTINCT source FROM {table} ORDER BY source")
+
+    def get_all_targets(self) -> List[int]:
+        return self.select("SELECT DISTINCT target FROM {table} ORDER BY target")
+
+    def get_target_list(self) -> List[int]:
+        return self.select("SELECT target FROM {table} ORDER BY source, target")
+
+    def get_targets_of(self, sources: Iterable[int]) -> List[int]:
+        return self.select_in("SELECT DISTINCT target FROM {table} WHERE source IN (?)", sources)
+
+    def get_sources_of(self, targets: Iterable[int]) -> List[int]:
+        return self.select_in("SELECT DISTINCT source FROM {table} WHERE target IN (?)", targets)
+
+    def get_reachable(self, starts: Iterable[int], reverse: bool = False) -> np.ndarray:
+        # one round of queries per frontier level, each asking for the rows of the whole level at once
+        reached: Set[int] = set()
+        frontier: List[int] = list(starts)
+        while frontier:
+            found: List[int] = self.get_sources_of(frontier) if reverse else self.get_targets_of(frontier)
+            frontier = [line for line in found if line not in reached]
+            reached.update(frontier)
+        return np.array(sorted(reached), dtype=np.int64)
+
+    def get_pairs(self) -> List[Tuple[int, int]]:
+        return self.connection.execute(f"SELECT source, target FROM {self.table} ORDER BY source, target").fetchall()
@@ -0,0 +1,175 @@
+import gc
+from typing import Dict, List, Optional, Set, Tuple
+
+from aitsi_parser.Parser import Parser
+from aitsi_parser.Tokenizer import Tokenizer
+from pql.Node import Node
+
+
+class StackParser(Parser):
+    operator_precedence: Dict[str, int] = {'PLUS': 1, 'MINUS': 1, 'MULTIPLY': 2}
+    end_token: Tuple[str, str] = ('', '')
+
+    def program(self) -> None:
+        # the parse only adds nodes and rows that stay alive, so cyclic GC passes find nothing to free while their
+        # cost grows with the tree, on large programs they took more time than the parsing itself
+        enabled: bool = gc.isenabled()
+        gc.disable()
+        try:
+            super().program()
+        finally:
+            if enabled:
+                gc.enable()
+
+    def statement_list(self) -> Node:
+        tokens = self.tokens
+        end_token: Tuple[str, str] = self.end_token
+        statement_table: List = self.statement_table
+        var_table: Set[str] = self.var_table
+        line: int = self.current_line
+        prev: Tuple[str, str] = self.prev_token[:2]
+        token, text = self.next_token[:2]
+        stmt_list_node: Node = Node("STMT_LIST", prev[1])
+        # (container, children of its currently open statement list, last line of the 'then' branch)
+        stack: List[List] = [[None, stmt_list_node.children, 0]]
+        while stack:
+            frame: List = stack[-1]
+            if token == "CLOSE_BRACKET":
+                container_node: Node = frame[0]
+                if container_node is None:
+                    break
+                stack.pop()
+                prev, (token, text) = (token, text), next(tokens, end_token)
+                if container_node.node_type == 'WHILE':
+                    statement_table.append(
+                        {'statement_line': container_node.line,
+                         'other_info': {'name': 'WHILE', 'value': container_node.children[0].value,
+                                        'start': container_node.line, 'end': line}})
+                elif len(container_node.children) == 2:
+                    for expected in ("ELSE", "OPEN_BRACKET"):
+                        if token != expected:
+                            self.fail(expected, prev, token, text, line)
+                        prev, (token, text) = (token, text), next(tokens, end_token)
+                    else_node: Node = Node("STMT_LIST", prev[1])
+                    container_node.children.append(else_node)
+                    stack.append([container_node, else_node.children, line])
+                else:
+                    statement_table.append({'statement_line': container_node.line,
+                                            'other_info': {'name': 'IF', 'value': container_node.children[0].value,
+                                                           'start': container_node.line, 'end': line,
+                                                           'last_else_line': line,
+                                                           'last_if_line': frame[2]}})
+            elif token == "WHILE" or token == "IF":
+                line += 1
+                container_node: Node = Node(token, line=line)
+                prev, (token, text) = (token, text), next(tokens, end_token)
+                if token != "NAME":
+                    self.fail("NAME", prev, token, text, line)
+                container_node.children.append(Node(token, text, line))
+                var_table.add(text)
+                prev, (token, text) = (token, text), next(tokens, end_token)
+                for expected in (("THEN", "OPEN_BRACKET") if container_node.node_type == "IF" else ("OPEN_BRACKET",)):
+                    if token != expected:
+                        self.fail(expected, prev, token, text, line)
+                    prev, (token, text) = (token, text), next(tokens, end_token)
+                body_node: Node = Node("STMT_LIST", prev[1])
+                container_node.children.append(body_node)
+                frame[1].append(container_node)
+                stack.append([container_node, body_node.children, 0])
+            elif token == "CALL":
+                line += 1
+                prev, (token, text) = (token, text), next(tokens, end_token)
+                if not self.calls_table.get(self.call_procedure, None):
+                    self.calls_table[self.call_procedure] = {text: 1}
+                else:
+                    self.calls_table[self.call_procedure][text] = 1
+                if token != "NAME":
+                    self.fail("NAME", prev, token, text, line)
+                call_node: Node = Node("CALL", text, line)
+                statement_table.append({'statement_line': line, 'other_info':
+                    {'name': 'CALL', 'value': text, 'start': line, 'end': line}})
+                prev, (token, text) = (token, text), next(tokens, end_token)
+                if token != "SEMICOLON":
+                    self.fail("SEMICOLON", prev, token, text, line)
+                prev, (token, text) = (token, text), next(tokens, end_token)
+                frame[1].append(call_node)
+            else:
+                line += 1
+                if token != "NAME":
+                    self.fail("NAME", prev, token, text, line)
+                assign_node: Node = Node("ASSIGN", '', line, [Node(token, text, line)])
+                var_table.add(text)
+                statement_table.append({'statement_line': line, 'other_info':
+                    {'name': 'ASSIGN', 'value': text, 'start': line, 'end': line}})
+                prev, (token, text) = (token, text), next(tokens, end_token)
+                if token != "ASSIGN":
+                    self.fail("ASSIGN", prev, token, text, line)
+                prev, (token, text) = (token, text), next(tokens, end_token)
+                expression_node, prev, token, text = self.parse_expression(prev, token, text, line)
+                assign_node.children.append(expression_node)
+                if token != "SEMICOLON":
+                    self.fail("SEMICOLON", prev, token, text, line)
+                prev, (token, text) = (token, text), next(tokens, end_token)
+                frame[1].append(assign_node)
+        self.sync(prev, token, text, line)
+        yield stmt_list_node
+
+    def parse_expression(self, prev: Tuple[str, str], token: str, text: str,
+                         line: int) -> Tuple[Node, Tuple[str, str], str, str]:
+        tokens = self.tokens
+        end_token: Tuple[str, str] = self.end_token
+        operator_precedence: Dict[str, int] = self.operator_precedence
+        operands: List[Node] = []
+        operators: List[Optional[Tuple[str, str]]] = []  # None marks an open parenthesis
+        open_parentheses: int = 0
+        while True:
+            while token == "OPEN_PARENTHESIS":
+                prev, (token, text) = (token, text), next(tokens, end_token)
+                operators.append(None)
+                open_parentheses += 1
+            if token == "NAME":
+                self.var_table.add(text)
+            elif token == "INTEGER":
+                if self.const_table.get(text, None):
+                    self.const_table[text]['lines'].append(line)
+                else:
+                    self.const_table[text] = {'lines': [line]}
+            else:
+                self.sync(prev, token, text, line)
+                next(self.factor())
+            operands.append(Node(token, text, line))
+            prev, (token, text) = (token, text), next(tokens, end_token)
+            while token == "CLOSE_PARENTHESIS" and open_parentheses:
+                while operators[-1] is not None:
+                    self.reduce(operands, operators, line)
+                operators.pop()
+                open_parentheses -= 1
+                prev, (token, text) = (token, text), next(tokens, end_token)
+            precedence: int = operator_precedence.get(token, 0)
+            if not precedence:
+                break
+            while operators and operators[-1] is not None \
+                    and operator_precedence[operators[-1][0]] >= precedence:
+                self.reduce(operands, operators, line)
+            operators.append((token, text))
+            prev, (token, text) = (token, text), next(tokens, end_token)
+        if open_parentheses:
+            self.fail("CLOSE_PARENTHESIS", prev, token, text, line)
+        while operators:
+            self.reduce(operands, operators, line)
+        return operands[0], prev, token, text
+
+    @staticmethod
+    def reduce(operands: List[Node], operators: List[Optional[Tuple[str, str]]], line: int) -> None:
+        operator_type, operator_value = operators.pop()
+        right_node: Node = operands.pop()
+        operands[-1] = Node(operator_type, operator_value, line, [operands[-1], right_node])
+
+    def sync(self, prev: Tuple[str, str], token: str, text: str, line: int) -> None:
+        self.current_line = line
+        self.prev_token = (prev[0], prev[1], Tokenizer.token_names.get(prev[0], prev[1]))
+        self.next_token = (token, text, Tokenizer.token_names.get(token, text))
+
+    def fail(self, expected: str, prev: Tuple[str, str], token: str, text: str, line: int) -> None:
+        self.sync(prev, token, text, line)
+        self.match(expected)
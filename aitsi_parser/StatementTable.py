@@ -1,20 +1,42 @@
-from typing import List, Union, Dict
+from typing import FrozenSet, List, Tuple, Union, Dict
 
 
 class StatementTable:
 
     def __init__(self, table: Union[Dict, List]) -> None:
         self.table: Union[Dict, List] = table
+        # lines of every statement type and of every (type, value) pair: the assigned variable,
+        # the called procedure or the control variable, built and sorted once and shared by all queries
+        lines_by_type: Dict[str, List[int]] = {}
+        lines_by_type_and_value: Dict[Tuple[str, str], List[int]] = {}
+        for element in table:
+            other_info: dict = element['other_info']
+            lines_by_type.setdefault(other_info['name'], []).append(element['statement_line'])
+            lines_by_type_and_value.setdefault((other_info['name'], other_info['value']), []).append(
+                element['statement_line'])
+        self.lines_by_type: Dict[str, Tuple[int, ...]] = {key: tuple(sorted(lines))
+                                                          for key, lines in lines_by_type.items()}
+        self.lines_by_type_and_value: Dict[Tuple[str, str], Tuple[int, ...]] = {
+            key: tuple(sorted(lines)) for key, lines in lines_by_type_and_value.items()}
+        self.line_sets_by_type: Dict[str, FrozenSet[int]] = {key: frozenset(lines)
+                                                             for key, lines in lines_by_type.items()}
+        self.line_sets_by_type_and_value: Dict[Tuple[str, str], FrozenSet[int]] = {
+            key: frozenset(lines) for key, lines in lines_by_type_and_value.items()}
 
     def get_other_info(self, statement_line: int) -> dict:
         return self.table[statement_line - 1]['other_info']
 
     def get_statement_line_by_type_name(self, type_name: str) -> List[int]:
-        return [element['statement_line'] for element in self.table if element['other_info']['name'] == type_name]
+        return list(self.lines_by_type.get(type_name, ()))
 
     def get_statement_line_by_type_name_and_value(self, type_name: str, value: str) -> List[int]:
-        return [element['statement_line'] for element in self.table if
-                element['other_info']['name'] == type_name and element['other_info']['value'] == value]
+        return list(self.lines_by_type_and_value.get((type_name, value), ()))
+
+    def get_lines_of_type(self, type_name: str) -> FrozenSet[int]:
+        return self.line_sets_by_type.get(type_name, frozenset())
+
+    def get_lines_of_type_and_value(self, type_name: str, value: str) -> FrozenSet[int]:
+        return self.line_sets_by_type_and_value.get((type_name, value), frozenset())
 
     def get_all_statement_lines(self) -> List[int]:
         return list(range(1, len(self.table) + 1))
@@ -0,0 +1,39 @@
+from typing import Dict, Iterable, List
+
+
+class SymbolTable:
+    # dense integer ids for procedure, variable and constant names, relations store the ids
+    # and translate them back to names only when results are returned
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        for name in names:
+            self.add(name)
+
+    @staticmethod
+    def from_tables(proc_names: Iterable[str], var_names: Iterable[str], constants: Iterable[str]) -> 'SymbolTable':
+        return SymbolTable(list(proc_names) + sorted(var_names) + sorted(constants, key=int))
+
+    def add(self, name: str) -> int:
+        symbol: int = self.ids.get(name, -1)
+        if symbol < 0:
+            symbol = len(self.names)
+            self.ids[name] = symbol
+            self.names.append(name)
+        return symbol
+
+    def get_id(self, name: str) -> int:
+        return self.ids.get(name, -1)
+
+    def get_name(self, symbol: int) -> str:
+        return self.names[symbol]
+
+    def get_names(self, symbols: Iterable[int]) -> List[str]:
+        return [self.names[symbol] for symbol in symbols]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def __len__(self) -> int:
+        return len(self.names)
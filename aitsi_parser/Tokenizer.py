@@ -0,0 +1,93 @@
+import re
+from io import IOBase
+from itertools import islice
+from mmap import mmap
+from operator import length_hint
+from string import ascii_letters, digits
+from typing import Dict, Iterator, List, Match, Optional, Pattern, Tuple, Union
+
+# source text, its bytes (e.g. a memory-mapped file) or a readable stream of either
+Source = Union[str, bytes, mmap, IOBase]
+
+
+class Tokenizer:
+    token_names: Dict[str, str] = {'NAME': 'name', 'INTEGER': 'integer', 'PROCEDURE': 'procedure', 'CALL': 'call',
+                                   'WHILE': 'while', 'IF': 'if', 'THEN': 'then', 'ELSE': 'else',
+                                   'OPEN_BRACKET': '{', 'CLOSE_BRACKET': '}', 'SEMICOLON': ';', 'PLUS': '+',
+                                   'MINUS': '-', 'MULTIPLY': '*', 'ASSIGN': '=', 'OPEN_PARENTHESIS': '(',
+                                   'CLOSE_PARENTHESIS': ')'}
+    # keywords and symbols are looked up by their whole text, so e.g. calls1 stays a name
+    token_kinds: Dict[str, str] = {text: token for token, text in token_names.items()
+                                   if token not in ('NAME', 'INTEGER')}
+    pattern: Pattern = re.compile(r"[A-Za-z][A-Za-z0-9]*|[0-9]+|\S")
+    boundary: Pattern = re.compile(r"\s")
+    byte_boundary: Pattern = re.compile(rb"\s")
+    chunk_size: int = 1 << 16
+
+    def __init__(self, code: Source) -> None:
+        self.code: Source = code
+        # the chunk being tokenized, where it starts in the source and the tokens not yielded yet
+        self.chunk: str = ''
+        self.chunk_offset: int = 0
+        self.chunk_line: int = 1
+        self.texts: List[str] = []
+        self.remaining: Iterator[str] = iter(self.texts)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        token_kinds: Dict[str, str] = self.token_kinds
+        for chunk in self.read_chunks():
+            self.chunk_offset += len(self.chunk)
+            self.chunk_line += self.chunk.count('\n')
+            self.chunk = chunk
+            self.texts = self.pattern.findall(chunk)
+            self.remaining = remaining = iter(self.texts)
+            for text in remaining:
+                token: str = token_kinds.get(text)
+                if token is None:
+                    if text[0] in ascii_letters:
+                        token = 'NAME'
+                    elif text[0] in digits:
+                        token = 'INTEGER'
+                    else:
+                        token = 'UNKNOWN'
+                yield token, text
+
+    def read_chunks(self) -> Iterator[str]:
+        # chunks end at whitespace so no token is split; bytes are decoded one chunk at a time
+        code: Source = self.code
+        if isinstance(code, IOBase):
+            rest: str = ''
+            block = code.read(self.chunk_size)
+            while block:
+                if not isinstance(block, str):
+                    block = block.decode('latin-1')
+                found: Optional[Match] = self.boundary.search(block)
+                if found:
+                    yield rest + block[:found.start()]
+                    rest = block[found.start():]
+                else:
+                    rest += block
+                block = code.read(self.chunk_size)
+            if rest:
+                yield rest
+            return
+        boundary_pattern: Pattern = self.boundary if isinstance(code, str) else self.byte_boundary
+        pos: int = 0
+        while pos < len(code):
+            boundary: Optional[Match] = boundary_pattern.search(code, pos + self.chunk_size)
+            end: int = boundary.start() if boundary else len(code)
+            yield code[pos:end] if isinstance(code, str) else code[pos:end].decode('latin-1')
+            pos = end
+
+    def get_chunk_position(self) -> int:
+        # position of the last yielded token inside the current chunk
+        consumed: int = len(self.texts) - length_hint(self.remaining)
+        for match in islice(self.pattern.finditer(self.chunk), max(consumed - 1, 0), consumed):
+            return match.start()
+        return 0
+
+    def get_offset(self) -> int:
+        return self.chunk_offset + self.get_chunk_position()
+
+    def get_line(self) -> int:
+        return self.chunk_line + self.chunk.count('\n', 0, self.get_chunk_position())
@@ -1,41 +1,25 @@
-from typing import List, Union, Dict
+from typing import Iterable, List
 
+from aitsi_parser.VariableRelationTable import VariableRelationTable
 
-class UsesTable:
 
-    def __init__(self, table: Union[Dict, List]) -> None:
-        self.table: Union[Dict, List] = table
-
-    def get_all_columns(self) -> List[str]:
-        return list(self.table.keys())
-
-    def get_all_index(self) -> List[str]:
-        return list(set(sum([list(self.table[key].keys()) for key in self.table], [])))
+class UsesTable(VariableRelationTable):
+    name: str = "UsesTable"
 
     def get_used(self, stmt: str) -> List[str]:
-        try:
-            return list(self.table[str(stmt)].keys())
-        except Exception:
-            return []
+        return self.get_variables(stmt)
 
     def get_uses(self, var_name: str) -> List[str]:
-        try:
-            return [element for element in self.table if str(var_name) in self.table[element].keys()]
-        except Exception:
-            return []
+        return self.get_statements_and_procedures(var_name)
 
-    def get_all_lines(self) -> List[int]:
-        return [int(key) for key in self.table if str(key).isdigit()]
+    def get_using_lines(self, var_name: str) -> List[int]:
+        return self.get_lines(var_name)
 
-    def is_used(self, stmt: str, var_name: str) -> bool:
-        try:
-            return bool(self.table[stmt][var_name])
-        except Exception:
-            return False
+    def get_using_procedures(self, var_name: str) -> List[str]:
+        return self.get_procedures(var_name)
 
-    def to_string(self) -> None:
-        print("UsesTable:")
-        print(self.table)
+    def get_used_by_lines(self, lines: Iterable[int]) -> List[str]:
+        return self.get_variables_of_lines(lines)
 
-    def to_log(self) -> str:
-        return "UsesTable: \n" + str(self.table)
+    def is_used(self, stmt: str, var_name: str) -> bool:
+        return self.contains(stmt, var_name)
@@ -1,22 +1,24 @@
-from typing import List, Union, Dict
+from typing import AbstractSet, List, Union, Dict
 
 
 class VarTable:
 
     def __init__(self, table: Union[Dict, List]) -> None:
         self.table: Union[Dict, List] = table
+        # hashed by name, so membership tests do not scan the table
+        self.names: Dict[str, dict] = {element['variable_name']: element['other_info'] for element in table}
 
     def get_all_var_name(self) -> List[str]:
-        return [element['variable_name'] for element in self.table]
+        return list(self.names)
+
+    def get_var_names(self) -> AbstractSet[str]:
+        return self.names.keys()
 
     def get_size(self) -> int:
         return len(self.table)
 
     def is_in(self, var_name: str) -> bool:
-        for element in self.table:
-            if element['variable_name'] == var_name:
-                return True
-        return False
+        return var_name in self.names
 
     def to_string(self) -> None:
         print("VarTable:")
@@ -0,0 +1,79 @@
+from typing import FrozenSet, Iterable, List, Optional, Tuple, Union, Dict
+
+from aitsi_parser.CsrRelation import CsrRelation
+from aitsi_parser.SymbolTable import SymbolTable
+
+
+class VariableRelationTable:
+    # the table a relation between statements or procedures and the variables they touch is kept in
+    name: str = "VariableRelationTable"
+
+    def __init__(self, table: Union[Dict, Tuple[CsrRelation, CsrRelation]],
+                 symbols: Optional[SymbolTable] = None) -> None:
+        # statements are keyed by their line, procedures by the id of their name
+        if isinstance(table, tuple):
+            self.statements: CsrRelation = table[0]
+            self.procedures: CsrRelation = table[1]
+        else:
+            symbols = symbols if symbols is not None else SymbolTable()
+            self.statements: CsrRelation = CsrRelation.from_table(
+                {key: value for key, value in table.items() if str(key).isdigit()}, int, symbols.add, symbols)
+            self.procedures: CsrRelation = CsrRelation.from_table(
+                {key: value for key, value in table.items() if not str(key).isdigit()}, symbols.add, symbols.add,
+                symbols)
+        # both partitions answer by statement or procedure and, through the reverse rows, by variable
+        self.all_lines: FrozenSet[int] = frozenset(self.statements.get_all_sources())
+        self.all_procedures: FrozenSet[str] = frozenset(self.procedures.get_names(self.procedures.get_all_sources()))
+        self.all_variables: FrozenSet[str] = frozenset(self.statements.get_names(
+            set(self.statements.get_all_targets()).union(self.procedures.get_all_targets())))
+
+    def get_all_columns(self) -> List[str]:
+        return list(map(str, self.all_lines)) + list(self.all_procedures)
+
+    def get_all_index(self) -> List[str]:
+        return list(self.all_variables)
+
+    def get_variables(self, stmt: str) -> List[str]:
+        try:
+            if str(stmt).isdigit():
+                return self.statements.get_name_targets(int(stmt))
+            return self.procedures.get_name_targets(self.procedures.get_id(stmt))
+        except Exception:
+            return []
+
+    def get_statements_and_procedures(self, var_name: str) -> List[str]:
+        try:
+            variable: int = self.statements.get_id(str(var_name))
+            return list(map(str, self.statements.get_sources(variable))) + self.procedures.get_name_sources(variable)
+        except Exception:
+            return []
+
+    def get_lines(self, var_name: str) -> List[int]:
+        return self.statements.get_sources(self.statements.get_id(str(var_name)))
+
+    def get_procedures(self, var_name: str) -> List[str]:
+        return self.procedures.get_name_sources(self.procedures.get_id(str(var_name)))
+
+    def get_variables_of_lines(self, lines: Iterable[int]) -> List[str]:
+        return self.statements.get_names(self.statements.get_targets_of(lines))
+
+    def contains(self, stmt: str, var_name: str) -> bool:
+        try:
+            if stmt.isdigit():
+                return self.statements.contains(int(stmt), self.statements.get_id(var_name))
+            return self.procedures.contains(self.procedures.get_id(stmt), self.procedures.get_id(var_name))
+        except Exception:
+            return False
+
+    def get_all_lines(self) -> FrozenSet[int]:
+        return self.all_lines
+
+    def get_all_procedures(self) -> FrozenSet[str]:
+        return self.all_procedures
+
+    def to_string(self) -> None:
+        print(self.name + ":")
+        print(self.statements.get_pairs(), self.procedures.get_pairs())
+
+    def to_log(self) -> str:
+        return self.name + ": \n" + str(self.statements.get_pairs()) + str(self.procedures.get_pairs())
@@ -1,10 +1,22 @@
 import argparse
 import json
+import mmap
 import os
-from typing import Dict
+from typing import Dict, List, Optional, Tuple, Type, Union
 
+from aitsi_parser.BuildCache import BuildCache
+from aitsi_parser.IncrementalParser import IncrementalParser
 from aitsi_parser.JsonBuilder import JsonBuilder
+from aitsi_parser.ParallelParser import ParallelParser
 from aitsi_parser.Parser import Parser
+from aitsi_parser.PkbDatabase import PkbDatabase
+from aitsi_parser.PkbFile import PkbFile
+from aitsi_parser.StackParser import StackParser
+from pql.utils.AstCodec import AstCodec
+
+parser_modes: Dict[str, Type[Parser]] = {'stack': StackParser, 'recursive': Parser, 'parallel': ParallelParser,
+                                         'incremental': IncrementalParser}
+pkb_formats: Dict[str, Union[Type[PkbFile], Type[PkbDatabase]]] = {'binary': PkbFile, 'sqlite': PkbDatabase}
 
 
 def export_AST_to_file(json_ast: Dict[str, dict], filename: str = "AST.json") -> None:
@@ -12,34 +24,87 @@ def export_AST_to_file(json_ast: Dict[str, dict], filename: str = "AST.json") ->
         json.dump(json_ast, f, indent=4, sort_keys=True)
 
 
-def read_program_from_file(filename: str = "code_short.txt") -> Parser:
-    with open(filename) as g:
-        _parser: Parser = Parser(g.read(), filename)
+def read_program_from_file(filename: str = "code_short.txt", parser_mode: str = "stack") -> Parser:
+    with open(filename, 'rb') as g:
+        try:
+            code: Union[bytes, mmap.mmap] = mmap.mmap(g.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):  # empty files and pipes cannot be mapped
+            code = g.read()
+        _parser: Parser = parser_modes[parser_mode](code, filename)
         return _parser
 
 
 def main(simple_file_path: str = "code_short.txt", tree_output: str = "AST.json",
-         output_directory: str = "test") -> str:
-    parser: Parser = read_program_from_file(simple_file_path)
+         output_directory: str = "test", parser_mode: str = "stack", use_cache: bool = True,
+         pretty_ast: bool = False, table_format: str = "binary") -> str:
+    return build(simple_file_path, tree_output, output_directory, parser_mode, use_cache, pretty_ast, table_format)[0]
+
+
+def build(simple_file_path: str = "code_short.txt", tree_output: str = "AST.json",
+          output_directory: str = "test", parser_mode: str = "stack", use_cache: bool = True,
+          pretty_ast: bool = False, table_format: str = "binary") -> Tuple[str, Optional[Parser]]:
+    # the parser is only returned when it ran, a cached build leaves it empty
+    parser: Parser = read_program_from_file(simple_file_path, parser_mode)
+    path: str = get_output_path(simple_file_path, output_directory)
+    key: str = BuildCache.get_key(parser.code, get_build_options(pretty_ast, table_format))
+    if use_cache and BuildCache.is_up_to_date(path, key, get_output_files(tree_output, pretty_ast, table_format)):
+        return path, None
     parser.program()
+    save_tables(parser, path, tree_output, key, pretty_ast, table_format)
+    return path, parser
+
+
+def update(parser: IncrementalParser, simple_file_path: str = "code_short.txt", tree_output: str = "AST.json",
+           output_directory: str = "test", pretty_ast: bool = False, table_format: str = "binary") -> str:
+    """
+        Rebuild after an edit of the source: only the procedures whose text changed are parsed again, but the
+        whole file is still read and hashed and the PKB and the other output files are written again in full.
+    """
+    with open(simple_file_path, 'rb') as g:
+        parser.update(g.read())
+    path: str = get_output_path(simple_file_path, output_directory)
+    save_tables(parser, path, tree_output, BuildCache.get_key(parser.code, get_build_options(pretty_ast, table_format)),
+                pretty_ast, table_format)
+    return path
+
+
+def get_output_path(simple_file_path: str, output_directory: str) -> str:
     dirname, filename = os.path.split(os.path.abspath(__file__))
-    path: str = os.path.join(dirname, "database/", output_directory, os.path.basename(simple_file_path).split('.')[0],
-                             "")
+    return os.path.join(dirname, "database/", output_directory, os.path.basename(simple_file_path).split('.')[0], "")
+
+
+def get_build_options(pretty_ast: bool, table_format: str) -> str:
+    return table_format + (" pretty" if pretty_ast else "")
+
+
+def get_output_files(tree_output: str, pretty_ast: bool, table_format: str) -> List[str]:
+    if table_format in pkb_formats:
+        return [pkb_formats[table_format].filename] + ([tree_output] if pretty_ast else [])
+    return [tree_output] + list(JsonBuilder.table_files.values())
+
+
+def save_tables(parser: Parser, path: str, tree_output: str, key: str, pretty_ast: bool = False,
+                table_format: str = "binary") -> None:
     os.makedirs(path, exist_ok=True)
-    export_AST_to_file(parser.get_node_json(), path + tree_output)
-    JsonBuilder.save_table_to_json_file([{'variable_name': key, 'other_info': {}} for key in parser.var_table],
-                                        path + "VarTable.json")
-    JsonBuilder.save_table_to_json_file(parser.proc_table, path + "ProcTable.json")
-    JsonBuilder.save_table_to_json_file(parser.statement_table, path + "StatementTable.json")
-    JsonBuilder.save_table_to_json_file(parser.const_table, path + "ConstTable.json")
-    JsonBuilder.save_table_to_json_file(parser.follows_table, path + "FollowsTable.json")
-    JsonBuilder.save_table_to_json_file(parser.parent_table, path + "ParentTable.json")
-    JsonBuilder.save_table_to_json_file(parser.calls_table, path + "CallsTable.json")
-    JsonBuilder.save_table_to_json_file(parser.next_table, path + "NextTable.json")
-    JsonBuilder.save_table_to_json_file(parser.mod_table, path + "ModifiesTable.json")
-    JsonBuilder.save_table_to_json_file(parser.uses_table, path + "UsesTable.json")
+    # a build interrupted half way must not look up to date
+    BuildCache.invalidate(path)
+    tables: Dict[str, Union[Dict, List]] = parser.get_tables()
+    # files of the other format are removed so PQL never reads a stale PKB
+    for stale_file in [PkbFile.filename, PkbDatabase.filename, tree_output] + list(JsonBuilder.table_files.values()):
+        if stale_file not in get_output_files(tree_output, pretty_ast, table_format) \
+                and os.path.isfile(path + stale_file):
+            os.remove(path + stale_file)
+    if pretty_ast:
+        export_AST_to_file(parser.get_node_json(), path + tree_output)
+    if table_format in pkb_formats:
+        pkb_formats[table_format].save_pkb(path + pkb_formats[table_format].filename, parser.root, tables)
+    else:
+        if not pretty_ast:
+            AstCodec.save(parser.root, path + tree_output)
+        for name, table_file in JsonBuilder.table_files.items():
+            JsonBuilder.save_table_to_json_file(tables[name], path + table_file)
     # todo - dodać resztę tabelek jak będą :*
-    return path
+    BuildCache.save(path, key, get_output_files(tree_output, pretty_ast, table_format))
 
 
 if __name__ == '__main__':
@@ -47,8 +112,13 @@ if __name__ == '__main__':
     arg_parser.add_argument("--i", default="code_short.txt", type=str, help="Input file with program")
     arg_parser.add_argument("--o", default="AST.json", type=str, help="Output file for AST json ")
     arg_parser.add_argument("--d", default="test", type=str, help="Name of output directory")
+    arg_parser.add_argument("--m", default="stack", choices=parser_modes.keys(), help="Parser mode")
+    arg_parser.add_argument("--r", action="store_true", help="Rebuild even if the cached build is up to date")
+    arg_parser.add_argument("--p", action="store_true", help="Write the AST as indented JSON for debugging")
+    arg_parser.add_argument("--f", default="binary", choices=list(pkb_formats) + ["json"],
+                            help="Format of the PKB tables")
     args: argparse.Namespace = arg_parser.parse_args()
     input_filename: str = args.i
     tree_filename: str = args.o
     output_filename: str = args.d
-    main(input_filename, tree_filename, output_filename)
+    main(input_filename, tree_filename, output_filename, args.m, not args.r, args.p, args.f)
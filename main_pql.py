@@ -1,27 +1,43 @@
 import argparse
 import json
-from typing import Dict, Union
+import os
+import sqlite3
+from functools import partial
+from typing import Dict, List, Mapping, Optional, Tuple, Type, Union
 
 from aitsi_parser.CallsTable import CallsTable
 from aitsi_parser.ConstTable import ConstTable
+from aitsi_parser.CsrRelation import CsrRelation
 from aitsi_parser.FollowsTable import FollowsTable
+from aitsi_parser.JsonBuilder import JsonBuilder
 from aitsi_parser.ModifiesTable import ModifiesTable
 from aitsi_parser.NextTable import NextTable
+from aitsi_parser.Parser import Parser
 from aitsi_parser.ParentTable import ParentTable
+from aitsi_parser.PkbDatabase import PkbDatabase
+from aitsi_parser.PkbFile import PkbFile, Section
 from aitsi_parser.ProcTable import ProcTable
 from aitsi_parser.StatementTable import StatementTable
+from aitsi_parser.SymbolTable import SymbolTable
 from aitsi_parser.UsesTable import UsesTable
 from aitsi_parser.VarTable import VarTable
+from pql.CompactNode import AstNode, CompactNode
 from pql.Node import Node
 from pql.QueryEvaluator import QueryEvaluator
 from pql.QueryProcessor import QueryProcessor
+from pql.utils.AstCodec import AstCodec
 from pql.utils.JsonReader import JsonReader
+from pql.utils.LazyDict import LazyDict
 
+Table = Union[VarTable, ProcTable, UsesTable, ParentTable, ModifiesTable, FollowsTable, CallsTable, StatementTable,
+              ConstTable, NextTable]
+table_classes: Dict[str, Type[Table]] = {'var': VarTable, 'proc': ProcTable, 'uses': UsesTable, 'parent': ParentTable,
+                                         'modifies': ModifiesTable, 'follows': FollowsTable, 'calls': CallsTable,
+                                         'statement': StatementTable, 'const': ConstTable, 'next': NextTable}
 
-def load_ast_from_file(filename: str) -> Node:
-    with open(filename) as g:
-        loaded_node: Node = Node.Schema().loads(g.read())
-        return loaded_node
+
+def load_ast_from_file(filename: str, node_class: Type[AstNode] = Node) -> AstNode:
+    return AstCodec.load(filename, node_class)
 
 
 def load_query_from_file(filename: str) -> str:
@@ -36,55 +52,73 @@ def export_query_tree_to_file(query_json_tree: Dict[str, dict], filename: str =
 
 
 class PQL:
-    def __init__(self, tables_directory_path: str = "database/test/code_short", input_ast_filename: str = "AST.json"):
-        self.ast_node: Node = load_ast_from_file(tables_directory_path + "/" + input_ast_filename)
-        var_table: VarTable = VarTable(JsonReader.read_json_from_file(tables_directory_path + "/VarTable.json"))
-        proc_table: ProcTable = ProcTable(JsonReader.read_json_from_file(tables_directory_path + "/ProcTable.json"))
-        calls_table: CallsTable = CallsTable(
-            JsonReader.read_json_from_file(tables_directory_path + "/CallsTable.json"))
-        modifies_table: ModifiesTable = ModifiesTable(
-            JsonReader.read_json_from_file(tables_directory_path + "/ModifiesTable.json"))
-        parent_table: ParentTable = ParentTable(
-            JsonReader.read_json_from_file(tables_directory_path + "/ParentTable.json"))
-        uses_table: UsesTable = UsesTable(JsonReader.read_json_from_file(tables_directory_path + "/UsesTable.json"))
-        follows_table: FollowsTable = FollowsTable(
-            JsonReader.read_json_from_file(tables_directory_path + "/FollowsTable.json"))
-        statement_table: StatementTable = StatementTable(
-            JsonReader.read_json_from_file(tables_directory_path + "/StatementTable.json"))
-        const_table: ConstTable = ConstTable(
-            JsonReader.read_json_from_file(tables_directory_path + "/ConstTable.json"))
-        next_table: NextTable = NextTable(
-            JsonReader.read_json_from_file(tables_directory_path + "/NextTable.json"))
-        self.all_tables: Dict[str, Union[VarTable,
-                                         ProcTable,
-                                         UsesTable,
-                                         ParentTable,
-                                         ModifiesTable,
-                                         FollowsTable,
-                                         CallsTable,
-                                         StatementTable,
-                                         ConstTable,
-                                         NextTable]] = {'var': var_table,
-                                                        'proc': proc_table,
-                                                        'uses': uses_table,
-                                                        'parent': parent_table,
-                                                        'modifies': modifies_table,
-                                                        'follows': follows_table,
-                                                        'calls': calls_table,
-                                                        'statement': statement_table,
-                                                        'const': const_table,
-                                                        'next': next_table}
+    def __init__(self, tables_directory_path: str = "database/test/code_short", input_ast_filename: str = "AST.json",
+                 compact_ast: bool = True, eager: bool = False, parser: Optional[Parser] = None):
+        self.tables_directory_path: str = tables_directory_path
+        self.input_ast_filename: str = input_ast_filename
+        self.node_class: Type[AstNode] = CompactNode if compact_ast else Node
+        pkb_path: str = os.path.join(tables_directory_path, PkbFile.filename)
+        database_path: str = os.path.join(tables_directory_path, PkbDatabase.filename)
+        # the PKB is opened once, tables and the AST are decoded from it when a query first needs them
+        self.database: Optional[sqlite3.Connection] = None
+        self.sections: Optional[Mapping[str, Section]] = None
+        # a parser that has just run hands its tables and AST over directly, nothing is read from disk
+        self.parser: Optional[Parser] = parser
+        if parser is None and os.path.isfile(pkb_path):
+            self.sections = PkbFile.read(pkb_path)
+        elif parser is None and os.path.isfile(database_path):
+            self.database = PkbDatabase.connect(database_path)
+            self.sections = PkbDatabase.read(self.database)
+        self.ast_node: Optional[AstNode] = parser.root if parser is not None else None
+        self.symbols: Optional[SymbolTable] = None
+        self.all_tables: LazyDict = LazyDict({name: partial(self.load_table, name, table_class)
+                                              for name, table_class in table_classes.items()})
+        if eager:
+            self.all_tables.load_all()
+            self.get_ast_node()
+
+    def load_table(self, name: str, table_class: Type[Table]) -> Table:
+        if name in PkbFile.symbol_relations:
+            return table_class(self.read_table(name, self.get_symbols()), self.get_symbols())
+        return table_class(self.read_table(name))
+
+    def read_table(self, name: str, symbols: Optional[SymbolTable] = None) -> Union[
+            Dict, List, CsrRelation, Tuple[CsrRelation, CsrRelation]]:
+        if self.parser is not None:
+            return self.parser.get_tables()[name]
+        if self.database is not None:
+            return PkbDatabase.load_table(self.database, self.sections, name, symbols)
+        if self.sections is not None:
+            return PkbFile.load_table(self.sections, name, symbols)
+        return JsonReader.read_json_from_file(self.tables_directory_path + "/" + JsonBuilder.table_files[name])
+
+    def get_symbols(self) -> SymbolTable:
+        # the catalog comes from the PKB or the parser, tables read from JSON fill an empty one as they are built
+        if self.symbols is None and self.parser is not None:
+            self.symbols = self.parser.get_symbols()
+        elif self.symbols is None:
+            self.symbols = PkbFile.load_symbols(self.sections) if self.sections is not None else SymbolTable()
+        return self.symbols
+
+    def get_ast_node(self) -> AstNode:
+        if self.ast_node is None:
+            if self.sections is not None:
+                self.ast_node = PkbFile.load_ast(self.sections, self.node_class)
+            else:
+                self.ast_node = load_ast_from_file(self.tables_directory_path + "/" + self.input_ast_filename,
+                                                   self.node_class)
+        return self.ast_node
 
     def main(self, query: str, output_query_filename: str = "pql_query_tree.json", save_to_file: bool = False) -> str:
-        query_processor: QueryProcessor = QueryProcessor(self.all_tables['proc'].get_all_proc_name(),
-                                                         self.all_tables['var'].get_all_var_name(),
+        query_processor: QueryProcessor = QueryProcessor(self.all_tables['proc'].get_proc_names(),
+                                                         self.all_tables['var'].get_var_names(),
                                                          self.all_tables['statement'].get_size())
         try:
             query_processor.generate_query_tree(query)
         except Exception as e:
             return str(e)
         query_tree: Dict[str, dict] = query_processor.get_node_json()
-        query_evaluator: QueryEvaluator = QueryEvaluator(self.all_tables, self.ast_node)
+        query_evaluator: QueryEvaluator = QueryEvaluator(self.all_tables, self.get_ast_node)
         try:
             response = query_evaluator.evaluate_query(query_processor.root)
         except Exception as e:
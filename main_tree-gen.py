@@ -4,6 +4,8 @@ import json
 from anytree.exporter import UniqueDotExporter
 from anytree.importer import DictImporter
 
+from pql.utils.AstCodec import AstCodec
+
 importer = DictImporter()
 
 
@@ -29,8 +31,7 @@ if __name__ == '__main__':
     input_filename: str = args.i
     output_filename: str = args.o
 
-    with open(input_filename) as json_file:
-        data = json.load(json_file)
+    data = AstCodec.to_dict(AstCodec.load(input_filename))
 
     new_json = json.loads(json.dumps(data), object_hook=remove_dots)
 
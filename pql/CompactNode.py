@@ -0,0 +1,57 @@
+import sys
+from typing import Dict, List, Tuple, Union
+
+from pql.Node import Node
+
+
+class CompactNode:
+    __slots__ = ('type_code', 'value', 'line', 'children')
+    node_types: List[str] = ['PROGRAM', 'PROCEDURE', 'STMT_LIST', 'ASSIGN', 'WHILE', 'IF', 'CALL', 'NAME', 'INTEGER',
+                             'PLUS', 'MINUS', 'MULTIPLY']
+    type_codes: Dict[str, int] = {node_type: code for code, node_type in enumerate(node_types)}
+
+    def __init__(self, node_type: str = '', value: str = '', line: int = 0,
+                 children: Tuple['CompactNode', ...] = ()) -> None:
+        self.type_code: int = self.get_type_code(node_type)
+        self.value: str = sys.intern(value)
+        self.line: int = line
+        self.children: Tuple[CompactNode, ...] = children
+
+    @property
+    def node_type(self) -> str:
+        return self.node_types[self.type_code]
+
+    @staticmethod
+    def get_type_code(node_type: str) -> int:
+        code: int = CompactNode.type_codes.get(node_type, -1)
+        if code < 0:
+            code = CompactNode.type_codes[node_type] = len(CompactNode.node_types)
+            CompactNode.node_types.append(node_type)
+        return code
+
+    @staticmethod
+    def from_node(root: Node) -> 'CompactNode':
+        compact_root: CompactNode = CompactNode(root.node_type, root.value, root.line)
+        stack: List[Tuple[Node, CompactNode]] = [(root, compact_root)]
+        while stack:
+            node, compact_node = stack.pop()
+            if node.children:
+                compact_node.children = tuple(CompactNode(child.node_type, child.value, child.line)
+                                              for child in node.children)
+                stack.extend(zip(node.children, compact_node.children))
+        return compact_root
+
+    def to_node(self) -> Node:
+        root: Node = Node(self.node_type, self.value, self.line)
+        stack: List[Tuple[CompactNode, Node]] = [(self, root)]
+        while stack:
+            compact_node, node = stack.pop()
+            node.children = [Node(child.node_type, child.value, child.line) for child in compact_node.children]
+            stack.extend(zip(compact_node.children, node.children))
+        return root
+
+    def __repr__(self) -> str:
+        return "TYPE:" + self.node_type + "\t VALUE:" + self.value
+
+
+AstNode = Union[Node, CompactNode]
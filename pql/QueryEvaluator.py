@@ -1,5 +1,5 @@
 import itertools
-from typing import List, Union, Dict, Tuple, Set
+from typing import Callable, List, Union, Dict, Tuple, Set
 
 from aitsi_parser.CallsTable import CallsTable
 from aitsi_parser.ConstTable import ConstTable
@@ -11,6 +11,7 @@ from aitsi_parser.ProcTable import ProcTable
 from aitsi_parser.StatementTable import StatementTable
 from aitsi_parser.UsesTable import UsesTable
 from aitsi_parser.VarTable import VarTable
+from pql.CompactNode import AstNode
 from pql.Graph import Graph
 from pql.Node import Node
 from pql.ResultsTable import ResultsTable
@@ -26,6 +27,7 @@ from pql.relations.ParentTRelation import ParentTRelation
 from pql.relations.Pattern import Pattern
 from pql.relations.UsesRelation import UsesRelation
 from pql.relations.With import With
+from pql.utils.LazyDict import LazyDict
 
 
 class QueryEvaluator:
@@ -41,8 +43,8 @@ class QueryEvaluator:
                                               StatementTable,
                                               ConstTable,
                                               NextTable]],
-                 ast_node: Node) -> None:
-        self.ast_node = ast_node
+                 ast_loader: Callable[[], AstNode]) -> None:
+        self.ast_loader: Callable[[], AstNode] = ast_loader
         self.all_tables: Dict[str, Union[VarTable,
                                          ProcTable,
                                          UsesTable,
@@ -95,26 +97,25 @@ class QueryEvaluator:
             'CALLST': 9,
             'NEXTT': 10,
         }
-        self.relation: Dict[str, Union[
-            ModifiesRelation, FollowsRelation, FollowsTRelation, ParentRelation, ParentTRelation, UsesRelation,
-            NextRelation, NextTRelation, CallsRelation, CallsTRelation, Pattern, With]] = {
-            'MODIFIES': ModifiesRelation(self.all_tables['modifies'], self.all_tables['var'],
+        # relations, and the tables behind them, are only built for clauses that appear in the query
+        self.relation: LazyDict = LazyDict({
+            'MODIFIES': lambda: ModifiesRelation(self.all_tables['modifies'], self.all_tables['var'],
+                                                 self.all_tables['statement'], self.all_tables['proc']),
+            'USES': lambda: UsesRelation(self.all_tables['uses'], self.all_tables['var'],
                                          self.all_tables['statement'], self.all_tables['proc']),
-            'USES': UsesRelation(self.all_tables['uses'], self.all_tables['var'],
-                                 self.all_tables['statement'], self.all_tables['proc']),
-            'PARENT': ParentRelation(self.all_tables['parent'], self.all_tables['statement']),
-            'PARENTT': ParentTRelation(self.all_tables['parent'], self.all_tables['statement']),
-            'FOLLOWS': FollowsRelation(self.all_tables['follows'], self.all_tables['statement']),
-            'FOLLOWST': FollowsTRelation(self.all_tables['follows'], self.all_tables['statement']),
-            'CALLS': CallsRelation(self.all_tables['calls'], self.all_tables['var'], self.all_tables['statement'],
-                                   self.all_tables['proc']),
-            'CALLST': CallsTRelation(self.all_tables['calls'], self.all_tables['var'], self.all_tables['statement'],
-                                     self.all_tables['proc']),
-            'NEXT': NextRelation(self.all_tables['next'], self.all_tables['statement']),
-            'NEXTT': NextTRelation(self.all_tables['next'], self.all_tables['statement']),
-            'PATTERN': Pattern(ast_node, self.all_tables['statement']),
-            'WITH': With(self.all_tables)
-        }
+            'PARENT': lambda: ParentRelation(self.all_tables['parent'], self.all_tables['statement']),
+            'PARENTT': lambda: ParentTRelation(self.all_tables['parent'], self.all_tables['statement']),
+            'FOLLOWS': lambda: FollowsRelation(self.all_tables['follows'], self.all_tables['statement']),
+            'FOLLOWST': lambda: FollowsTRelation(self.all_tables['follows'], self.all_tables['statement']),
+            'CALLS': lambda: CallsRelation(self.all_tables['calls'], self.all_tables['var'],
+                                           self.all_tables['statement'], self.all_tables['proc']),
+            'CALLST': lambda: CallsTRelation(self.all_tables['calls'], self.all_tables['var'],
+                                             self.all_tables['statement'], self.all_tables['proc']),
+            'NEXT': lambda: NextRelation(self.all_tables['next'], self.all_tables['statement']),
+            'NEXTT': lambda: NextTRelation(self.all_tables['next'], self.all_tables['statement']),
+            'PATTERN': lambda: Pattern(self.ast_loader(), self.all_tables['statement']),
+            'WITH': lambda: With(self.all_tables)
+        })
 
     def evaluate_query(self, pql_ast_tree: Node) -> str:
         for node in pql_ast_tree.children:
@@ -254,13 +255,21 @@ class QueryEvaluator:
                         relation_index = f"{node_type}_{first_argument_value[0]}_{second_argument_value[0]}"
                         first_relation_result: Set[int] = set()
                         second_relation_result: Set[int] = set()
-                        for first_argument in first_argument_value[1]:
-                            for second_argument in second_argument_value[1]:
-                                result: bool = self.relation[node_type].value_from_set_and_value_from_set(
-                                    str(first_argument), str(second_argument))
-                                if result:
-                                    first_relation_result.add(first_argument)
-                                    second_relation_result.add(second_argument)
+                        if hasattr(self.relation[node_type], 'value_from_sets_and_value_from_sets'):
+                            # relations with a bulk walk answer both sets at once instead of every pair
+                            first_result, second_result = \
+                                self.relation[node_type].value_from_sets_and_value_from_sets(
+                                    first_argument_value[1], second_argument_value[1])
+                            first_relation_result.update(first_result)
+                            second_relation_result.update(second_result)
+                        else:
+                            for first_argument in first_argument_value[1]:
+                                for second_argument in second_argument_value[1]:
+                                    result: bool = self.relation[node_type].value_from_set_and_value_from_set(
+                                        str(first_argument), str(second_argument))
+                                    if result:
+                                        first_relation_result.add(first_argument)
+                                        second_relation_result.add(second_argument)
                         self.results_table.update_results(relation_index,
                                                           first_argument_value[0],
                                                           first_relation_result)
@@ -1,6 +1,6 @@
 import json
 import re
-from typing import Tuple, Dict, List
+from typing import AbstractSet, Tuple, Dict, List
 
 from pql.Node import Node
 
@@ -29,15 +29,15 @@ class QueryProcessor:
                          (r'\s*[A-Za-z]+[A-Za-z0-9\#]*', 'IDENT'),
                          (r'\s*[0-9]+', 'INTEGER'), (r'\s*,', 'COMMA'), (r'\s*\.', 'DOT')]
 
-    def __init__(self, proc_names: List[str], var_names: List[str], max_line_in_code: int) -> None:
+    def __init__(self, proc_names: AbstractSet[str], var_names: AbstractSet[str], max_line_in_code: int) -> None:
         self.pos: int = 0
         self.query: str = None
         self.prev_token: Tuple[str, str] = ('', '')
         self.next_token: Tuple[str, str] = ('', '')
         self.root: Node = Node("QUERY", "query")
         self.declaration_dict: Dict[str, str] = {}
-        self.proc_names: List[str] = proc_names
-        self.var_names: List[str] = var_names
+        self.proc_names: AbstractSet[str] = proc_names
+        self.var_names: AbstractSet[str] = var_names
         self.max_line_in_code: int = max_line_in_code
         self.select: str = ''
 
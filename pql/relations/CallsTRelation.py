@@ -1,4 +1,4 @@
-from typing import Tuple, List, Set
+from typing import Tuple, List
 
 from aitsi_parser.CallsTable import CallsTable
 from aitsi_parser.ProcTable import ProcTable
@@ -17,35 +17,18 @@ class CallsTRelation:
         self.proc_table: ProcTable = proc_table
 
     def value_from_set_and_value_from_set(self, param_first: str, param_second: str) -> bool:
-        if param_first == param_second:
-            return False
-        for procedure in self.calls_table.get_called_from(param_first):
-            if procedure == param_second:
-                return True
-            else:
-                return_value = self.value_from_set_and_value_from_set(procedure, param_second)
-                if return_value == True:
-                    return True
-        return False
+        return self.calls_table.is_calls_t(param_first, param_second)
 
     def value_from_set_and_not_initialized_set(self, param_first: str, param_second: str) -> List[str]:
-        result: List[str] = self.calls_table.get_called_from(param_first)
-        procedures_to_check: Set[str] = set(self.calls_table.get_called_from(param_first))
-        for procedure in procedures_to_check:
-            result.extend(self.value_from_set_and_not_initialized_set(procedure, ''))
-        return list(set(result))
+        return list(self.calls_table.get_called_from_t(param_first))
 
     def value_from_set_and_value_from_query(self, param_first: str, param_second: str) -> bool:
         if param_second == '_':
-            return bool(self.value_from_set_and_not_initialized_set(param_first, ''))
+            return bool(self.calls_table.get_called_from_t(param_first))
         return self.value_from_set_and_value_from_set(param_first, param_second)
 
     def not_initialized_set_and_value_from_set(self, param_first: str, param_second: str) -> List[str]:
-        result: List[str] = self.calls_table.get_calls(param_second)
-        procedures_to_check: Set[str] = set(self.calls_table.get_calls(param_second))
-        for procedure in procedures_to_check:
-            result.extend(self.not_initialized_set_and_value_from_set('', procedure))
-        return list(set(result))
+        return list(self.calls_table.get_calls_t(param_second))
 
     def not_initialized_set_and_not_initialized_set(self, param_first: str, param_second: str) -> \
             Tuple[List[str], List[str]]:
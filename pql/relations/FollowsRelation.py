@@ -1,4 +1,4 @@
-from typing import List, Union, Tuple
+from typing import List, Set, Union, Tuple
 
 from aitsi_parser import FollowsTable
 from aitsi_parser.StatementTable import StatementTable
@@ -17,7 +17,7 @@ class FollowsRelation:
     def value_from_set_and_not_initialized_set(self, param_first: str, param_second: str) -> List[int]:
         child_line: Union[int, None] = self.follows_table.get_child(int(param_first))
         if child_line is not None:
-            if param_second == 'STMT' or child_line in self.stmt_table.get_statement_line_by_type_name(param_second):
+            if param_second == 'STMT' or child_line in self.stmt_table.get_lines_of_type(param_second):
                 return [child_line]
             else:
                 return []
@@ -32,7 +32,7 @@ class FollowsRelation:
     def not_initialized_set_and_value_from_set(self, param_first: str, param_second: str) -> List[int]:
         follows_line: Union[int, None] = self.follows_table.get_follows(int(param_second))
         if follows_line is not None:
-            if param_first == 'STMT' or follows_line in self.stmt_table.get_statement_line_by_type_name(param_first):
+            if param_first == 'STMT' or follows_line in self.stmt_table.get_lines_of_type(param_first):
                 return [follows_line]
             else:
                 return []
@@ -43,39 +43,34 @@ class FollowsRelation:
             Tuple[List[int], List[int]]:
         if param_first == 'STMT':
             if param_second == 'STMT':
-                return self.follows_table.get_all_index(), self.follows_table.get_all_columns()
+                return list(self.follows_table.get_all_index()), list(self.follows_table.get_all_columns())
             else:
-                param_second_lines: List[int] = list(
-                    set(self.stmt_table.get_statement_line_by_type_name(param_second)).intersection(
-                        set(self.follows_table.get_all_columns())))
-                return list(filter(lambda line: line is not None, [self.follows_table.get_follows(line) for line in
-                                                                   param_second_lines])), param_second_lines
+                param_second_lines: List[int] = list(self.stmt_table.get_lines_of_type(param_second).intersection(
+                    self.follows_table.get_all_columns()))
+                return self.follows_table.get_follows_of(param_second_lines), param_second_lines
         else:
-            param_first_lines: List[int] = list(
-                set(self.stmt_table.get_statement_line_by_type_name(param_first)).intersection(
-                    set(self.follows_table.get_all_index())))
+            param_first_lines: List[int] = list(self.stmt_table.get_lines_of_type(param_first).intersection(
+                self.follows_table.get_all_index()))
             if param_second == 'STMT':
-                return param_first_lines, list(filter(lambda line: line is not None,
-                                                      [self.follows_table.get_child(line) for line in
-                                                       param_first_lines]))
+                return param_first_lines, self.follows_table.get_children_of(param_first_lines)
             else:
-                param_second_lines: List[int] = list(
-                    set(self.stmt_table.get_statement_line_by_type_name(param_second)).intersection(
-                        set(self.follows_table.get_all_columns())))
+                param_second_lines: Set[int] = self.stmt_table.get_lines_of_type(param_second).intersection(
+                    self.follows_table.get_all_columns())
+                first_lines: Set[int] = set(param_first_lines)
                 return list(filter(lambda line: line is not None, [line for line in param_first_lines if
                                                                    self.follows_table.get_child(
                                                                        line) in param_second_lines])), \
                        list(filter(lambda line: line is not None, [line for line in param_second_lines if
                                                                    self.follows_table.get_follows(
-                                                                       line) in param_first_lines]))
+                                                                       line) in first_lines]))
 
     def not_initialized_set_and_value_from_query(self, param_first: str, param_second: str) -> List[int]:
         if param_second == '_':
             if param_first == 'STMT':
-                return self.follows_table.get_all_index()
+                return list(self.follows_table.get_all_index())
             else:
-                return list(set(self.stmt_table.get_statement_line_by_type_name(param_first)).intersection(
-                    set(self.follows_table.get_all_index())))
+                return list(self.stmt_table.get_lines_of_type(param_first).intersection(
+                    self.follows_table.get_all_index()))
         return self.not_initialized_set_and_value_from_set(param_first, param_second)
 
     def value_from_query_and_value_from_set(self, param_first: str, param_second: str) -> bool:
@@ -86,7 +81,7 @@ class FollowsRelation:
     def value_from_query_and_not_initialized_set(self, param_first: str, param_second: str) -> List[int]:
         if param_first == '_':
             if param_second == 'STMT':
-                return self.follows_table.get_all_columns()
+                return list(self.follows_table.get_all_columns())
             else:
                 lines_numbers: List[int] = self.stmt_table.get_statement_line_by_type_name(param_second)
                 return [line for line in lines_numbers if self.follows_table.get_follows(line) is not None]
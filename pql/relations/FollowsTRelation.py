@@ -1,4 +1,4 @@
-from typing import Union, Tuple, List, Set
+from typing import FrozenSet, Tuple, List
 
 from aitsi_parser.FollowsTable import FollowsTable
 from aitsi_parser.StatementTable import StatementTable
@@ -12,71 +12,41 @@ class FollowsTRelation:
         self.follows_table: FollowsTable = follows_table
 
     def value_from_set_and_value_from_set(self, param_first: str, param_second: str) -> bool:
-        return bool(int(param_second) in self.get_all_lines_in_stmt_lst_after_line(int(param_first)))
+        return self.follows_table.is_follows_t(int(param_first), int(param_second))
 
     def value_from_set_and_not_initialized_set(self, param_first: str, param_second: str) -> List[int]:
         if param_second == 'STMT':
-            pom: List[int] = self.follows_table.get_all_columns()
+            pom: FrozenSet[int] = self.follows_table.get_all_columns()
         else:
-            pom: List[int] = self.stmt_table.get_statement_line_by_type_name(param_second)
+            pom: FrozenSet[int] = self.stmt_table.get_lines_of_type(param_second)
         return list(set(self.get_all_lines_in_stmt_lst_after_line(int(param_first))).intersection(pom))
 
     def value_from_set_and_value_from_query(self, param_first: str, param_second: str) -> bool:
         if param_second == '_':
             return bool(self.follows_table.get_child(int(param_first)))
-        return bool(int(param_second) in self.get_all_lines_in_stmt_lst_after_line(int(param_first)))
+        return self.follows_table.is_follows_t(int(param_first), int(param_second))
 
     def not_initialized_set_and_value_from_set(self, param_first: str, param_second: str) -> List[int]:
         if param_first == 'STMT':
-            pom: List[int] = self.follows_table.get_all_index()
+            pom: FrozenSet[int] = self.follows_table.get_all_index()
         else:
-            pom: List[int] = self.stmt_table.get_statement_line_by_type_name(param_first)
+            pom: FrozenSet[int] = self.stmt_table.get_lines_of_type(param_first)
         return list(set(self.get_all_lines_in_stmt_lst_before_line(int(param_second))).intersection(pom))
 
     def not_initialized_set_and_not_initialized_set(self, param_first: str, param_second: str) -> \
             Tuple[List[int], List[int]]:
-        if param_first == 'STMT':
-            if param_second == 'STMT':
-                return self.follows_table.get_all_index(), self.follows_table.get_all_columns()
-            else:
-                pom_second: List[int] = self.stmt_table.get_statement_line_by_type_name(param_second)
-                result_first: Set[int] = set()
-                result_second: List[int] = []
-                for line in pom_second:
-                    pom: List[int] = self.get_all_lines_in_stmt_lst_before_line(line)
-                    if pom:
-                        result_first.update(pom)
-                        result_second.append(line)
-                return list(result_first), result_second
-        else:
-            pom_first: List[int] = self.stmt_table.get_statement_line_by_type_name(param_first)
-            if param_second == 'STMT':
-                result_first: List[int] = []
-                result_second: Set[int] = set()
-                for line in pom_first:
-                    pom: List[int] = self.get_all_lines_in_stmt_lst_after_line(line)
-                    if pom:
-                        result_first.append(line)
-                        result_second.update(pom)
-                return result_first, list(result_second)
-            else:
-                pom_second: List[int] = self.stmt_table.get_statement_line_by_type_name(param_second)
-                result_first: List[int] = []
-                result_second: Set[int] = set()
-                for line in pom_first:
-                    pom: List[int] = list(
-                        set(self.get_all_lines_in_stmt_lst_after_line(line)).intersection(set(pom_second)))
-                    if pom:
-                        result_first.append(line)
-                        result_second.update(pom)
-                return result_first, list(result_second)
+        if param_first == 'STMT' and param_second == 'STMT':
+            return list(self.follows_table.get_all_index()), list(self.follows_table.get_all_columns())
+        return self.follows_table.get_follows_t_pairs(
+            None if param_first == 'STMT' else self.stmt_table.get_lines_of_type(param_first),
+            None if param_second == 'STMT' else self.stmt_table.get_lines_of_type(param_second))
 
     def not_initialized_set_and_value_from_query(self, param_first: str, param_second: str) -> List[int]:
         if param_second == '_':
             if param_first == 'STMT':
-                pom: List[int] = self.follows_table.get_all_index()
+                pom: List[int] = list(self.follows_table.get_all_index())
             else:
-                pom: List[int] = list(set(self.stmt_table.get_statement_line_by_type_name(param_first)).intersection(
+                pom: List[int] = list(self.stmt_table.get_lines_of_type(param_first).intersection(
                     self.follows_table.get_all_index()))
             return pom
         return self.not_initialized_set_and_value_from_set(param_first, param_second)
@@ -89,9 +59,9 @@ class FollowsTRelation:
     def value_from_query_and_not_initialized_set(self, param_first: str, param_second: str) -> List[int]:
         if param_first == '_':
             if param_second == 'STMT':
-                pom: List[int] = list(map(int, self.follows_table.get_all_columns()))
+                pom: List[int] = list(self.follows_table.get_all_columns())
             else:
-                pom: List[int] = list(set(self.stmt_table.get_statement_line_by_type_name(param_second)).intersection(
+                pom: List[int] = list(self.stmt_table.get_lines_of_type(param_second).intersection(
                     self.follows_table.get_all_columns()))
             return pom
         return self.value_from_set_and_not_initialized_set(param_first, param_second)
@@ -103,20 +73,10 @@ class FollowsTRelation:
             return bool(self.follows_table.get_follows(int(param_second)))
         if param_second == '_':
             return bool(self.follows_table.get_child(int(param_first)))
-        return bool(int(param_second) in self.get_all_lines_in_stmt_lst_after_line(int(param_first)))
+        return self.follows_table.is_follows_t(int(param_first), int(param_second))
 
     def get_all_lines_in_stmt_lst_before_line(self, line_number: int) -> List[int]:
-        pom: Union[int, None] = self.follows_table.get_follows(int(line_number))
-        results: List[int] = []
-        while pom is not None:
-            results.append(pom)
-            pom = self.follows_table.get_follows(pom)
-        return results
+        return self.follows_table.get_all_before(int(line_number))
 
     def get_all_lines_in_stmt_lst_after_line(self, line_number: int) -> List[int]:
-        pom: Union[int, None] = self.follows_table.get_child(int(line_number))
-        results: List[int] = []
-        while pom is not None:
-            results.append(pom)
-            pom = self.follows_table.get_child(pom)
-        return results
+        return self.follows_table.get_all_after(int(line_number))
@@ -1,4 +1,4 @@
-from typing import Union, List, Set, Tuple
+from typing import Union, List, Tuple
 
 from aitsi_parser.ModifiesTable import ModifiesTable
 from aitsi_parser.ProcTable import ProcTable
@@ -30,54 +30,34 @@ class ModifiesRelation:
     def not_initialized_set_and_value_from_set(self, param_first: str, param_second: str) -> Union[
         List[str], List[int]]:
         if param_first == 'PROCEDURE':
-            return [value for value in self.proc_table.get_all_proc_name() if
-                    self.modifies_table.is_modified(str(value), str(param_second))]
+            return self.modifies_table.get_modifying_procedures(str(param_second))
         if param_first == 'STMT':
-            return [value for value in self.stmt_table.get_all_statement_lines() if
-                    self.modifies_table.is_modified(str(value), str(param_second))]
-        return [value for value in self.stmt_table.get_statement_line_by_type_name(param_first) if
-                self.modifies_table.is_modified(str(value), str(param_second))]
+            return self.modifies_table.get_modifying_lines(str(param_second))
+        return list(self.stmt_table.get_lines_of_type(param_first).intersection(
+            self.modifies_table.get_modifying_lines(str(param_second))))
 
     def not_initialized_set_and_not_initialized_set(self, param_first: str, param_second: str) -> \
             Union[Tuple[List[str], List[str]], Tuple[List[int], List[str]]]:
         if param_first == 'PROCEDURE':
-            return list(set(self.proc_table.get_all_proc_name())
-                        .intersection(self.modifies_table.get_all_columns())), \
-                   self.modifies_table.get_all_index()
-        else:
-            if param_first == 'STMT':
-                return list(set(self.stmt_table.get_all_statement_lines())
-                    .intersection(
-                    [int(value) for value in self.modifies_table.get_all_columns() if str(value).isdigit()])), \
-                       self.modifies_table.get_all_index()
-            else:
-                lines: List[int] = list(set(self.stmt_table.get_statement_line_by_type_name(param_first))
-                    .intersection(
-                    [int(value) for value in self.modifies_table.get_all_columns() if str(value).isdigit()]))
-                var_name: Set[str] = set()
-                for line in lines:
-                    var_name.update(self.modifies_table.get_modified(line))
-                return lines, list(var_name)
+            return list(self.modifies_table.get_all_procedures()), self.modifies_table.get_all_index()
+        if param_first == 'STMT':
+            return list(self.modifies_table.get_all_lines()), self.modifies_table.get_all_index()
+        lines: List[int] = list(self.stmt_table.get_lines_of_type(param_first).intersection(
+            self.modifies_table.get_all_lines()))
+        return lines, self.modifies_table.get_modified_by_lines(lines)
 
     def not_initialized_set_and_value_from_query(self, param_first: str, param_second: str) -> Union[
         List[str], List[int]]:
         if param_first == 'PROCEDURE':
             if param_second == '_':
-                return list(set(self.proc_table.get_all_proc_name())
-                            .intersection(self.modifies_table.get_all_columns()))
-            return [value for value in self.proc_table.get_all_proc_name() if
-                    self.modifies_table.is_modified(str(value), str(param_second))]
+                return list(self.modifies_table.get_all_procedures())
+            return self.modifies_table.get_modifying_procedures(str(param_second))
         if param_second == '_':
             if param_first == 'STMT':
-                return list(set(map(str, self.stmt_table.get_all_statement_lines()))
-                            .intersection(self.modifies_table.get_all_columns()))
-            return list(set(map(str, self.stmt_table.get_statement_line_by_type_name(param_first)))
-                        .intersection(self.modifies_table.get_all_columns()))
-        if param_first == 'STMT':
-            return [value for value in self.stmt_table.get_all_statement_lines() if
-                    self.modifies_table.is_modified(str(value), str(param_second))]
-        return [value for value in self.stmt_table.get_statement_line_by_type_name(param_first) if
-                self.modifies_table.is_modified(str(value), str(param_second))]
+                return list(map(str, self.modifies_table.get_all_lines()))
+            return list(map(str, self.stmt_table.get_lines_of_type(param_first).intersection(
+                self.modifies_table.get_all_lines())))
+        return self.not_initialized_set_and_value_from_set(param_first, param_second)
 
     def value_from_query_and_value_from_set(self, param_first: str, param_second: str) -> bool:
         if param_first == '_':
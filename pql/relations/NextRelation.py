@@ -26,12 +26,12 @@ class NextRelation:
         return self.next_table.get_previous(int(param_second))
 
     def not_initialized_set_and_not_initialized_set(self, param_first: str, param_second: str) -> \
-            Tuple[List[str], List[str]]:
-        return self.next_table.get_all_next(), self.next_table.get_all_previous()
+            Tuple[List[int], List[int]]:
+        return list(self.next_table.get_all_next()), list(self.next_table.get_all_previous())
 
     def not_initialized_set_and_value_from_query(self, param_first: str, param_second: str) -> List[int]:
         if param_second == '_':
-            return list(map(int, self.next_table.get_all_next()))
+            return list(self.next_table.get_all_next())
         return self.next_table.get_previous(int(param_second))
 
     def value_from_query_and_value_from_set(self, param_first: str, param_second: str) -> bool:
@@ -41,7 +41,7 @@ class NextRelation:
 
     def value_from_query_and_not_initialized_set(self, param_first: str, param_second: str) -> List[int]:
         if param_first == '_':
-            return list(map(int, self.next_table.get_all_previous()))
+            return list(self.next_table.get_all_previous())
         return self.next_table.get_next(int(param_first))
 
     def value_from_query_and_value_from_query(self, param_first: str, param_second: str) -> bool:
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Set
+from typing import AbstractSet, List, Tuple
 
 from aitsi_parser.NextTable import NextTable
 from aitsi_parser.StatementTable import StatementTable
@@ -26,12 +26,12 @@ class NextTRelation:
         return self.get_all_lines_in_stmt_lst_previous_line(int(param_second))
 
     def not_initialized_set_and_not_initialized_set(self, param_first: str, param_second: str) -> \
-            Tuple[List[str], List[str]]:
-        return self.next_table.get_all_next(), self.next_table.get_all_previous()
+            Tuple[List[int], List[int]]:
+        return list(self.next_table.get_all_next()), list(self.next_table.get_all_previous())
 
     def not_initialized_set_and_value_from_query(self, param_first: str, param_second: str) -> List[int]:
         if param_second == '_':
-            return list(map(int, self.next_table.get_all_next()))
+            return list(self.next_table.get_all_next())
         return self.get_all_lines_in_stmt_lst_previous_line(int(param_second))
 
     def value_from_query_and_value_from_set(self, param_first: str, param_second: str) -> bool:
@@ -41,7 +41,7 @@ class NextTRelation:
 
     def value_from_query_and_not_initialized_set(self, param_first: str, param_second: str) -> List[int]:
         if param_first == '_':
-            return list(map(int, self.next_table.get_all_previous()))
+            return list(self.next_table.get_all_previous())
         return self.get_all_lines_in_stmt_lst_next_line(int(param_first))
 
     def value_from_query_and_value_from_query(self, param_first: str, param_second: str) -> bool:
@@ -53,42 +53,18 @@ class NextTRelation:
             return bool(self.get_all_lines_in_stmt_lst_next_line(int(param_first)))
         return self.is_in_previous_line(int(param_second), int(param_first))
 
+    def value_from_sets_and_value_from_sets(self, first_values: AbstractSet[int],
+                                            second_values: AbstractSet[int]) -> Tuple[List[int], List[int]]:
+        return self.next_table.get_next_t_pairs(first_values, second_values)
+
     def get_all_lines_in_stmt_lst_previous_line(self, line_number: int) -> List[int]:
-        result: Set[int] = set()
-        previous: List[int] = self.next_table.get_previous(int(line_number))
-        for prev in previous:
-            new_previous: Set[int] = set(self.next_table.get_previous(prev))
-            if not new_previous.issubset(previous):
-                previous.extend(new_previous)
-            result.add(prev)
-        return list(result)
+        return self.next_table.get_previous_t(int(line_number))
 
     def is_in_previous_line(self, line_number: int, check_number: int) -> bool:
-        previous: List[int] = self.next_table.get_previous(int(line_number))
-        for prev in previous:
-            if check_number in previous:
-                return True
-            new_previous: Set[int] = set(self.next_table.get_previous(prev))
-            if not new_previous.issubset(previous):
-                previous.extend(new_previous)
-        return False
+        return self.next_table.is_next_t(int(check_number), int(line_number))
 
     def get_all_lines_in_stmt_lst_next_line(self, line_number: int) -> List[int]:
-        result: Set[int] = set()
-        next_lines: List[int] = self.next_table.get_next(int(line_number))
-        for _next in next_lines:
-            new_next: Set[int] = set(self.next_table.get_next(_next))
-            if not set(new_next).issubset(next_lines):
-                next_lines.extend(new_next)
-            result.add(_next)
-        return list(result)
+        return self.next_table.get_next_t(int(line_number))
 
     def is_in_next_line(self, line_number: int, check_number: int) -> bool:
-        next_lines: List[int] = self.next_table.get_next(int(line_number))
-        for _next in next_lines:
-            if check_number in next_lines:
-                return True
-            new_next: Set[int] = set(self.next_table.get_next(_next))
-            if not set(new_next).issubset(next_lines):
-                next_lines.extend(new_next)
-        return False
+        return self.next_table.is_next_t(int(line_number), int(check_number))
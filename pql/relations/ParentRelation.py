@@ -1,4 +1,4 @@
-from typing import List, Set, Tuple
+from typing import FrozenSet, List, Set, Tuple
 
 from aitsi_parser.ParentTable import ParentTable
 from aitsi_parser.StatementTable import StatementTable
@@ -18,7 +18,7 @@ class ParentRelation:
         if param_second == 'STMT':
             return self.parent_table.get_child(int(param_first))
         return list(set(self.parent_table.get_child(int(param_first)))
-                    .intersection(self.stmt_table.get_statement_line_by_type_name(param_second)))
+                    .intersection(self.stmt_table.get_lines_of_type(param_second)))
 
     def value_from_set_and_value_from_query(self, param_first: str, param_second: str) -> bool:
         if param_second == '_':
@@ -29,32 +29,26 @@ class ParentRelation:
         if param_first == 'STMT':
             return [self.parent_table.get_parent(int(param_second))]
         return list({self.parent_table.get_parent(int(param_second))}
-                    .intersection(self.stmt_table.get_statement_line_by_type_name(param_first)))
+                    .intersection(self.stmt_table.get_lines_of_type(param_first)))
 
     def not_initialized_set_and_not_initialized_set(self, param_first: str, param_second: str) -> \
             Tuple[List[int], List[int]]:
         if param_first == 'STMT':
             if param_second == 'STMT':
-                return self.parent_table.get_all_parents(), self.parent_table.get_all_children()
-            param_second_lines: List[int] = list(
-                set(self.stmt_table.get_statement_line_by_type_name(param_second)).intersection(
-                    set(self.parent_table.get_all_children())))
-            return list(filter(lambda line: line is not None,
-                               [self.parent_table.get_parent(int(line)) for line in param_second_lines])), \
-                   param_second_lines
-        param_first_lines: List[int] = list(set(self.stmt_table.get_statement_line_by_type_name(param_first))
+                return list(self.parent_table.get_all_parents()), list(self.parent_table.get_all_children())
+            param_second_lines: List[int] = list(self.stmt_table.get_lines_of_type(param_second).intersection(
+                self.parent_table.get_all_children()))
+            return self.parent_table.get_parents_of(param_second_lines), param_second_lines
+        param_first_lines: List[int] = list(self.stmt_table.get_lines_of_type(param_first)
                                             .intersection(self.parent_table.get_all_parents()))
         if param_second == 'STMT':
-            result_second: Set[int] = set()
-            for line in param_first_lines:
-                result_second.update(self.parent_table.get_child(line))
-            return param_first_lines, list(result_second)
-        param_second_lines: List[int] = self.stmt_table.get_statement_line_by_type_name(param_second)
+            return param_first_lines, self.parent_table.get_children_of(param_first_lines)
+        param_second_lines: FrozenSet[int] = self.stmt_table.get_lines_of_type(param_second)
         result_first: List[int] = []
         result_second: Set[int] = set()
         for line in param_first_lines:
             pom: List[int] = list(
-                set(self.parent_table.get_child(line)).intersection(set(param_second_lines)))
+                set(self.parent_table.get_child(line)).intersection(param_second_lines))
             if pom:
                 result_first.append(line)
                 result_second.update(pom)
@@ -63,13 +57,13 @@ class ParentRelation:
     def not_initialized_set_and_value_from_query(self, param_first: str, param_second: str) -> List[int]:
         if param_second == '_':
             if param_first == 'STMT':
-                return list(map(int, self.parent_table.get_all_parents()))
-            return list(set(map(int, self.parent_table.get_all_parents()))
-                        .intersection(self.stmt_table.get_statement_line_by_type_name(param_first)))
+                return list(self.parent_table.get_all_parents())
+            return list(self.parent_table.get_all_parents()
+                        .intersection(self.stmt_table.get_lines_of_type(param_first)))
         if param_first == 'STMT':
             return list(filter(lambda line: line is not None, list({self.parent_table.get_parent(int(param_second))})))
         return list({self.parent_table.get_parent(int(param_second))}
-                    .intersection(self.stmt_table.get_statement_line_by_type_name(param_first)))
+                    .intersection(self.stmt_table.get_lines_of_type(param_first)))
 
     def value_from_query_and_value_from_set(self, param_first: str, param_second: str) -> bool:
         if param_first == '_':
@@ -79,13 +73,13 @@ class ParentRelation:
     def value_from_query_and_not_initialized_set(self, param_first: str, param_second: str) -> List[int]:
         if param_first == '_':
             if param_second == 'STMT':
-                return list(map(int, self.parent_table.get_all_children()))
-            return list(set(map(int, self.parent_table.get_all_children()))
-                        .intersection(self.stmt_table.get_statement_line_by_type_name(param_second)))
+                return list(self.parent_table.get_all_children())
+            return list(self.parent_table.get_all_children()
+                        .intersection(self.stmt_table.get_lines_of_type(param_second)))
         if param_second == 'STMT':
             return self.parent_table.get_child(int(param_first))
         return list(set(self.parent_table.get_child(int(param_first)))
-                    .intersection(self.stmt_table.get_statement_line_by_type_name(param_second)))
+                    .intersection(self.stmt_table.get_lines_of_type(param_second)))
 
     def value_from_query_and_value_from_query(self, param_first: str, param_second: str) -> bool:
         if param_first == '_':
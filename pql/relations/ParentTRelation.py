@@ -1,4 +1,4 @@
-from typing import List, Union, Set, Tuple
+from typing import FrozenSet, List, Tuple
 
 from aitsi_parser.ParentTable import ParentTable
 from aitsi_parser.StatementTable import StatementTable
@@ -12,72 +12,41 @@ class ParentTRelation:
         self.stmt_table: StatementTable = stmt_table
 
     def value_from_set_and_value_from_set(self, param_first: str, param_second: str) -> bool:
-        return bool(int(param_second) in self.get_all_lines_in_stmt_lst_child_line(int(param_first)))
+        return self.parent_table.is_parent_t(int(param_first), int(param_second))
 
     def value_from_set_and_not_initialized_set(self, param_first: str, param_second: str) -> List[int]:
         if param_second == 'STMT':
-            pom: List[int] = list(map(int, self.parent_table.get_all_children()))
+            pom: FrozenSet[int] = self.parent_table.get_all_children()
         else:
-            pom: List[int] = self.stmt_table.get_statement_line_by_type_name(param_second)
-        return list(set(self.get_all_lines_in_stmt_lst_child_line(int(param_first))).intersection(pom))
+            pom: FrozenSet[int] = self.stmt_table.get_lines_of_type(param_second)
+        return list(pom.intersection(self.parent_table.get_descendants(int(param_first))))
 
     def value_from_set_and_value_from_query(self, param_first: str, param_second: str) -> bool:
         if param_second == '_':
             return bool(self.parent_table.get_child(int(param_first)))
-        return bool(int(param_second) in self.get_all_lines_in_stmt_lst_child_line(int(param_first)))
+        return self.parent_table.is_parent_t(int(param_first), int(param_second))
 
     def not_initialized_set_and_value_from_set(self, param_first: str, param_second: str) -> List[int]:
         if param_first == 'STMT':
-            pom: List[int] = list(map(int, self.parent_table.get_all_parents()))
+            pom: FrozenSet[int] = self.parent_table.get_all_parents()
         else:
-            pom: List[int] = self.stmt_table.get_statement_line_by_type_name(param_first)
+            pom: FrozenSet[int] = self.stmt_table.get_lines_of_type(param_first)
         return list(set(self.get_all_lines_in_stmt_lst_parent_line(int(param_second))).intersection(pom))
 
     def not_initialized_set_and_not_initialized_set(self, param_first: str, param_second: str) -> \
             Tuple[List[int], List[int]]:
-        if param_first == 'STMT':
-            if param_second == 'STMT':
-                return list(map(int, self.parent_table.get_all_parents())), list(
-                    map(int, self.parent_table.get_all_children()))
-            else:
-                pom_second: List[int] = self.stmt_table.get_statement_line_by_type_name(param_second)
-                result_first: Set[int] = set()
-                result_second: List[int] = []
-                for line in pom_second:
-                    pom: List[int] = self.get_all_lines_in_stmt_lst_parent_line(line)
-                    if pom:
-                        result_first.update(pom)
-                        result_second.append(line)
-                return list(result_first), result_second
-        else:
-            pom_first: List[int] = self.stmt_table.get_statement_line_by_type_name(param_first)
-            if param_second == 'STMT':
-                result_first: List[int] = []
-                result_second: Set[int] = set()
-                for line in pom_first:
-                    pom: List[int] = self.get_all_lines_in_stmt_lst_child_line(line)
-                    if pom:
-                        result_first.append(line)
-                        result_second.update(pom)
-                return result_first, list(result_second)
-            else:
-                pom_second: List[int] = self.stmt_table.get_statement_line_by_type_name(param_second)
-                result_first: List[int] = []
-                result_second: Set[int] = set()
-                for line in pom_first:
-                    pom: List[int] = list(
-                        set(self.get_all_lines_in_stmt_lst_child_line(line)).intersection(set(pom_second)))
-                    if pom:
-                        result_first.append(line)
-                        result_second.update(pom)
-                return result_first, list(result_second)
+        if param_first == 'STMT' and param_second == 'STMT':
+            return list(self.parent_table.get_all_parents()), list(self.parent_table.get_all_children())
+        return self.parent_table.get_parent_t_pairs(
+            None if param_first == 'STMT' else self.stmt_table.get_lines_of_type(param_first),
+            None if param_second == 'STMT' else self.stmt_table.get_lines_of_type(param_second))
 
     def not_initialized_set_and_value_from_query(self, param_first: str, param_second: str) -> List[int]:
         if param_second == '_':
             if param_first == 'STMT':
-                pom: List[int] = list(map(int, self.parent_table.get_all_parents()))
+                pom: List[int] = list(self.parent_table.get_all_parents())
             else:
-                pom: List[int] = list(set(self.stmt_table.get_statement_line_by_type_name(param_first)).intersection(
+                pom: List[int] = list(self.stmt_table.get_lines_of_type(param_first).intersection(
                     self.parent_table.get_all_parents()))
             return pom
         return self.not_initialized_set_and_value_from_set(param_first, param_second)
@@ -90,9 +59,9 @@ class ParentTRelation:
     def value_from_query_and_not_initialized_set(self, param_first: str, param_second: str) -> List[int]:
         if param_first == '_':
             if param_second == 'STMT':
-                pom: List[int] = list(map(int, self.parent_table.get_all_children()))
+                pom: List[int] = list(self.parent_table.get_all_children())
             else:
-                pom: List[int] = list(set(self.stmt_table.get_statement_line_by_type_name(param_second)).intersection(
+                pom: List[int] = list(self.stmt_table.get_lines_of_type(param_second).intersection(
                     self.parent_table.get_all_children()))
             return pom
         return self.value_from_set_and_not_initialized_set(param_first, param_second)
@@ -104,22 +73,10 @@ class ParentTRelation:
             return bool(self.parent_table.get_parent(int(param_second)))
         if param_second == '_':
             return bool(self.parent_table.get_child(int(param_first)))
-        return bool(int(param_second) in self.get_all_lines_in_stmt_lst_child_line(int(param_first)))
+        return self.parent_table.is_parent_t(int(param_first), int(param_second))
 
     def get_all_lines_in_stmt_lst_parent_line(self, line_number: int) -> List[int]:
-        pom: Union[int, None] = self.parent_table.get_parent(int(line_number))
-        results: List[int] = []
-        while pom is not None:
-            results.append(pom)
-            pom = self.parent_table.get_parent(pom)
-        return results
+        return self.parent_table.get_ancestors(int(line_number))
 
     def get_all_lines_in_stmt_lst_child_line(self, line_number: int) -> List[int]:
-        result: Set[int] = set()
-        pom: List[int] = self.parent_table.get_child(int(line_number))
-        for child in pom:
-            new_previous: Set[int] = set(self.parent_table.get_child(child))
-            if not new_previous.issubset(pom):
-                pom.extend(new_previous)
-            result.add(child)
-        return list(result)
+        return list(self.parent_table.get_descendants(int(line_number)))
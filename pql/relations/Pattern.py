@@ -1,13 +1,14 @@
 from typing import Set
 
 from aitsi_parser.StatementTable import StatementTable
+from pql.CompactNode import AstNode
 from pql.Node import Node
 from pql.utils.SearchUtils import SearchUtils
 
 
 class Pattern:
 
-    def __init__(self, ast_node: Node, stmt_table: StatementTable):
+    def __init__(self, ast_node: AstNode, stmt_table: StatementTable):
         self.search: SearchUtils = SearchUtils(ast_node)
         self.stmt_table: StatementTable = stmt_table
 
@@ -19,16 +20,16 @@ class Pattern:
 
     def pattern_while_or_if(self, node: Node) -> Set[int]:
         if node.children[1].node_type in ['VARIABLE', 'EVERYTHING']:
-            return set(self.stmt_table.get_statement_line_by_type_name(node.children[0].node_type))
+            return set(self.stmt_table.get_lines_of_type(node.children[0].node_type))
         else:
-            return set(self.stmt_table.get_statement_line_by_type_name_and_value(node.children[0].node_type,
-                                                                                 node.children[1].value))
+            return set(self.stmt_table.get_lines_of_type_and_value(node.children[0].node_type,
+                                                                   node.children[1].value))
 
     def pattern_assign(self, node: Node) -> Set[int]:
         if node.children[1].node_type in ['VARIABLE', 'EVERYTHING']:
-            result: Set[int] = set(self.stmt_table.get_statement_line_by_type_name(node.children[0].node_type))
+            result: Set[int] = set(self.stmt_table.get_lines_of_type(node.children[0].node_type))
         else:  # pobranie wszystkich lini gdy po lewej stronie rownania jest dana wartosć np. "t"
-            result: Set[int] = set(self.stmt_table.get_statement_line_by_type_name_and_value(
+            result: Set[int] = set(self.stmt_table.get_lines_of_type_and_value(
                 node.children[0].node_type, node.children[1].value))
 
         if result and node.children[2].node_type == "EVERYTHING":
@@ -41,20 +42,20 @@ class Pattern:
             result: Set[int] = set()
             if wild_card:
                 for line in elements:
-                    search_node: Node = self.search.find_node_by_line(line).children[1]
+                    search_node: AstNode = self.search.find_node_by_line(line).children[1]
                     if search_node is not None:
                         if self._expression_part_is_identical(search_node, node_expr.children[0]):
                             result.add(int(line))
             else:
                 for line in elements:
-                    search_node: Node = self.search.find_node_by_line(line).children[1]
+                    search_node: AstNode = self.search.find_node_by_line(line).children[1]
                     if search_node is not None:
                         if self._expression_is_identical(search_node, node_expr):
                             result.add(int(line))
             return result
         return elements
 
-    def _expression_part_is_identical(self, ast: Node, comparing_node: Node) -> bool:
+    def _expression_part_is_identical(self, ast: AstNode, comparing_node: Node) -> bool:
         if comparing_node.equals_expression(ast):
             for index, child in enumerate(ast.children):
                 if not self._expression_part_is_identical(child, comparing_node.children[index]):
@@ -68,7 +69,7 @@ class Pattern:
                     return True
             return False
 
-    def _expression_is_identical(self, ast: Node, comparing_node: Node) -> bool:
+    def _expression_is_identical(self, ast: AstNode, comparing_node: Node) -> bool:
         if comparing_node.equals_expression(ast):
             for index, child in enumerate(ast.children):
                 if not self._expression_is_identical(child, comparing_node.children[index]):
@@ -45,7 +45,7 @@ class With:
                 if int(attr_node.children[1].value) > self.all_tables['statement'].get_size():
                     return set()
             else:
-                if int(attr_node.children[1].value) not in self.all_tables['statement'].get_statement_line_by_type_name(
+                if int(attr_node.children[1].value) not in self.all_tables['statement'].get_lines_of_type(
                         attr_node.children[0].node_type):
                     return set()
             return {attr_node.children[1].value}
@@ -57,7 +57,7 @@ class With:
                 if not self.all_tables['var'].is_in(attr_node.children[1].value):
                     return set()
             else:
-                return set(self.all_tables['statement'].get_statement_line_by_type_name_and_value(
+                return set(self.all_tables['statement'].get_lines_of_type_and_value(
                     attr_node.children[0].node_type,
                     attr_node.children[1].value))
             return {attr_node.children[1].value}
@@ -67,9 +67,7 @@ class With:
                             self.all_tables['statement'].is_in(const)])
             else:
                 return set([const for const in self.all_tables['const'].get_all_constant() if
-                            const in self.all_tables[
-                                'statement'].get_statement_line_by_type_name(
-                                attr_node.children[0].value)])
+                            const in self.all_tables['statement'].get_lines_of_type(attr_node.children[0].value)])
         else:
             if attr_node.children[0].node_type in ['CALL', 'PROCEDURE']:
                 left: Set[str] = set(self.all_tables['proc'].get_all_proc_name())
@@ -0,0 +1,96 @@
+import json
+from typing import Dict, List, Type, Union
+
+from pql.CompactNode import AstNode, CompactNode
+from pql.Node import Node
+
+
+class AstCodec:
+    # nodes are stored in preorder as (type index, value index, line, number of children)
+    format_name: str = "aitsi-ast"
+    format_version: int = 1
+
+    @staticmethod
+    def encode(root: AstNode) -> Dict:
+        types: Dict[str, int] = {}
+        values: Dict[str, int] = {}
+        nodes: List[int] = []
+        stack: List[AstNode] = [root]
+        while stack:
+            node: AstNode = stack.pop()
+            nodes.extend((types.setdefault(node.node_type, len(types)), values.setdefault(node.value, len(values)),
+                          node.line, len(node.children)))
+            stack.extend(reversed(node.children))
+        return {'format': AstCodec.format_name, 'version': AstCodec.format_version, 'types': list(types),
+                'values': list(values), 'nodes': nodes}
+
+    @staticmethod
+    def decode(data: Dict, node_class: Type[AstNode] = Node) -> AstNode:
+        if data.get('format') != AstCodec.format_name or data.get('version') != AstCodec.format_version:
+            raise ValueError("Unsupported AST format")
+        types: List[str] = data['types']
+        values: List[str] = data['values']
+        nodes: List[int] = data['nodes']
+        compact: bool = node_class is CompactNode
+        root: AstNode = None
+        stack: List[List] = []  # (node, its children so far, children still to read)
+        for pos in range(0, len(nodes), 4):
+            node: AstNode = node_class(types[nodes[pos]], values[nodes[pos + 1]], nodes[pos + 2])
+            if stack:
+                stack[-1][1].append(node)
+                stack[-1][2] -= 1
+            else:
+                root = node
+            if nodes[pos + 3]:
+                stack.append([node, [] if compact else node.children, nodes[pos + 3]])
+            while stack and not stack[-1][2]:
+                parent, children, _ = stack.pop()
+                if compact:
+                    parent.children = tuple(children)
+        return root
+
+    @staticmethod
+    def to_dict(root: AstNode) -> Dict[str, dict]:
+        root_dict: Dict = {'node_type': root.node_type, 'value': root.value, 'line': root.line, 'children': []}
+        stack: List = [(root, root_dict)]
+        while stack:
+            node, node_dict = stack.pop()
+            for child in node.children:
+                child_dict: Dict = {'node_type': child.node_type, 'value': child.value, 'line': child.line,
+                                    'children': []}
+                node_dict['children'].append(child_dict)
+                stack.append((child, child_dict))
+        return root_dict
+
+    @staticmethod
+    def from_dict(root_dict: Dict, node_class: Type[AstNode] = Node) -> AstNode:
+        compact: bool = node_class is CompactNode
+        # children are built before their parent so compact nodes can take them as a tuple
+        built: List[AstNode] = []
+        stack: List = [(root_dict, False)]
+        while stack:
+            node_dict, visited = stack.pop()
+            if visited:
+                children: List[AstNode] = built[len(built) - len(node_dict['children']):]
+                del built[len(built) - len(node_dict['children']):]
+                node: AstNode = node_class(node_dict['node_type'], node_dict['value'], node_dict['line'])
+                node.children = tuple(children) if compact else children
+                built.append(node)
+            else:
+                stack.append((node_dict, True))
+                stack.extend((child, False) for child in reversed(node_dict['children']))
+        return built[0]
+
+    @staticmethod
+    def save(root: AstNode, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump(AstCodec.encode(root), f, separators=(',', ':'))
+
+    @staticmethod
+    def load(path: str, node_class: Type[AstNode] = Node) -> AstNode:
+        with open(path) as f:
+            data: Union[Dict, List] = json.load(f)
+        # indented debug exports keep the nested node layout
+        if 'nodes' in data:
+            return AstCodec.decode(data, node_class)
+        return AstCodec.from_dict(data, node_class)
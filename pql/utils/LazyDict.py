@@ -0,0 +1,30 @@
+from typing import Any, Callable, Dict, Iterator, Mapping
+
+
+class LazyDict(Mapping):
+    # values are built by their loader the first time they are looked up
+
+    def __init__(self, loaders: Dict[str, Callable[[], Any]]) -> None:
+        self.loaders: Dict[str, Callable[[], Any]] = loaders
+        self.loaded: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self.loaded[key]
+        except KeyError:
+            value: Any = self.loaders[key]()
+            self.loaded[key] = value
+            return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.loaders)
+
+    def __len__(self) -> int:
+        return len(self.loaders)
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self.loaded
+
+    def load_all(self) -> None:
+        for key in self.loaders:
+            self[key]
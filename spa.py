@@ -1,13 +1,26 @@
 import sys
+from typing import Optional
 
 import main_parser
 import main_pql
+from aitsi_parser.Parser import Parser
+
+
+def analyze(simple_file_path: str, output_directory: Optional[str] = "test", parser_mode: str = "stack",
+            use_cache: bool = True, table_format: str = "binary") -> main_pql.PQL:
+    # queries run on the tables the parser has just built, saving them is optional
+    if output_directory is None:
+        parser: Parser = main_parser.read_program_from_file(simple_file_path, parser_mode)
+        parser.program()
+        return main_pql.PQL(parser=parser)
+    path, parser = main_parser.build(simple_file_path, output_directory=output_directory, parser_mode=parser_mode,
+                                     use_cache=use_cache, table_format=table_format)
+    return main_pql.PQL(path) if parser is None else main_pql.PQL(parser=parser)
 
 
 def main(argv):
-    db_path = main_parser.main(argv[1])
+    pql = analyze(argv[1])
     print("Ready")
-    pql = main_pql.PQL(db_path)
     while True:
         first_line = input()
         second_line = input()
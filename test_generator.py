@@ -5,7 +5,8 @@ from aitsi_parser.ConstTable import ConstTable
 from aitsi_parser.ProcTable import ProcTable
 from aitsi_parser.StatementTable import StatementTable
 from aitsi_parser.VarTable import VarTable
-from pql.utils.JsonReader import JsonReader
+from main_pql import PQL
+from pql.utils.LazyDict import LazyDict
 
 
 class Generator:
@@ -27,11 +28,12 @@ class Generator:
             'Calls': ['procedure'],
             'Calls*': ['procedure'],
         }
-        self.var_table: VarTable = VarTable(JsonReader.read_json_from_file(path_tables + "/VarTable.json"))
-        self.proc_table: ProcTable = ProcTable(JsonReader.read_json_from_file(path_tables + "/ProcTable.json"))
-        self.const_table: ConstTable = ConstTable(JsonReader.read_json_from_file(path_tables + "/ConstTable.json"))
-        self.stmt_table: StatementTable = StatementTable(
-            JsonReader.read_json_from_file(path_tables + "/StatementTable.json"))
+        # the tables are read through PQL, so any format main_parser writes can be used
+        tables: LazyDict = PQL(path_tables).all_tables
+        self.var_table: VarTable = tables['var']
+        self.proc_table: ProcTable = tables['proc']
+        self.const_table: ConstTable = tables['const']
+        self.stmt_table: StatementTable = tables['statement']
 
     def _generate_single_relation(self, relation: str, f):
         for varname in self.arguments_in_relation[relation]:
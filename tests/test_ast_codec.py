@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+import unittest
+
+from aitsi_parser.StackParser import StackParser
+from pql.CompactNode import CompactNode
+from pql.Node import Node
+from pql.utils.AstCodec import AstCodec
+
+
+class AstCodecTest(unittest.TestCase):
+    program: str = ("procedure main {\n  x = (a + 1) * b - 2;\n  while x {\n    if y then {\n      call leaf; }\n"
+                    "    else {\n      x = x - 1; } }\n}\n"
+                    "procedure leaf {\n  y = 1;\n}\n")
+
+    def parse(self, code: str) -> Node:
+        parser: StackParser = StackParser(code, 'program')
+        parser.program()
+        return parser.root
+
+    def test_encode_decode(self) -> None:
+        root: Node = self.parse(self.program)
+        for node_class in (Node, CompactNode):
+            with self.subTest(node_class=node_class.__name__):
+                decoded = AstCodec.decode(AstCodec.encode(root), node_class)
+                self.assertIsInstance(decoded, node_class)
+                self.assertEqual(AstCodec.to_dict(decoded), AstCodec.to_dict(root))
+
+    def test_dict_round_trip(self) -> None:
+        root: Node = self.parse(self.program)
+        for node_class in (Node, CompactNode):
+            with self.subTest(node_class=node_class.__name__):
+                self.assertEqual(AstCodec.to_dict(AstCodec.from_dict(AstCodec.to_dict(root), node_class)),
+                                 AstCodec.to_dict(root))
+
+    def test_save_and_load(self) -> None:
+        root: Node = self.parse(self.program)
+        with tempfile.TemporaryDirectory() as directory:
+            compact_path: str = os.path.join(directory, 'AST.json')
+            AstCodec.save(root, compact_path)
+            pretty_path: str = os.path.join(directory, 'pretty.json')
+            with open(pretty_path, 'w') as f:
+                json.dump(AstCodec.to_dict(root), f, indent=4)
+            for path in (compact_path, pretty_path):
+                with self.subTest(path=os.path.basename(path)):
+                    self.assertEqual(AstCodec.to_dict(AstCodec.load(path)), AstCodec.to_dict(root))
+
+    def test_deep_nesting(self) -> None:
+        depth: int = 5000
+        code: str = "procedure deep {\n" + "while x {\n" * depth + "x = 1; " + "}\n" * depth + "}\n"
+        # nested dicts this deep cannot be compared without recursion, the flat preorder encoding can
+        encoded = AstCodec.encode(self.parse(code))
+        self.assertEqual(len(encoded['nodes']) // 4, 3 + depth * 3 + 3)
+        self.assertEqual(AstCodec.encode(AstCodec.decode(encoded)), encoded)
+        self.assertEqual(AstCodec.encode(AstCodec.from_dict(AstCodec.to_dict(AstCodec.decode(encoded)))), encoded)
+
+    def test_unsupported_format(self) -> None:
+        data = AstCodec.encode(self.parse(self.program))
+        data['version'] = AstCodec.format_version + 1
+        with self.assertRaises(ValueError):
+            AstCodec.decode(data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import main_parser
+from aitsi_parser.BuildCache import BuildCache
+
+
+class BuildCacheTest(unittest.TestCase):
+    program: str = "procedure main {\n  x = 1;\n  call leaf;\n}\nprocedure leaf {\n  y = x;\n}\n"
+
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.source: str = os.path.join(self.directory.name, 'program.txt')
+        self.write_source(self.program)
+        self.output: str = os.path.join(self.directory.name, 'out')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write_source(self, code: str) -> None:
+        with open(self.source, 'w') as f:
+            f.write(code)
+
+    def is_rebuilt(self, **options) -> bool:
+        # an absolute output directory replaces the database directory of the repository
+        path, parser = main_parser.build(self.source, output_directory=self.output, **options)
+        self.assertTrue(os.path.isfile(os.path.join(path, BuildCache.filename)))
+        return parser is not None
+
+    def test_unchanged_source_is_cached(self) -> None:
+        self.assertTrue(self.is_rebuilt())
+        self.assertFalse(self.is_rebuilt())
+        self.assertTrue(self.is_rebuilt(use_cache=False))
+
+    def test_source_change(self) -> None:
+        self.assertTrue(self.is_rebuilt())
+        self.write_source(self.program.replace("y = x;", "y = x + 1;"))
+        self.assertTrue(self.is_rebuilt())
+        self.assertFalse(self.is_rebuilt())
+
+    def test_options_change(self) -> None:
+        self.assertTrue(self.is_rebuilt())
+        self.assertTrue(self.is_rebuilt(pretty_ast=True))
+        self.assertTrue(self.is_rebuilt(table_format="json"))
+        self.assertFalse(self.is_rebuilt(table_format="json"))
+        self.assertTrue(self.is_rebuilt(table_format="sqlite"))
+        self.assertTrue(self.is_rebuilt())
+
+    def test_format_change(self) -> None:
+        self.assertTrue(self.is_rebuilt())
+        with mock.patch.object(BuildCache, 'parser_version', BuildCache.parser_version + '.test'):
+            self.assertTrue(self.is_rebuilt())
+        self.assertTrue(self.is_rebuilt())
+
+    def test_output_changed_or_removed(self) -> None:
+        self.assertTrue(self.is_rebuilt())
+        path: str = main_parser.get_output_path(self.source, self.output)
+        with open(path + 'PKB.bin', 'ab') as f:
+            f.write(b'\0')
+        self.assertTrue(self.is_rebuilt())
+        os.remove(path + 'PKB.bin')
+        self.assertTrue(self.is_rebuilt())
+        self.assertFalse(self.is_rebuilt())
+
+    def test_outputs_checked_by_size_and_mtime(self) -> None:
+        self.assertTrue(self.is_rebuilt())
+        path: str = main_parser.get_output_path(self.source, self.output)
+        with mock.patch.object(BuildCache, 'get_file_digest', side_effect=AssertionError('hashed')):
+            self.assertFalse(self.is_rebuilt())
+        # a rewrite with the same content only costs a hash, a same size change is still caught
+        stat: os.stat_result = os.stat(path + 'PKB.bin')
+        with open(path + 'PKB.bin', 'rb') as f:
+            content: bytes = f.read()
+        os.utime(path + 'PKB.bin', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertFalse(self.is_rebuilt())
+        with open(path + 'PKB.bin', 'wb') as f:
+            f.write(content[:-1] + bytes([content[-1] ^ 1]))
+        os.utime(path + 'PKB.bin', ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+        self.assertTrue(self.is_rebuilt())
+        self.assertFalse(self.is_rebuilt())
+
+    def test_key(self) -> None:
+        key: str = BuildCache.get_key(self.program, 'binary')
+        self.assertEqual(key, BuildCache.get_key(self.program.encode(), 'binary'))
+        self.assertNotEqual(key, BuildCache.get_key(self.program + ' ', 'binary'))
+        self.assertNotEqual(key, BuildCache.get_key(self.program, 'json'))
+
+    def test_invalidate(self) -> None:
+        self.assertTrue(self.is_rebuilt())
+        BuildCache.invalidate(main_parser.get_output_path(self.source, self.output))
+        self.assertTrue(self.is_rebuilt())
+        self.assertFalse(self.is_rebuilt())
+
+
+if __name__ == '__main__':
+    unittest.main()
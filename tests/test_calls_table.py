@@ -0,0 +1,65 @@
+import unittest
+from typing import Dict, Set
+
+from aitsi_parser.CallsTable import CallsTable
+from pql.relations.CallsTRelation import CallsTRelation
+
+
+class CallsTableTest(unittest.TestCase):
+    graphs: Dict[str, Dict[str, Dict[str, int]]] = {
+        'chain': {'a': {'b': 1}, 'b': {'c': 1}},
+        'diamond': {'a': {'b': 1, 'c': 1}, 'b': {'d': 1}, 'c': {'d': 1}},
+        'cycle': {'a': {'b': 1}, 'b': {'a': 1}},
+        'self': {'a': {'a': 1, 'b': 1}},
+        'cycle_with_tails': {'main': {'a': 1}, 'a': {'b': 1}, 'b': {'c': 1, 'leaf': 1}, 'c': {'a': 1},
+                             'other': {'c': 1}},
+        'nested_cycles': {'a': {'b': 1}, 'b': {'a': 1, 'c': 1}, 'c': {'d': 1}, 'd': {'c': 1, 'e': 1}},
+    }
+
+    @staticmethod
+    def get_reachable(graph: Dict[str, Dict[str, int]], procedure: str) -> Set[str]:
+        reached: Set[str] = set()
+        stack = list(graph.get(procedure, {}))
+        while stack:
+            called: str = stack.pop()
+            if called not in reached:
+                reached.add(called)
+                stack.extend(graph.get(called, {}))
+        return reached
+
+    def test_closure(self) -> None:
+        for name, graph in self.graphs.items():
+            procedures: Set[str] = set(graph).union(*graph.values())
+            table: CallsTable = CallsTable(graph)
+            for procedure in procedures:
+                with self.subTest(graph=name, procedure=procedure):
+                    reachable: Set[str] = self.get_reachable(graph, procedure)
+                    self.assertEqual(set(table.get_called_from_t(procedure)), reachable)
+                    callers: Set[str] = {caller for caller in procedures
+                                         if procedure in self.get_reachable(graph, caller)}
+                    self.assertEqual(set(table.get_calls_t(procedure)), callers)
+                    for called in procedures:
+                        self.assertEqual(table.is_calls_t(procedure, called), called in reachable)
+
+    def test_relation_forms_agree_on_cycles(self) -> None:
+        for name, graph in self.graphs.items():
+            procedures: Set[str] = set(graph).union(*graph.values())
+            relation: CallsTRelation = CallsTRelation(CallsTable(graph), None, None, None)
+            for first in procedures:
+                for second in procedures:
+                    with self.subTest(graph=name, first=first, second=second):
+                        result: bool = relation.value_from_set_and_value_from_set(first, second)
+                        self.assertEqual(result, second in self.get_reachable(graph, first))
+                        self.assertEqual(result, second in relation.value_from_set_and_not_initialized_set(first, ''))
+                        self.assertEqual(result, first in relation.not_initialized_set_and_value_from_set('', second))
+                        self.assertEqual(result, relation.value_from_query_and_value_from_query(first, second))
+
+    def test_unknown_procedure(self) -> None:
+        table: CallsTable = CallsTable(self.graphs['cycle'])
+        self.assertEqual(table.get_called_from_t('missing'), frozenset())
+        self.assertFalse(table.is_calls_t('missing', 'a'))
+        self.assertFalse(table.is_calls_t('a', 'missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import glob
+import os
+import random
+import sqlite3
+import unittest
+from typing import Dict, List, Optional, Set
+
+from aitsi_parser.CsrRelation import CsrRelation
+from aitsi_parser.FollowsTable import FollowsTable
+from aitsi_parser.ParentTable import ParentTable
+from aitsi_parser.SqliteRelation import SqliteRelation
+from aitsi_parser.StackParser import StackParser
+
+
+class FollowsParentTablesTest(unittest.TestCase):
+    # the tables are compared with walks over the parser's own dicts, over both kinds of backing relation
+
+    def setUp(self) -> None:
+        self.connection: sqlite3.Connection = sqlite3.connect(':memory:')
+
+    def tearDown(self) -> None:
+        self.connection.close()
+
+    def get_programs(self) -> List[StackParser]:
+        parsers: List[StackParser] = []
+        for path in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '*', '*SIMPLE*.txt'))):
+            with open(path) as f:
+                parser: StackParser = StackParser(f.read(), path)
+            parser.program()
+            parsers.append(parser)
+        return parsers
+
+    def get_relations(self, name: str, table: Dict) -> List[CsrRelation]:
+        relation: CsrRelation = CsrRelation.from_table(table)
+        SqliteRelation.create(self.connection, name, relation.get_pairs())
+        return [relation, SqliteRelation(self.connection, name)]
+
+    @staticmethod
+    def follow(links: Dict[int, int], line: int) -> List[int]:
+        chain: List[int] = []
+        while line in links:
+            line = links[line]
+            chain.append(line)
+        return chain
+
+    @staticmethod
+    def get_candidates(lines: range) -> List[Optional[Set[int]]]:
+        generator: random.Random = random.Random(0)
+        return [None, set()] + [set(generator.sample(lines, generator.randint(1, len(lines)))) for _ in range(6)]
+
+    def test_follows(self) -> None:
+        for index, parser in enumerate(self.get_programs()):
+            lines: range = range(0, len(parser.statement_table) + 2)
+            children: Dict[int, int] = {int(stmt): int(child) for stmt, row in parser.follows_table.items()
+                                        for child in row}
+            after: Dict[int, List[int]] = {line: self.follow(children, line) for line in lines}
+            for table in map(FollowsTable, self.get_relations(f'follows{index}', parser.follows_table)):
+                for line in lines:
+                    with self.subTest(program=index, relation=type(table.relation).__name__, line=line):
+                        self.assertEqual(table.get_child(line), children.get(line))
+                        self.assertEqual(table.get_all_after(line), after[line])
+                        self.assertEqual(table.get_all_before(line),
+                                         sorted(first for first in lines if line in after[first]))
+                        for other in lines:
+                            self.assertEqual(table.is_follows_t(line, other), other in after[line])
+                for firsts in self.get_candidates(lines):
+                    for seconds in self.get_candidates(lines):
+                        first_lines: Set[int] = set(lines) if firsts is None else firsts
+                        second_lines: Set[int] = set(lines) if seconds is None else seconds
+                        result_first, result_second = table.get_follows_t_pairs(firsts, seconds)
+                        self.assertCountEqual(result_first, [first for first in first_lines
+                                                             if not second_lines.isdisjoint(after[first])])
+                        self.assertCountEqual(result_second, [second for second in second_lines
+                                                              if any(second in after[first] for first in first_lines)])
+
+    def test_parent(self) -> None:
+        for index, parser in enumerate(self.get_programs()):
+            lines: range = range(0, len(parser.statement_table) + 2)
+            parents: Dict[int, int] = {int(child): int(stmt) for stmt, row in parser.parent_table.items()
+                                       for child in row}
+            ancestors: Dict[int, List[int]] = {line: self.follow(parents, line) for line in lines}
+            for table in map(ParentTable, self.get_relations(f'parent{index}', parser.parent_table)):
+                for line in lines:
+                    with self.subTest(program=index, relation=type(table.relation).__name__, line=line):
+                        self.assertEqual(table.get_parent(line), parents.get(line))
+                        self.assertEqual(table.get_child(line), sorted(child for child in parents
+                                                                       if parents[child] == line))
+                        self.assertEqual(table.get_ancestors(line), ancestors[line])
+                        self.assertEqual(list(table.get_descendants(line)),
+                                         [other for other in lines if line in ancestors[other]])
+                        for other in lines:
+                            self.assertEqual(table.is_parent_t(line, other), line in ancestors[other])
+                for firsts in self.get_candidates(lines):
+                    for seconds in self.get_candidates(lines):
+                        first_lines: Set[int] = set(lines) if firsts is None else firsts
+                        second_lines: Set[int] = set(lines) if seconds is None else seconds
+                        result_first, result_second = table.get_parent_t_pairs(firsts, seconds)
+                        self.assertCountEqual(result_first, [first for first in first_lines if any(
+                            first in ancestors[second] for second in second_lines)])
+                        self.assertCountEqual(result_second, [second for second in second_lines
+                                                              if not first_lines.isdisjoint(ancestors[second])])
+
+
+if __name__ == '__main__':
+    unittest.main()
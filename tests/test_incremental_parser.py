@@ -0,0 +1,70 @@
+import glob
+import os
+import unittest
+from typing import Tuple
+
+from aitsi_parser.IncrementalParser import IncrementalParser
+from aitsi_parser.ParserError import ParserError
+from aitsi_parser.StackParser import StackParser
+from utils import dump
+
+
+class IncrementalParserTest(unittest.TestCase):
+    program: str = ("procedure main {\n  x = 1;\n  call helper;\n  while x {\n    y = x + z;\n    call leaf; }\n}\n"
+                    "procedure helper {\n  if y then {\n    z = 2; }\n  else {\n    call leaf; }\n}\n"
+                    "procedure leaf {\n  w = w * 3;\n}\n")
+
+    def build(self, code: str) -> Tuple:
+        parser: StackParser = StackParser(code, 'program')
+        parser.program()
+        return dump(parser)
+
+    def assert_updates(self, *versions: str) -> None:
+        parser: IncrementalParser = IncrementalParser(versions[0], 'program')
+        parser.program()
+        self.assertEqual(dump(parser), self.build(versions[0]))
+        for version in versions[1:]:
+            parser.update(version)
+            self.assertEqual(dump(parser), self.build(version))
+
+    def test_statement_inserted(self) -> None:
+        self.assert_updates(self.program, self.program.replace("x = 1;", "x = 1;\n  v = 5;"))
+
+    def test_statement_removed(self) -> None:
+        self.assert_updates(self.program, self.program.replace("  call helper;\n", ""))
+
+    def test_callee_effects_change(self) -> None:
+        self.assert_updates(self.program, self.program.replace("w = w * 3;", "w = u * 3;\n  q = 1;"),
+                            self.program)
+
+    def test_procedures_added_removed_and_moved(self) -> None:
+        main, helper, leaf = ["procedure " + part for part in self.program.split("procedure ")[1:]]
+        self.assert_updates(self.program, main + helper + leaf + "procedure extra {\n  e = w;\n}\n",
+                            leaf + main + helper, main + leaf)
+
+    def test_error_source_line(self) -> None:
+        parser: IncrementalParser = IncrementalParser("\n" + self.program, 'program')
+        parser.program()
+        broken: str = "\n" + self.program.replace("z = 2;", "z = ;")
+        with self.assertRaises(ParserError) as context:
+            StackParser(broken, 'program').program()
+        with self.assertRaises(ParserError) as incremental_context:
+            parser.update(broken)
+        self.assertIn("(source line 11)", str(context.exception))
+        self.assertEqual(str(incremental_context.exception), str(context.exception))
+
+    def test_unchanged_source(self) -> None:
+        self.assert_updates(self.program, self.program)
+
+    def test_test_programs(self) -> None:
+        directory: str = os.path.dirname(os.path.abspath(__file__))
+        for path in glob.glob(os.path.join(directory, '*', '*SIMPLE*.txt')):
+            with self.subTest(path=os.path.basename(path)):
+                with open(path) as f:
+                    code: str = f.read()
+                first: int = code.index("procedure", 1)
+                self.assert_updates(code, code[first:] + code[:first], code)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import random
+import sqlite3
+import unittest
+from typing import Dict, List, Set
+
+from aitsi_parser.CsrRelation import CsrRelation
+from aitsi_parser.NextTable import NextTable
+from aitsi_parser.SqliteRelation import SqliteRelation
+from aitsi_parser.StackParser import StackParser
+
+
+class NextTableTest(unittest.TestCase):
+    # nested loops, a loop inside both branches of an if, a loop as the last statement and a procedure
+    # without loops, the lines of every procedure are only connected to each other
+    program: str = ("procedure main {\n  x = 1;\n  while x {\n    y = 2;\n    while y {\n      while z {\n"
+                    "        z = z - 1; }\n      y = y - 1; }\n    if a then {\n      while b {\n        b = 0; } }\n"
+                    "    else {\n      c = 1;\n      while c {\n        call other; } } }\n  d = x;\n}\n"
+                    "procedure other {\n  e = 1;\n  if e then {\n    f = 2; }\n  else {\n    g = 3; }\n}\n"
+                    "procedure last {\n  while h {\n    h = h - 1;\n    while i {\n      i = 0; } }\n}\n")
+
+    def setUp(self) -> None:
+        parser: StackParser = StackParser(self.program, 'program')
+        parser.program()
+        self.lines: range = range(0, len(parser.statement_table) + 3)
+        self.relation: CsrRelation = CsrRelation.from_table(parser.next_table)
+        self.successors: Dict[int, List[int]] = {}
+        for stmt, previous in self.relation.get_pairs():
+            self.successors.setdefault(previous, []).append(stmt)
+        self.reachable: Dict[int, Set[int]] = {line: self.walk(line) for line in self.lines}
+        self.connection: sqlite3.Connection = sqlite3.connect(':memory:')
+        SqliteRelation.create(self.connection, 'next', self.relation.get_pairs())
+
+    def tearDown(self) -> None:
+        self.connection.close()
+
+    def walk(self, line: int) -> Set[int]:
+        reached: Set[int] = set()
+        stack: List[int] = list(self.successors.get(line, []))
+        while stack:
+            current: int = stack.pop()
+            if current not in reached:
+                reached.add(current)
+                stack.extend(self.successors.get(current, []))
+        return reached
+
+    def get_tables(self) -> List[NextTable]:
+        return [NextTable(self.relation), NextTable(SqliteRelation(self.connection, 'next'))]
+
+    def test_next_t(self) -> None:
+        for table in self.get_tables():
+            for line in self.lines:
+                with self.subTest(relation=type(table.relation).__name__, line=line):
+                    self.assertEqual(set(table.get_next_t(line)), self.reachable[line])
+                    self.assertEqual(set(table.get_previous_t(line)),
+                                     {previous for previous in self.lines if line in self.reachable[previous]})
+                    for other in self.lines:
+                        self.assertEqual(table.is_next_t(line, other), other in self.reachable[line])
+
+    def test_loops_reach_themselves(self) -> None:
+        table: NextTable = self.get_tables()[0]
+        for line in self.lines:
+            with self.subTest(line=line):
+                self.assertEqual(table.is_next_t(line, line), line in self.reachable[line])
+        self.assertTrue(any(line in self.reachable[line] for line in self.lines))
+        self.assertTrue(any(self.reachable[line] and line not in self.reachable[line] for line in self.lines))
+
+    def test_probes_in_any_order(self) -> None:
+        # every procedure is closed on its first probe, from whichever of its lines and direction it comes
+        for start in self.lines:
+            table: NextTable = NextTable(self.relation)
+            with self.subTest(start=start):
+                self.assertEqual(set(table.get_previous_t(start)),
+                                 {previous for previous in self.lines if start in self.reachable[previous]})
+                for line in self.lines:
+                    self.assertEqual(set(table.get_next_t(line)), self.reachable[line])
+
+    def test_next_t_pairs(self) -> None:
+        generator: random.Random = random.Random(0)
+        candidates: List[Set[int]] = [set(), set(self.lines)] + [
+            set(generator.sample(self.lines, generator.randint(1, len(self.lines)))) for _ in range(30)]
+        for table in self.get_tables():
+            for firsts in candidates:
+                for seconds in candidates[:8]:
+                    with self.subTest(relation=type(table.relation).__name__, firsts=firsts, seconds=seconds):
+                        result_first, result_second = table.get_next_t_pairs(firsts, seconds)
+                        self.assertCountEqual(result_first, {first for first in firsts
+                                                             if not self.reachable[first].isdisjoint(seconds)})
+                        self.assertCountEqual(result_second, {second for second in seconds
+                                                              if any(second in self.reachable[first]
+                                                                     for first in firsts)})
+            with self.subTest(relation=type(table.relation).__name__, firsts=None, seconds=None):
+                result_first, result_second = table.get_next_t_pairs(None, None)
+                self.assertCountEqual(result_first, [line for line in self.lines if self.reachable[line]])
+                self.assertCountEqual(result_second, set().union(*self.reachable.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
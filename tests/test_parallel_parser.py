@@ -0,0 +1,65 @@
+import glob
+import io
+import os
+import tempfile
+import unittest
+from typing import Tuple
+from unittest import mock
+
+import main_parser
+from aitsi_parser.ParallelParser import ParallelParser
+from aitsi_parser.ParserError import ParserError
+from aitsi_parser.StackParser import StackParser
+from utils import dump
+
+
+class ParallelParserTest(unittest.TestCase):
+
+    def assert_same_as_stack_parser(self, min_parallel_size: int) -> None:
+        directory: str = os.path.dirname(os.path.abspath(__file__))
+        for path in glob.glob(os.path.join(directory, '*', '*SIMPLE*.txt')):
+            reference: StackParser = main_parser.read_program_from_file(path, 'stack')
+            reference.program()
+            expected: Tuple = dump(reference)
+            with open(path, 'rb') as f:
+                code: bytes = f.read()
+            # a mapped file is read by the workers themselves, text and bytes are sliced, a stream is not split
+            parsers = [main_parser.read_program_from_file(path, 'parallel'), ParallelParser(code.decode(), path),
+                       ParallelParser(code, path), ParallelParser(io.BytesIO(code), path)]
+            for parser in parsers:
+                with self.subTest(path=os.path.basename(path), code=type(parser.code).__name__):
+                    parser.workers = 2
+                    with mock.patch.object(ParallelParser, 'min_parallel_size', min_parallel_size):
+                        parser.program()
+                    self.assertEqual(dump(parser), expected)
+
+    def test_worker_pool(self) -> None:
+        self.assert_same_as_stack_parser(0)
+
+    def test_small_programs_fall_back(self) -> None:
+        self.assert_same_as_stack_parser(ParallelParser.min_parallel_size)
+
+    def test_error_source_line(self) -> None:
+        code: str = ("\n\nprocedure main {\n  x = 1;\n  call helper;\n}\n\n"
+                     "procedure helper {\n  y = 2;\n  z = y +;\n}\n")
+        with self.assertRaises(ParserError) as context:
+            StackParser(code, 'program').program()
+        expected: str = str(context.exception)
+        self.assertTrue(expected.startswith("Line 4 (source line 10)"), expected)
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, 'program.txt')
+            with open(path, 'w') as f:
+                f.write(code)
+            parsers = [main_parser.read_program_from_file(path, 'parallel'), ParallelParser(code, path),
+                       ParallelParser(code.encode(), path)]
+            for parser in parsers:
+                with self.subTest(code=type(parser.code).__name__):
+                    parser.workers = 2
+                    with mock.patch.object(ParallelParser, 'min_parallel_size', 0):
+                        with self.assertRaises(ParserError) as context:
+                            parser.program()
+                    self.assertEqual(str(context.exception), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import glob
+import json
+import os
+import tempfile
+import unittest
+from typing import Dict, List, Union
+
+import numpy as np
+
+from aitsi_parser.CsrRelation import CsrRelation
+from aitsi_parser.PkbFile import PkbFile
+from aitsi_parser.StackParser import StackParser
+from pql.utils.AstCodec import AstCodec
+
+
+class PkbFileTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.path: str = os.path.join(self.directory.name, PkbFile.filename)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    @staticmethod
+    def get_programs() -> List[str]:
+        return sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '*', '*SIMPLE*.txt')))
+
+    @staticmethod
+    def parse(path: str) -> StackParser:
+        with open(path) as f:
+            parser: StackParser = StackParser(f.read(), path)
+        parser.program()
+        return parser
+
+    def test_sections_round_trip(self) -> None:
+        sections: Dict[str, Union[List[str], np.ndarray]] = {
+            'names': ['a', 'zażółć', ''], 'empty.names': [], 'ints': np.array([0, -1, 2 ** 31 - 1], dtype='<i4'),
+            'empty.ints': np.array([], dtype='<i4'), 'odd': np.array([7, 8, 9], dtype='<i4')}
+        PkbFile.write(self.path, sections)
+        for memory_map in (True, False):
+            loaded = PkbFile.read(self.path, memory_map)
+            self.assertEqual(set(loaded), set(sections))
+            self.assertEqual(loaded['names'], ['a', 'zażółć', ''])
+            self.assertEqual(loaded['empty.names'], [])
+            for name in ('ints', 'empty.ints', 'odd'):
+                self.assertEqual(loaded[name].tolist(), sections[name].tolist())
+
+    def test_long_section_name(self) -> None:
+        with self.assertRaises(ValueError):
+            PkbFile.write(self.path, {'x' * 33: []})
+
+    def test_not_a_pkb(self) -> None:
+        with open(self.path, 'wb') as f:
+            f.write(b'NOTAPKB!' + bytes(64))
+        with self.assertRaises(ValueError):
+            PkbFile.read(self.path)
+
+    def test_program_round_trip(self) -> None:
+        for program in self.get_programs():
+            with self.subTest(program=os.path.basename(program)):
+                parser: StackParser = self.parse(program)
+                PkbFile.save_pkb(self.path, parser.root, parser.get_tables())
+                root, tables = PkbFile.load_pkb(self.path)
+                self.assertEqual(AstCodec.encode(root), AstCodec.encode(parser.root))
+                # tables come back in the shape of their JSON files
+                expected: Dict = json.loads(json.dumps(parser.get_tables()))
+                for name in PkbFile.table_names:
+                    if name == 'var':
+                        self.assertCountEqual(tables[name], expected[name])
+                    else:
+                        self.assertEqual(tables[name], expected[name], name)
+
+    def test_relations_from_sections(self) -> None:
+        parser: StackParser = self.parse(self.get_programs()[0])
+        PkbFile.save_pkb(self.path, parser.root, parser.get_tables())
+        sections = PkbFile.read(self.path)
+        for name in PkbFile.statement_relations:
+            relation: CsrRelation = PkbFile.load_table(sections, name)
+            table: Dict = getattr(parser, name + '_table')
+            self.assertCountEqual(relation.get_pairs(), [(int(key), int(target)) for key in table
+                                                         for target in table[key]])
+        calls: CsrRelation = PkbFile.load_table(sections, 'calls')
+        self.assertCountEqual(
+            [(calls.get_name(source), calls.get_name(target)) for source, target in calls.get_pairs()],
+            [(key, target) for key in parser.calls_table for target in parser.calls_table[key]])
+
+
+if __name__ == '__main__':
+    unittest.main()
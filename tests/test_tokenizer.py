@@ -0,0 +1,67 @@
+import io
+import unittest
+from typing import List, Tuple
+
+from aitsi_parser.Tokenizer import Tokenizer
+
+
+class TokenizerTest(unittest.TestCase):
+
+    program: str = ("procedure first {\n  x = 1;\n  while x {\n    callee = x + 23 * (y - 4);\n"
+                    "    if callee then { call second; } else { z = x; } }\n}\n"
+                    "procedure second {\n\tproceduresx=whilex+if1;\n}\n")
+
+    def tokenize(self, code, chunk_size: int = Tokenizer.chunk_size) -> List[Tuple[str, str]]:
+        tokenizer: Tokenizer = Tokenizer(code)
+        tokenizer.chunk_size = chunk_size
+        return list(tokenizer)
+
+    def test_names_containing_keywords_stay_names(self) -> None:
+        self.assertEqual(self.tokenize("procedure callsX { whilex = if1 + procedure2; call callee; }"),
+                         [('PROCEDURE', 'procedure'), ('NAME', 'callsX'), ('OPEN_BRACKET', '{'),
+                          ('NAME', 'whilex'), ('ASSIGN', '='), ('NAME', 'if1'), ('PLUS', '+'),
+                          ('NAME', 'procedure2'), ('SEMICOLON', ';'), ('CALL', 'call'), ('NAME', 'callee'),
+                          ('SEMICOLON', ';'), ('CLOSE_BRACKET', '}')])
+
+    def test_keywords_are_matched_by_whole_text(self) -> None:
+        self.assertEqual(self.tokenize("while then thenx else1 if"),
+                         [('WHILE', 'while'), ('THEN', 'then'), ('NAME', 'thenx'), ('NAME', 'else1'), ('IF', 'if')])
+
+    def test_keywords_are_case_sensitive(self) -> None:
+        self.assertEqual(self.tokenize("While IF"), [('NAME', 'While'), ('NAME', 'IF')])
+
+    def test_symbols_without_spaces(self) -> None:
+        self.assertEqual(self.tokenize("x=(a+12)*b-c;"),
+                         [('NAME', 'x'), ('ASSIGN', '='), ('OPEN_PARENTHESIS', '('), ('NAME', 'a'), ('PLUS', '+'),
+                          ('INTEGER', '12'), ('CLOSE_PARENTHESIS', ')'), ('MULTIPLY', '*'), ('NAME', 'b'),
+                          ('MINUS', '-'), ('NAME', 'c'), ('SEMICOLON', ';')])
+
+    def test_unknown_characters(self) -> None:
+        self.assertEqual(self.tokenize("x = a % b;")[3], ('UNKNOWN', '%'))
+
+    def test_empty_source(self) -> None:
+        self.assertEqual(self.tokenize(""), [])
+        self.assertEqual(self.tokenize(b" \n\t "), [])
+
+    def test_tokens_split_across_chunks(self) -> None:
+        expected: List[Tuple[str, str]] = self.tokenize(self.program)
+        for chunk_size in range(1, 24):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.tokenize(self.program, chunk_size), expected)
+                self.assertEqual(self.tokenize(self.program.encode(), chunk_size), expected)
+                self.assertEqual(self.tokenize(io.StringIO(self.program), chunk_size), expected)
+                self.assertEqual(self.tokenize(io.BytesIO(self.program.encode()), chunk_size), expected)
+
+    def test_source_lines_across_chunks(self) -> None:
+        expected: List[int] = [number for number, line in enumerate(self.program.split('\n'), 1)
+                               for _ in Tokenizer(line)]
+        for chunk_size in (1, 5, 16, Tokenizer.chunk_size):
+            for code in (self.program, io.BytesIO(self.program.encode())):
+                with self.subTest(chunk_size=chunk_size, code=type(code).__name__):
+                    tokenizer: Tokenizer = Tokenizer(code)
+                    tokenizer.chunk_size = chunk_size
+                    self.assertEqual([tokenizer.get_line() for _ in tokenizer], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
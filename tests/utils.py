@@ -0,0 +1,10 @@
+from typing import Tuple
+
+from aitsi_parser.Parser import Parser
+
+
+def dump(parser: Parser) -> Tuple:
+    # everything a parse produces, in a form assertEqual can compare
+    return (parser.get_node_json(), parser.statement_table, parser.proc_table, sorted(parser.var_table),
+            parser.const_table, parser.calls_table, parser.follows_table, parser.parent_table, parser.next_table,
+            parser.mod_table, parser.uses_table)